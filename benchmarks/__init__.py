@@ -0,0 +1,6 @@
+"""
+benchmarks/ - 성능 측정 도구
+
+실행 예시:
+    PYTHONPATH=src python -m benchmarks.registration_rush --students 500 --duration 20
+"""
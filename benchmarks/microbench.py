@@ -0,0 +1,288 @@
+"""
+benchmarks/microbench.py - EnrollmentService 핫패스 마이크로벤치마크
+
+데이터 규모(강좌 수)와 학생 신청 학점(0~18)을 바꿔가며 아래 함수를
+단독으로 호출하고, 호출당 시간(중앙값/최솟값)과 SQL 실행 수를 기록합니다.
+  - enroll_course
+  - cancel_enrollment
+  - _get_current_credits
+  - _has_time_conflict
+  - _get_conflicting_courses
+
+저장된 기준값(baseline)보다 설정한 비율 이상 느려지거나(노이즈가 적은
+최솟값 기준) SQL 수가 늘면 종료 코드 1로 실패합니다.
+(시간 기준값은 측정한 머신에 종속됩니다.)
+
+실행:
+    PYTHONPATH=src python -m benchmarks.microbench
+    PYTHONPATH=src python -m benchmarks.microbench --sizes 500,5000,50000 --threshold 0.3
+    PYTHONPATH=src python -m benchmarks.microbench --update-baseline
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import time as dtime
+from pathlib import Path
+
+from sqlalchemy import create_engine, event, insert, update
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Department, Professor, Course, Student, Schedule, Enrollment, DayOfWeek
+from app.services.enrollment_service import EnrollmentService
+from app.utils.exceptions import BusinessException
+
+DEFAULT_SIZES = (500, 5000, 50000)
+DEFAULT_LOADS = (0, 6, 12, 18)
+COURSE_CREDITS = 3
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "microbench.json"
+
+FUNCTIONS = (
+    "enroll_course",
+    "cancel_enrollment",
+    "_get_current_credits",
+    "_has_time_conflict",
+    "_get_conflicting_courses",
+)
+
+
+class StatementCounter:
+    """엔진 단위 SQL 실행 횟수 카운터"""
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+class BenchDatabase:
+    """강좌 수 `size`로 시드된 임시 SQLite DB"""
+
+    def __init__(self, size: int, seed: int = 7):
+        self.size = size
+        self.rng = random.Random(seed)
+        path = Path(tempfile.mkdtemp(prefix=f"microbench-{size}-")) / "bench.db"
+        self.engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=self.engine)
+        self.Session = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.counter = StatementCounter(self.engine)
+        self.slots: dict[int, tuple] = {}
+        self._seed()
+
+    def _seed(self):
+        days = list(DayOfWeek)
+        with self.Session() as db:
+            dept = Department(name="벤치학과")
+            db.add(dept)
+            db.flush()
+            prof = Professor(name="벤치교수", email="bench@university.edu", department_id=dept.id)
+            db.add(prof)
+            db.flush()
+
+            db.execute(insert(Course), [
+                {
+                    "id": i,
+                    "name": f"벤치강좌 {i}",
+                    "code": f"BEN{i:06d}",
+                    "credits": COURSE_CREDITS,
+                    "capacity": 1_000_000,
+                    "enrolled": 0,
+                    "professor_id": prof.id,
+                    "department_id": dept.id,
+                }
+                for i in range(1, self.size + 1)
+            ])
+
+            schedules = []
+            for i in range(1, self.size + 1):
+                day = self.rng.choice(days)
+                hour = self.rng.randrange(8, 17)
+                self.slots[i] = (day, hour)
+                schedules.append({
+                    "course_id": i,
+                    "day_of_week": day,
+                    "start_time": dtime(hour, 0),
+                    "end_time": dtime(hour + 1, 30),
+                })
+            db.execute(insert(Schedule), schedules)
+            db.commit()
+
+    def _conflicts(self, a: int, b: int) -> bool:
+        day_a, hour_a = self.slots[a]
+        day_b, hour_b = self.slots[b]
+        return day_a == day_b and abs(hour_a - hour_b) < 2
+
+    def make_student(self, load: int) -> dict:
+        """`load` 학점을 신청한 학생과 측정 대상 강좌 준비"""
+        courses = list(self.slots)
+        self.rng.shuffle(courses)
+
+        enrolled: list[int] = []
+        for course_id in courses:
+            if len(enrolled) * COURSE_CREDITS >= load:
+                break
+            if not any(self._conflicts(course_id, other) for other in enrolled):
+                enrolled.append(course_id)
+
+        free = next(
+            c for c in courses
+            if c not in enrolled and not any(self._conflicts(c, other) for other in enrolled)
+        )
+        conflicting = next(
+            (c for c in courses if c not in enrolled and any(self._conflicts(c, other) for other in enrolled)),
+            free,
+        )
+
+        with self.Session() as db:
+            student = Student(
+                name=f"학생{load}",
+                student_id=f"BENCH{self.size}-{load}",
+                email=f"bench{self.size}-{load}@university.edu",
+                department_id=1,
+            )
+            db.add(student)
+            db.flush()
+            enrollments = [Enrollment(student_id=student.id, course_id=c, status="ENROLLED") for c in enrolled]
+            db.add_all(enrollments)
+            # 좌석 카운터도 신청 내역과 맞춤 (취소 경로가 실제와 같은 SQL을 실행하도록)
+            if enrolled:
+                db.execute(update(Course).where(Course.id.in_(enrolled)).values(enrolled=Course.enrolled + 1))
+            db.flush()
+            info = {
+                "student_id": student.id,
+                "enrollment_id": enrollments[0].id if enrollments else None,
+                "free_course": free,
+                "conflicting_course": conflicting,
+            }
+            db.commit()
+        return info
+
+
+def _measure(bench: BenchDatabase, call, iterations: int) -> dict:
+    """호출당 시간/SQL 수 측정 (매 호출 후 rollback으로 상태 유지)"""
+    samples = []
+    statements = 0
+    outcome = "ok"
+    db = bench.Session()
+    try:
+        for i in range(iterations + 1):
+            db.expunge_all()
+            before = bench.counter.count
+            start = time.perf_counter()
+            try:
+                call(db)
+            except BusinessException as exc:
+                outcome = type(exc).__name__
+            elapsed = time.perf_counter() - start
+            db.rollback()
+            if i == 0:  # 워밍업
+                continue
+            samples.append(elapsed)
+            statements = bench.counter.count - before
+    finally:
+        db.close()
+    return {
+        "median_us": round(statistics.median(samples) * 1e6, 2),
+        "min_us": round(min(samples) * 1e6, 2),
+        "statements": statements,
+        "outcome": outcome,
+    }
+
+
+def run_suite(sizes=DEFAULT_SIZES, loads=DEFAULT_LOADS, iterations: int = 30) -> dict:
+    """크기×학점 조합별 측정 결과 {key: measurement}"""
+    results = {}
+    for size in sizes:
+        bench = BenchDatabase(size)
+        for load in loads:
+            info = bench.make_student(load)
+            sid = info["student_id"]
+            calls = {
+                "enroll_course": lambda db: EnrollmentService.enroll_course(db, sid, info["free_course"]),
+                "_get_current_credits": lambda db: EnrollmentService._get_current_credits(db, sid),
+                "_has_time_conflict": lambda db: EnrollmentService._has_time_conflict(db, sid, info["free_course"]),
+                "_get_conflicting_courses": (
+                    lambda db: EnrollmentService._get_conflicting_courses(db, sid, info["conflicting_course"])
+                ),
+            }
+            if info["enrollment_id"] is not None:
+                calls["cancel_enrollment"] = (
+                    lambda db: EnrollmentService.cancel_enrollment(db, sid, info["enrollment_id"])
+                )
+            for name in FUNCTIONS:
+                if name in calls:
+                    results[f"{name}[courses={size},load={load}]"] = _measure(bench, calls[name], iterations)
+        bench.engine.dispose()
+    return results
+
+
+def check_regressions(results: dict, baseline: dict, threshold: float, min_delta_us: float = 0.0) -> list[str]:
+    """기준값 대비 회귀 목록 (시간: threshold 비율 및 min_delta_us 초과, SQL 수: 증가)"""
+    failures = []
+    for key, current in results.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        limit = base["min_us"] * (1 + threshold)
+        if current["min_us"] > limit and current["min_us"] - base["min_us"] > min_delta_us:
+            failures.append(
+                f"{key}: {current['min_us']}us > {base['min_us']}us × {1 + threshold:.2f}"
+            )
+        if current["statements"] > base["statements"]:
+            failures.append(f"{key}: SQL {base['statements']} → {current['statements']}")
+    return failures
+
+
+def _parse_ints(value: str) -> tuple:
+    return tuple(int(v) for v in value.split(",") if v)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="EnrollmentService 마이크로벤치마크")
+    parser.add_argument("--sizes", type=_parse_ints, default=DEFAULT_SIZES, help="강좌 수 목록 (쉼표 구분)")
+    parser.add_argument("--loads", type=_parse_ints, default=DEFAULT_LOADS, help="학생 신청 학점 목록")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--threshold", type=float, default=0.5, help="허용 회귀 비율 (0.5 = 50%%)")
+    parser.add_argument("--min-delta-us", type=float, default=500.0, help="이보다 작은 시간 차이는 노이즈로 무시")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--output", type=Path, help="측정 결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.loads, args.iterations)
+    for key, value in results.items():
+        print(f"{key:60s} {value['median_us']:>10.2f}us (min {value['min_us']:>9.2f}us)  sql={value['statements']:<3d} {value['outcome']}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"💾 기준값 갱신: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"⚠️ 기준값 없음: {args.baseline} (--update-baseline 으로 생성)")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    failures = check_regressions(results, baseline, args.threshold, args.min_delta_us)
+    if failures:
+        print("❌ 성능 회귀 감지")
+        for line in failures:
+            print(f"  {line}")
+        return 1
+    print("✅ 기준값 대비 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
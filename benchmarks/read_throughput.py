@@ -0,0 +1,176 @@
+"""
+benchmarks/read_throughput.py - 동시 수강신청 중 조회 처리량 (커넥션 풀 비교)
+
+쓰기 작업자(수강신청/취소 반복)와 읽기 작업자(강좌 상세/시간표 조회 반복)를
+동시에 돌리면서 읽기 처리량과 지연 시간을 측정합니다. 풀 설정마다 새 프로세스
+(새 임시 DB)에서 실행하므로 엔진 설정이 서로 섞이지 않습니다.
+풀 크기 `1`(커넥션 1개, 오버플로 없음)은 모든 요청이 커넥션 하나를 차례로 쓰는
+기존 StaticPool 구성의 직렬화를 재현합니다.
+
+실행:
+    PYTHONPATH=src python -m benchmarks.read_throughput \\
+        --pools 1,5,10,10+30 --readers 32 --writers 8 --duration 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from benchmarks.registration_rush import RouteStats, _fetch_ids
+
+READ = "read"
+WRITE = "write"
+
+
+def parse_pool(spec: str) -> dict:
+    """`10+30` → DB_POOL_SIZE=10, DB_POOL_MAX_OVERFLOW=30 (오버플로 생략 시 0)"""
+    size, _, overflow = spec.partition("+")
+    return {"DB_POOL_SIZE": size, "DB_POOL_MAX_OVERFLOW": overflow or "0"}
+
+
+async def _reader(client, course_ids, student_ids, stats, deadline, rng):
+    while time.perf_counter() < deadline:
+        if rng.random() < 0.5:
+            url = f"/api/v1/courses/{rng.choice(course_ids)}"
+        else:
+            url = f"/api/v1/students/{rng.choice(student_ids)}/schedule"
+        start = time.perf_counter()
+        response = await client.get(url)
+        stats.record(time.perf_counter() - start, response.status_code)
+
+
+async def _writer(client, course_ids, student_ids, stats, deadline, rng):
+    while time.perf_counter() < deadline:
+        student_id = rng.choice(student_ids)
+        start = time.perf_counter()
+        response = await client.post(
+            f"/api/v1/students/{student_id}/enrollments",
+            json={"course_id": rng.choice(course_ids)},
+        )
+        stats.record(time.perf_counter() - start, response.status_code)
+        if response.status_code == 201:
+            start = time.perf_counter()
+            response = await client.delete(f"/api/v1/students/{student_id}/enrollments/{response.json()['id']}")
+            stats.record(time.perf_counter() - start, response.status_code)
+
+
+async def run_mixed(client: httpx.AsyncClient, readers: int, writers: int, duration: float, seed: int = 7) -> dict:
+    """읽기/쓰기 작업자를 동시에 실행하고 결과 요약"""
+    student_ids = await _fetch_ids(client, "/api/v1/students", 500)
+    course_ids = await _fetch_ids(client, "/api/v1/courses", 100)
+    rng = random.Random(seed)
+    stats = {READ: RouteStats(), WRITE: RouteStats()}
+
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(
+        *(_reader(client, course_ids, student_ids, stats[READ], deadline, random.Random(rng.random())) for _ in range(readers)),
+        *(_writer(client, course_ids, student_ids, stats[WRITE], deadline, random.Random(rng.random())) for _ in range(writers)),
+    )
+    elapsed = time.perf_counter() - started
+    pools = (await client.get("/health/pool")).json()["pools"]
+
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "read_rps": round(len(stats[READ].latencies) / elapsed, 2),
+        "write_rps": round(len(stats[WRITE].latencies) / elapsed, 2),
+        "read": stats[READ].summary(),
+        "write": stats[WRITE].summary(),
+        "pool": pools.get("primary", {}),
+    }
+
+
+async def _run_in_process(args) -> dict:
+    from app.config import settings
+    from app.main import app
+
+    settings.init_students = args.students
+    settings.init_courses = args.courses
+    settings.init_professors = min(settings.init_professors, max(args.courses // 5, 1))
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120.0) as client:
+            return await run_mixed(client, args.readers, args.writers, args.duration)
+
+
+def _run_pool(spec: str, args) -> dict:
+    """풀 설정 하나를 별도 프로세스에서 실행"""
+    db_path = Path(tempfile.mkdtemp(prefix="read-bench-")) / "bench.db"
+    env = {
+        **os.environ,
+        **parse_pool(spec),
+        "DATABASE_URL": f"sqlite:///{db_path}",
+        "LOG_LEVEL": "WARNING",
+    }
+    command = [
+        sys.executable, "-m", "benchmarks.read_throughput", "--single",
+        "--students", str(args.students), "--courses", str(args.courses),
+        "--readers", str(args.readers), "--writers", str(args.writers),
+        "--duration", str(args.duration),
+    ]
+    completed = subprocess.run(command, env=env, capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def format_report(results: dict) -> str:
+    lines = [f"{'pool':<12}{'read rps':>10}{'read p50':>10}{'read p95':>10}{'write rps':>11}{'5xx':>6}{'wait max':>10}"]
+    for spec, result in results.items():
+        errors = sum(
+            n for part in ("read", "write")
+            for code, n in result[part]["statuses"].items() if code.startswith("5") or code == "0"
+        )
+        lines.append(
+            f"{spec:<12}{result['read_rps']:>10}{result['read']['p50_ms']:>9}ms{result['read']['p95_ms']:>8}ms"
+            f"{result['write_rps']:>11}{errors:>6}{result['pool'].get('wait_max_s', 0) * 1000:>8.1f}ms"
+        )
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="동시 수강신청 중 조회 처리량 벤치마크")
+    parser.add_argument("--pools", default="1,5,10,10+30", help="비교할 풀 크기[+오버플로] (쉼표 구분)")
+    parser.add_argument("--students", type=int, default=500)
+    parser.add_argument("--courses", type=int, default=100)
+    parser.add_argument("--readers", type=int, default=32)
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv=None) -> dict:
+    args = build_parser().parse_args(argv)
+
+    if args.single:
+        # 하위 프로세스: 환경 변수로 지정된 풀 설정 하나만 실행
+        result = asyncio.run(_run_in_process(args))
+        print(json.dumps(result))
+        return result
+
+    results = {}
+    for spec in args.pools.split(","):
+        print(f"▶️  {spec} ...", flush=True)
+        results[spec] = _run_pool(spec.strip(), args)
+
+    print(format_report(results))
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"💾 결과 저장: {output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+benchmarks/reconciliation.py - 정합성 점검이 신청 지연시간(p99)에 주는 영향
+
+같은 러시 시나리오를 점검 끔(off) / 점검 연속 실행(on)으로 각각 새 프로세스에서
+실행합니다. on 모드는 `RECONCILE_INTERVAL_S`를 아주 짧게 두어 러시 내내 전체 패스를
+반복하고, 끝난 뒤 점검한 강좌 수/완료된 패스 결과를 함께 저장합니다.
+
+실행 (강좌 5만 개):
+    PYTHONPATH=src python -m benchmarks.reconciliation --courses 50000 --hot-courses 20 \\
+        --duration 20 --output bench_results/reconciliation.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.registration_rush import ROUTE_ENROLL
+
+MODES = ("off", "on")
+
+
+def _run_child(rush_args: list[str], output: str):
+    """러시 실행 후 점검 통계를 덧붙여 저장 (하위 프로세스)"""
+    from benchmarks import registration_rush
+
+    result = registration_rush.main(rush_args)
+
+    from app.services.reconciliation_service import RECONCILE_SCANNED, reconciler
+
+    result["reconcile"] = {
+        "courses_scanned": int(RECONCILE_SCANNED.value()),
+        "last_pass": reconciler.last_pass,
+    }
+    Path(output).write_text(json.dumps(result, ensure_ascii=False, default=str), encoding="utf-8")
+
+
+def _run_mode(mode: str, args, rush_args: list[str]) -> dict:
+    workdir = Path(tempfile.mkdtemp(prefix=f"reconcile-{mode}-"))
+    output = workdir / "rush.json"
+    env = {
+        **os.environ,
+        "RECONCILE_INTERVAL_S": "0.05" if mode == "on" else "0",
+        "RECONCILE_BATCH_SIZE": str(args.batch_size),
+        "RECONCILE_BATCH_PAUSE_MS": str(args.pause_ms),
+        "RECONCILE_MAX_DUTY": str(args.max_duty),
+        "DATABASE_URL": f"sqlite:///{workdir / 'rush.db'}",
+        "LOG_LEVEL": "WARNING",
+    }
+    command = [sys.executable, "-m", "benchmarks.reconciliation", "--child", str(output), *rush_args]
+    subprocess.run(command, env=env, capture_output=True, text=True, check=True)
+    return json.loads(output.read_text(encoding="utf-8"))
+
+
+def format_report(results: dict) -> str:
+    lines = [f"{'mode':<6}{'rps':>9}{'enroll p50':>12}{'enroll p95':>12}{'enroll p99':>12}{'scanned':>10}"]
+    for mode, result in results.items():
+        enroll = result["routes"].get(ROUTE_ENROLL, {})
+        lines.append(
+            f"{mode:<6}{result['throughput_rps']:>9}"
+            f"{enroll.get('p50_ms', 0):>10}ms{enroll.get('p95_ms', 0):>10}ms{enroll.get('p99_ms', 0):>10}ms"
+            f"{result['reconcile']['courses_scanned']:>10}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description="정합성 점검 on/off 신청 지연시간 비교")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--pause-ms", type=float, default=50.0)
+    parser.add_argument("--max-duty", type=float, default=0.05)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args, rush_args = parser.parse_known_args(argv)
+
+    if args.child:
+        _run_child(rush_args, args.child)
+        return {}
+
+    results = {}
+    for mode in args.modes.split(","):
+        print(f"▶️  {mode} ...", flush=True)
+        results[mode] = _run_mode(mode.strip(), args, rush_args)
+
+    print(format_report(results))
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"💾 결과 저장: {output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+"""
+benchmarks/registration_rush.py - 수강신청 오픈 러시 부하 생성기
+
+수강신청 오픈 직후 상황(소수 인기 강좌에 신청 집중 + 취소/시간표 조회 혼합)을
+실제 앱에 재현하고 결과를 JSON으로 저장합니다.
+
+실행 (in-process, ASGI 앱 직접 호출):
+    PYTHONPATH=src python -m benchmarks.registration_rush \\
+        --students 500 --courses 100 --hot-courses 5 --duration 20 \\
+        --output bench_results/rush.json
+
+실행 (로컬 uvicorn 대상):
+    PYTHONPATH=src python -m benchmarks.registration_rush --base-url http://127.0.0.1:8000
+
+신청/취소 입장 제어(학생별 토큰 버킷, 과부하 429)도 함께 측정됩니다.
+끄고 비교하려면 RATE_LIMIT_STUDENT_PER_S=0 ENROLL_MAX_IN_FLIGHT=0 으로 실행하세요.
+(in-process 실행은 가상 학생이 모두 같은 주소로 접속하므로 IP별 제한은 항상 끔)
+
+이전 결과와 비교:
+    PYTHONPATH=src python -m benchmarks.registration_rush --compare bench_results/rush.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import tempfile
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+# 라우트 템플릿 (리포트 키)
+ROUTE_ENROLL = "POST /api/v1/students/{student_id}/enrollments"
+ROUTE_CANCEL = "DELETE /api/v1/students/{student_id}/enrollments/{enrollment_id}"
+ROUTE_SCHEDULE = "GET /api/v1/students/{student_id}/schedule"
+
+# 에러 코드 → 예외 타입
+ERROR_CODE_TYPES = {
+    "CAPACITY_EXCEEDED": "CapacityExceededException",
+    "CREDIT_EXCEEDED": "CreditExceededException",
+    "TIME_CONFLICT": "TimeConflictException",
+    "ALREADY_ENROLLED": "AlreadyEnrolledException",
+    "STUDENT_NOT_FOUND": "StudentNotFoundException",
+    "COURSE_NOT_FOUND": "CourseNotFoundException",
+    "ENROLLMENT_NOT_FOUND": "EnrollmentNotFoundException",
+    "DATABASE_ERROR": "DatabaseError",
+    "DEADLOCK": "DeadlockException",
+    "RATE_LIMITED": "RateLimitedException",
+    "SERVER_OVERLOADED": "ServerOverloadedException",
+    "INTERNAL_SERVER_ERROR": "InternalServerError",
+}
+
+BUSY_MARKERS = ("database is locked", "database is busy", "sqlite_busy")
+
+
+@dataclass
+class Scenario:
+    """부하 시나리오 설정"""
+    students: int = 200
+    courses: int = 100
+    hot_courses: int = 5
+    hot_ratio: float = 0.8  # 신청 요청 중 인기 강좌 비율
+    enroll_weight: float = 0.6
+    cancel_weight: float = 0.15
+    schedule_weight: float = 0.25
+    think_time_ms: float = 50.0  # 평균 think time (지수 분포)
+    duration: float = 10.0  # 초
+    max_requests: Optional[int] = None
+    concurrency: int = 64  # 동시에 진행 중인 요청 상한
+    seed: int = 42
+
+
+@dataclass
+class RouteStats:
+    """라우트별 지연 시간 수집"""
+    latencies: list = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+
+    def record(self, elapsed: float, status_code: int):
+        self.latencies.append(elapsed)
+        self.statuses[status_code] += 1
+
+    def summary(self) -> dict:
+        ordered = sorted(self.latencies)
+        count = len(ordered)
+        return {
+            "count": count,
+            "mean_ms": round(sum(ordered) / count * 1000, 3) if count else 0.0,
+            "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+            "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+            "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+            "max_ms": round(ordered[-1] * 1000, 3) if count else 0.0,
+            "statuses": {str(code): n for code, n in sorted(self.statuses.items())},
+        }
+
+
+def percentile(ordered: list, pct: float) -> float:
+    """정렬된 목록의 nearest-rank 백분위수"""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class RushRecorder:
+    """요청 결과 집계"""
+
+    def __init__(self):
+        self.routes: dict[str, RouteStats] = defaultdict(RouteStats)
+        self.errors: Counter = Counter()
+        self.sqlite_busy = 0
+        self.total = 0
+
+    def record(self, route: str, elapsed: float, response: Optional[httpx.Response], exc: Exception = None):
+        self.total += 1
+        if exc is not None:
+            self.routes[route].record(elapsed, 0)
+            self.errors[type(exc).__name__] += 1
+            return
+
+        self.routes[route].record(elapsed, response.status_code)
+        if response.status_code < 400:
+            return
+
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        code = body.get("code", f"HTTP_{response.status_code}")
+        self.errors[ERROR_CODE_TYPES.get(code, code)] += 1
+
+        text = f"{body.get('error', '')} {body.get('message', '')}".lower()
+        if response.status_code >= 500 and any(marker in text for marker in BUSY_MARKERS):
+            self.sqlite_busy += 1
+
+
+class VirtualStudent:
+    """가상 학생 (신청/취소/시간표 조회 반복)"""
+
+    def __init__(self, student_id: int, scenario: Scenario, courses: list, hot: list, rng: random.Random):
+        self.student_id = student_id
+        self.scenario = scenario
+        self.courses = courses
+        self.hot = hot
+        self.rng = rng
+        self.enrollment_ids: list[int] = []
+
+    def next_action(self) -> str:
+        s = self.scenario
+        action = self.rng.choices(
+            ("enroll", "cancel", "schedule"),
+            weights=(s.enroll_weight, s.cancel_weight, s.schedule_weight),
+        )[0]
+        if action == "cancel" and not self.enrollment_ids:
+            return "enroll"
+        return action
+
+    def pick_course(self) -> int:
+        if self.hot and self.rng.random() < self.scenario.hot_ratio:
+            return self.rng.choice(self.hot)
+        return self.rng.choice(self.courses)
+
+    def think_time(self) -> float:
+        mean = self.scenario.think_time_ms / 1000.0
+        return self.rng.expovariate(1.0 / mean) if mean > 0 else 0.0
+
+
+async def _timed(client: httpx.AsyncClient, method: str, url: str, **kwargs):
+    start = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+        return response, time.perf_counter() - start, None
+    except Exception as exc:  # 전송 계층 오류도 집계
+        return None, time.perf_counter() - start, exc
+
+
+async def _run_student(
+    client: httpx.AsyncClient,
+    student: VirtualStudent,
+    recorder: RushRecorder,
+    gate: asyncio.Semaphore,
+    deadline: float,
+    budget: list,
+):
+    base = f"/api/v1/students/{student.student_id}"
+    while time.perf_counter() < deadline:
+        await asyncio.sleep(student.think_time())
+        if budget[0] is not None:
+            if budget[0] <= 0:
+                return
+            budget[0] -= 1
+
+        action = student.next_action()
+        async with gate:
+            if action == "enroll":
+                route = ROUTE_ENROLL
+                response, elapsed, exc = await _timed(
+                    client, "POST", f"{base}/enrollments", json={"course_id": student.pick_course()}
+                )
+                if response is not None and response.status_code == 201:
+                    student.enrollment_ids.append(response.json()["id"])
+            elif action == "cancel":
+                route = ROUTE_CANCEL
+                enrollment_id = student.enrollment_ids.pop(student.rng.randrange(len(student.enrollment_ids)))
+                response, elapsed, exc = await _timed(client, "DELETE", f"{base}/enrollments/{enrollment_id}")
+            else:
+                route = ROUTE_SCHEDULE
+                response, elapsed, exc = await _timed(client, "GET", f"{base}/schedule")
+
+        recorder.record(route, elapsed, response, exc)
+
+
+async def _fetch_ids(client: httpx.AsyncClient, path: str, wanted: int) -> list[int]:
+    """페이징 API로 ID 목록 수집"""
+    ids: list[int] = []
+    skip = 0
+    while len(ids) < wanted:
+        response = await client.get(path, params={"skip": skip, "limit": 1000})
+        response.raise_for_status()
+        page = response.json()
+        if not page:
+            break
+        ids.extend(item["id"] for item in page)
+        skip += len(page)
+    return ids[:wanted]
+
+
+async def run_rush(client: httpx.AsyncClient, scenario: Scenario, busy_counter=None) -> dict:
+    """시나리오 실행 후 결과 dict 반환"""
+    rng = random.Random(scenario.seed)
+    student_ids = await _fetch_ids(client, "/api/v1/students", scenario.students)
+    course_ids = await _fetch_ids(client, "/api/v1/courses", scenario.courses)
+    if not student_ids or not course_ids:
+        raise RuntimeError("학생/강좌 데이터가 없습니다. 서버 초기 데이터를 확인하세요.")
+
+    hot = rng.sample(course_ids, min(scenario.hot_courses, len(course_ids)))
+    students = [
+        VirtualStudent(sid, scenario, course_ids, hot, random.Random(rng.random()))
+        for sid in student_ids
+    ]
+
+    recorder = RushRecorder()
+    gate = asyncio.Semaphore(scenario.concurrency)
+    budget = [scenario.max_requests]
+
+    started = time.perf_counter()
+    deadline = started + scenario.duration
+    await asyncio.gather(*(
+        _run_student(client, student, recorder, gate, deadline, budget)
+        for student in students
+    ))
+    elapsed = time.perf_counter() - started
+
+    sqlite_busy = recorder.sqlite_busy
+    if busy_counter is not None:
+        sqlite_busy = max(sqlite_busy, busy_counter())
+
+    return {
+        "scenario": asdict(scenario),
+        "hot_course_ids": hot,
+        "elapsed_s": round(elapsed, 3),
+        "total_requests": recorder.total,
+        "throughput_rps": round(recorder.total / elapsed, 2) if elapsed else 0.0,
+        "routes": {route: stats.summary() for route, stats in sorted(recorder.routes.items())},
+        "errors": dict(recorder.errors.most_common()),
+        "sqlite_busy": sqlite_busy,
+    }
+
+
+async def _run_in_process(scenario: Scenario) -> dict:
+    """ASGI 앱을 직접 띄워 실행 (임시 DB에 시드 데이터 생성)"""
+    from sqlalchemy import event
+
+    from app.config import settings
+    from app.database import engine
+    from app.main import app
+    from app.utils.rate_limit import enrollment_admission
+
+    enrollment_admission.ips = None  # 모든 가상 학생이 같은 주소
+    settings.init_students = scenario.students
+    settings.init_courses = scenario.courses
+    settings.init_professors = min(settings.init_professors, max(scenario.courses // 5, 1))
+
+    busy = [0]
+
+    def _count_busy(context):
+        if any(marker in str(context.original_exception).lower() for marker in BUSY_MARKERS):
+            busy[0] += 1
+
+    event.listen(engine, "handle_error", _count_busy)
+    try:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60.0) as client:
+                return await run_rush(client, scenario, busy_counter=lambda: busy[0])
+    finally:
+        event.remove(engine, "handle_error", _count_busy)
+
+
+async def _run_remote(scenario: Scenario, base_url: str) -> dict:
+    """실행 중인 서버(uvicorn)를 대상으로 실행"""
+    limits = httpx.Limits(max_connections=scenario.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=60.0, limits=limits) as client:
+        return await run_rush(client, scenario)
+
+
+def compare_results(current: dict, previous: dict) -> list[str]:
+    """이전 결과 대비 변화량 요약"""
+    lines = [
+        f"throughput: {previous.get('throughput_rps', 0)} → {current['throughput_rps']} rps",
+        f"sqlite_busy: {previous.get('sqlite_busy', 0)} → {current['sqlite_busy']}",
+    ]
+    for route, stats in current["routes"].items():
+        before = previous.get("routes", {}).get(route)
+        if not before:
+            lines.append(f"{route}: (신규)")
+            continue
+        parts = []
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            delta = stats[key] - before[key]
+            parts.append(f"{key} {before[key]} → {stats[key]} ({delta:+.3f})")
+        lines.append(f"{route}: " + ", ".join(parts))
+    return lines
+
+
+def format_report(result: dict) -> str:
+    lines = [
+        f"⏱️  {result['total_requests']}건 / {result['elapsed_s']}s → {result['throughput_rps']} rps",
+        f"🔒 SQLite busy: {result['sqlite_busy']}",
+    ]
+    for route, stats in result["routes"].items():
+        lines.append(
+            f"  {route}: n={stats['count']} p50={stats['p50_ms']}ms "
+            f"p95={stats['p95_ms']}ms p99={stats['p99_ms']}ms statuses={stats['statuses']}"
+        )
+    if result["errors"]:
+        lines.append("  errors: " + ", ".join(f"{k}={v}" for k, v in result["errors"].items()))
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    defaults = Scenario()
+    parser = argparse.ArgumentParser(description="수강신청 오픈 러시 부하 생성기")
+    parser.add_argument("--base-url", help="대상 서버 URL (생략 시 in-process ASGI 실행)")
+    parser.add_argument("--database-url", help="in-process 실행 시 DB URL (기본: 임시 파일)")
+    parser.add_argument("--students", type=int, default=defaults.students)
+    parser.add_argument("--courses", type=int, default=defaults.courses)
+    parser.add_argument("--hot-courses", type=int, default=defaults.hot_courses)
+    parser.add_argument("--hot-ratio", type=float, default=defaults.hot_ratio)
+    parser.add_argument("--mix", default="0.6:0.15:0.25", help="enroll:cancel:schedule 가중치")
+    parser.add_argument("--think-time-ms", type=float, default=defaults.think_time_ms)
+    parser.add_argument("--duration", type=float, default=defaults.duration)
+    parser.add_argument("--max-requests", type=int, default=None)
+    parser.add_argument("--concurrency", type=int, default=defaults.concurrency)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    return parser
+
+
+def scenario_from_args(args: argparse.Namespace) -> Scenario:
+    enroll, cancel, schedule = (float(w) for w in args.mix.split(":"))
+    return Scenario(
+        students=args.students,
+        courses=args.courses,
+        hot_courses=args.hot_courses,
+        hot_ratio=args.hot_ratio,
+        enroll_weight=enroll,
+        cancel_weight=cancel,
+        schedule_weight=schedule,
+        think_time_ms=args.think_time_ms,
+        duration=args.duration,
+        max_requests=args.max_requests,
+        concurrency=args.concurrency,
+        seed=args.seed,
+    )
+
+
+def main(argv=None) -> dict:
+    args = build_parser().parse_args(argv)
+    scenario = scenario_from_args(args)
+
+    if args.base_url:
+        result = asyncio.run(_run_remote(scenario, args.base_url))
+        result["target"] = args.base_url
+    else:
+        # app 모듈 import 전에 DB 경로를 지정해야 엔진에 반영됨
+        if args.database_url:
+            os.environ["DATABASE_URL"] = args.database_url
+        elif "DATABASE_URL" not in os.environ:
+            db_path = Path(tempfile.mkdtemp(prefix="rush-")) / "rush.db"
+            os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+        result = asyncio.run(_run_in_process(scenario))
+        result["target"] = "in-process"
+
+    print(format_report(result))
+
+    if args.compare:
+        previous = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        print("\n📈 이전 결과 대비")
+        print("\n".join(compare_results(result, previous)))
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"💾 결과 저장: {output}")
+
+    return result
+
+
+if __name__ == "__main__":
+    main()
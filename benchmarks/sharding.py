@@ -0,0 +1,79 @@
+"""
+benchmarks/sharding.py - 단일 DB vs 학과별 샤딩 처리량 비교 (수강신청 러시)
+
+모드마다 새 프로세스/임시 디렉터리에서 `registration_rush`를 같은 시나리오로
+실행합니다. 학과 수(`INIT_DEPARTMENTS`, 기본 10)만큼 샤드가 생기고, 인기 강좌가
+여러 학과에 흩어지도록 `--hot-courses`를 학과 수 이상으로 두는 것을 권장합니다.
+
+실행:
+    PYTHONPATH=src python -m benchmarks.sharding --departments 10 --duration 15 \\
+        --hot-courses 20 --output bench_results/sharding.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.registration_rush import ROUTE_ENROLL
+
+MODES = ("single", "sharded")
+
+
+def _run_mode(mode: str, departments: int, rush_args: list[str]) -> dict:
+    workdir = Path(tempfile.mkdtemp(prefix=f"shard-{mode}-"))
+    output = workdir / "rush.json"
+    env = {
+        **os.environ,
+        "SHARD_BY_DEPARTMENT": str(mode == "sharded").lower(),
+        "SHARD_DIR": str(workdir / "shards"),
+        "INIT_DEPARTMENTS": str(departments),
+        "DATABASE_URL": f"sqlite:///{workdir / 'rush.db'}",
+        "LOG_LEVEL": "WARNING",
+    }
+    command = [sys.executable, "-m", "benchmarks.registration_rush", *rush_args, "--output", str(output)]
+    subprocess.run(command, env=env, capture_output=True, text=True, check=True)
+    return json.loads(output.read_text(encoding="utf-8"))
+
+
+def format_report(results: dict) -> str:
+    lines = [f"{'mode':<10}{'rps':>9}{'enroll p50':>12}{'enroll p95':>12}{'enroll p99':>12}{'5xx':>6}"]
+    for mode, result in results.items():
+        enroll = result["routes"].get(ROUTE_ENROLL, {})
+        errors = sum(
+            n for stats in result["routes"].values()
+            for code, n in stats["statuses"].items() if code.startswith("5") or code == "0"
+        )
+        lines.append(
+            f"{mode:<10}{result['throughput_rps']:>9}"
+            f"{enroll.get('p50_ms', 0):>10}ms{enroll.get('p95_ms', 0):>10}ms{enroll.get('p99_ms', 0):>10}ms{errors:>6}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description="단일 DB vs 학과별 샤딩 비교")
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--departments", type=int, default=10)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args, rush_args = parser.parse_known_args(argv)
+
+    results = {}
+    for mode in args.modes.split(","):
+        print(f"▶️  {mode} ...", flush=True)
+        results[mode] = _run_mode(mode.strip(), args.departments, rush_args)
+
+    print(format_report(results))
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"💾 결과 저장: {output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
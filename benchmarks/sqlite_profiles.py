@@ -0,0 +1,75 @@
+"""
+benchmarks/sqlite_profiles.py - SQLite 성능 프로파일 비교 (수강신청 러시)
+
+프로파일(`SQLITE_PROFILE`)마다 새 프로세스/임시 DB에서 `registration_rush`를
+같은 시나리오로 실행하고 처리량/지연 시간을 비교합니다.
+
+실행:
+    PYTHONPATH=src python -m benchmarks.sqlite_profiles --duration 15 \\
+        --output bench_results/sqlite_profiles.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.registration_rush import ROUTE_ENROLL
+
+PROFILE_NAMES = ("durable", "balanced", "throughput")
+
+
+def _run_profile(profile: str, rush_args: list[str]) -> dict:
+    workdir = Path(tempfile.mkdtemp(prefix=f"profile-{profile}-"))
+    output = workdir / "rush.json"
+    env = {
+        **os.environ,
+        "SQLITE_PROFILE": profile,
+        "DATABASE_URL": f"sqlite:///{workdir / 'rush.db'}",
+        "LOG_LEVEL": "WARNING",
+    }
+    command = [sys.executable, "-m", "benchmarks.registration_rush", *rush_args, "--output", str(output)]
+    subprocess.run(command, env=env, capture_output=True, text=True, check=True)
+    return json.loads(output.read_text(encoding="utf-8"))
+
+
+def format_report(results: dict) -> str:
+    lines = [f"{'profile':<12}{'rps':>9}{'enroll p50':>12}{'enroll p95':>12}{'enroll p99':>12}{'5xx':>6}"]
+    for profile, result in results.items():
+        enroll = result["routes"].get(ROUTE_ENROLL, {})
+        errors = sum(
+            n for stats in result["routes"].values()
+            for code, n in stats["statuses"].items() if code.startswith("5") or code == "0"
+        )
+        lines.append(
+            f"{profile:<12}{result['throughput_rps']:>9}"
+            f"{enroll.get('p50_ms', 0):>10}ms{enroll.get('p95_ms', 0):>10}ms{enroll.get('p99_ms', 0):>10}ms{errors:>6}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description="SQLite 성능 프로파일 비교")
+    parser.add_argument("--profiles", default=",".join(PROFILE_NAMES))
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args, rush_args = parser.parse_known_args(argv)
+
+    results = {}
+    for profile in args.profiles.split(","):
+        print(f"▶️  {profile} ...", flush=True)
+        results[profile] = _run_profile(profile.strip(), rush_args)
+
+    print(format_report(results))
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"💾 결과 저장: {output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
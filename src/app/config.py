@@ -3,6 +3,8 @@ config.py - 애플리케이션 설정
 """
 from pydantic_settings import BaseSettings
 from pathlib import Path
+from typing import Optional
+from datetime import datetime
 import os
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -20,7 +22,29 @@ class Settings(BaseSettings):
     database_url: str = f"sqlite:///{BASE_DIR}/course_enrollment.db"
     database_echo: bool = False  # SQL 로깅 (디버깅 시 True로 변경)
     
+    # 커넥션 풀
+    db_pool_size: int = 10
+    db_pool_max_overflow: int = 30  # 스레드풀(기본 40) 동시 요청을 커버
+    db_pool_timeout_s: float = 30.0
+    sqlite_busy_timeout_ms: int = 5000  # 커넥션마다 PRAGMA busy_timeout
+    schedule_read_your_writes: bool = True  # 시간표 조회를 쓰기 엔진으로 (false면 읽기 전용 엔진)
+    
+    # 학과별 샤딩 (강좌/시간표/수강신청을 학과별 SQLite 파일로 분리, database.ShardRouter)
+    shard_by_department: bool = False
+    shard_dir: str = f"{BASE_DIR}/shards"
+    
+    # SQLite 성능 프로파일 (durable / balanced / throughput, utils/sqlite_profile.py)
+    sqlite_profile: str = "durable"
+    # 개별 값 지정 시 프리셋보다 우선
+    sqlite_synchronous: Optional[str] = None  # OFF / NORMAL / FULL / EXTRA
+    sqlite_cache_size: Optional[int] = None  # 음수면 KiB 단위
+    sqlite_mmap_size: Optional[int] = None  # bytes
+    sqlite_temp_store: Optional[str] = None  # DEFAULT / FILE / MEMORY
+    sqlite_wal_autocheckpoint: Optional[int] = None  # pages
+    sqlite_prewarm: Optional[bool] = None  # 시작 시 페이지 캐시 예열
+    
     # 초기 데이터
+    init_reseed: bool = True  # 시작 시 기존 데이터/저널을 지우고 샘플 데이터 생성 (false면 유지, 비어 있을 때만 생성)
     init_departments: int = 10
     init_courses: int = 500
     init_students: int = 10000
@@ -29,9 +53,80 @@ class Settings(BaseSettings):
     # 비즈니스 규칙
     max_credits_per_semester: int = 18
     
+    # 수강신청 저널 스냅샷 (services/journal_service.py)
+    journal_snapshot_interval_s: float = 30.0  # 백그라운드 스냅샷 확인 주기 (0이면 끔)
+    journal_snapshot_min_events: int = 1000  # 마지막 스냅샷 이후 이벤트가 이만큼 쌓이면 스냅샷
+    
+    # Course.enrolled 정합성 점검 (services/reconciliation_service.py)
+    reconcile_interval_s: float = 300.0  # 점검 패스 사이 간격 (0이면 백그라운드 점검 끔)
+    reconcile_batch_size: int = 100  # 한 번에 점검할 강좌 수 (읽기 트랜잭션 1개)
+    reconcile_batch_pause_ms: float = 50.0  # 배치 사이 최소 대기
+    reconcile_max_duty: float = 0.05  # 점검이 차지할 최대 시간 비율 (배치가 느려지면 대기도 늘어남)
+    reconcile_repair: bool = False  # 불일치 발견 시 실제 ENROLLED 수로 보정
+    
+    # 대량 내보내기 (services/export_service.py)
+    export_chunk_rows: int = 1000  # yield_per 크기 = 응답 청크 1개의 행 수
+    
+    # 수강신청 대량 등록 (services/bulk_import_service.py)
+    import_batch_rows: int = 2000  # 쓰기 트랜잭션 1개에서 처리할 행 수
+    
+    # 사전 신청 (희망 강좌 순위 제출 + 일괄 배정, services/allocation_service.py)
+    preference_window_start: Optional[datetime] = None  # 제출 기간 시작 (UTC, 없으면 제한 없음)
+    preference_window_end: Optional[datetime] = None  # 제출 기간 종료 (UTC, 없으면 제한 없음)
+    max_preferences: int = 12  # 학생당 희망 강좌 수
+    
+    # 시간표 조합 탐색 (services/timetable_service.py)
+    timetable_time_budget_ms: float = 200.0  # 요청 1건의 기본 탐색 시간 예산
+    
+    # 학과별 정원/신청 인원 집계 (services/department_stats_service.py)
+    department_stats_verify_interval_s: float = 600.0  # 전체 스캔 검증 간격 (0이면 백그라운드 검증 끔)
+    
+    # 데이터 통계 카운터 (services/data_stats_service.py)
+    data_stats_reconcile_interval_s: float = 300.0  # COUNT로 다시 세어 점검하는 간격 (0이면 백그라운드 점검 끔)
+    
+    # 수강신청/취소 입장 제어 (utils/rate_limit.py, 초당 충전량 0이면 해당 제한 끔)
+    rate_limit_student_per_s: float = 2.0  # 학생별 토큰 버킷 충전 속도
+    rate_limit_student_burst: int = 10
+    # 클라이언트 IP별 토큰 버킷 충전 속도 (기본 끔: 전송 주소 기준이라 NAT/프록시 뒤 학생 전체가 한 버킷을 공유)
+    rate_limit_ip_per_s: float = 0.0
+    rate_limit_ip_burst: int = 200
+    rate_limit_max_keys: int = 100_000  # 버킷/마감 강좌 키 수 상한 (LRU)
+    full_course_window_ms: float = 500.0  # 정원 초과 강좌를 DB 없이 거절하는 시간 (0이면 끔)
+    enroll_max_in_flight: int = 64  # 처리 중인 신청/취소 요청 상한 (넘으면 429, 0이면 끔)
+    enroll_shed_retry_after_s: int = 1
+    
+    # 강좌 조회 요청 합치기 (utils/single_flight.py)
+    read_coalesce_enabled: bool = True  # 같은 강좌 상세/목록 동시 요청은 조회/직렬화 1번을 공유
+    read_coalesce_ttl_ms: float = 0.0  # 결과 재사용 시간 (예: 100, 0이면 진행 중인 요청만 합침)
+    read_coalesce_max_keys: int = 10_000  # TTL 결과 보관 키 수 (LRU)
+    
+    # SQLite 쓰기 트랜잭션 재시도 (SQLITE_BUSY)
+    db_busy_retry_attempts: int = 3  # 최초 시도 포함 최대 실행 횟수
+    db_busy_retry_base_ms: float = 50.0  # 지수 백오프 시작값 (full jitter)
+    db_busy_retry_max_ms: float = 500.0
+    db_busy_retry_after_s: int = 1  # 재시도 소진 시 503 응답의 Retry-After
+    
+    # 계측 (운영 중 켜고 끌 수 있음)
+    debug: bool = False  # 응답 헤더에 요청별 SQL 수/DB 시간 노출
+    sql_repeat_warning_threshold: int = 10  # 요청 내 동일 SQL 반복 시 N+1 경고 기준
+    lock_metrics_enabled: bool = False  # 락 대기/보유 시간 계측
+    lock_metrics_top_n: int = 10  # 경합 상위 강좌 키 수
+    
+    # 느린 요청 샘플링 프로파일러
+    profiler_enabled: bool = False
+    profiler_interval_ms: float = 5.0  # 스택 샘플링 주기
+    profiler_slow_threshold_ms: float = 500.0  # 이 시간 이상 걸린 요청의 프로파일 보관
+    profiler_sample_rate: float = 0.0  # 지연 시간과 무관하게 보관할 요청 비율 (0~1)
+    profiler_ring_size: int = 20  # 보관할 최근 프로파일 수
+    
     # 로깅
     log_level: str = "INFO"
     log_file: str = f"{BASE_DIR}/logs/app.log"
+    log_to_file: bool = False  # log_file에도 기록 (백그라운드 리스너 스레드에서 I/O)
+    log_json: bool = True  # JSON lines 출력 (false면 텍스트 포맷)
+    log_queue_size: int = 10000  # 가득 차면 요청 스레드를 막지 않고 레코드를 버림
+    log_sample_burst: int = 5  # 반복 로그(sample_key)를 윈도우당 남길 건수 (0이면 샘플링 안 함)
+    log_sample_window_s: float = 10.0
     
     class Config:
         env_file = f"{BASE_DIR}/.env"
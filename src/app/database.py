@@ -1,22 +1,157 @@
 """
 database.py - SQLAlchemy 데이터베이스 설정
 """
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
-from typing import Generator
+from sqlalchemy.engine import Engine
+from pathlib import Path
+from typing import Generator, Optional
 import logging
+import threading
 
 from app.config import settings
+from app.utils.profiler import bind_thread
+from app.utils.sqlite_profile import resolve_profile, pragma_statements
+from app.utils.pool_stats import (
+    TimedQueuePool,
+    TimedStaticPool,
+    register_pool,
+    unregister_pool,
+)
 
 logger = logging.getLogger(__name__)
 
+
+# SQLite 성능 프로파일 (커넥션마다 적용할 PRAGMA)
+sqlite_profile = resolve_profile(
+    settings.sqlite_profile,
+    {
+        "synchronous": settings.sqlite_synchronous,
+        "cache_size": settings.sqlite_cache_size,
+        "mmap_size": settings.sqlite_mmap_size,
+        "temp_store": settings.sqlite_temp_store,
+        "wal_autocheckpoint": settings.sqlite_wal_autocheckpoint,
+        "prewarm": settings.sqlite_prewarm,
+    },
+)
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    return url in ("sqlite://", "sqlite:///") or ":memory:" in url or "mode=memory" in url
+
+
+def _pool_options(url: str) -> dict:
+    """커넥션 풀 설정
+
+    커넥션 `DB_POOL_SIZE`개를 유지하고 `DB_POOL_MAX_OVERFLOW`개까지 추가로 열며,
+    모두 사용 중이면 `DB_POOL_TIMEOUT_S`초까지 대기합니다.
+    인메모리 SQLite는 커넥션마다 별도 DB가 되므로 커넥션 1개를 공유합니다.
+    """
+    if _is_sqlite_memory(url):
+        return {"poolclass": TimedStaticPool}
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_pool_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_s,
+    }
+
+
+def create_app_engine(url: str, name: str, connect_args: dict = None, read_only: bool = False) -> Engine:
+    """설정된 풀/PRAGMA를 적용한 엔진 생성 (풀 상태는 `name`으로 노출)"""
+    is_sqlite = url.startswith("sqlite")
+    args = {"check_same_thread": False} if is_sqlite else {}
+    args.update(connect_args or {})
+    target = create_engine(
+        url,
+        echo=settings.database_echo,
+        connect_args=args,
+        **(_pool_options(url) if is_sqlite else {}),
+    )
+    setup_sqlite_engine(target, read_only=read_only)
+    register_pool(name, target.pool)
+    return target
+
+
+# ==================== SQLite 트랜잭션 제어 ====================
+# pysqlite 드라이버는 첫 DML 직전에야 BEGIN(DEFERRED)을 보내므로, 읽기로 시작한
+# 수강신청 트랜잭션이 `UPDATE courses`에서 쓰기로 승격되다 `database is locked`가 납니다.
+# 쓰기 트랜잭션은 begin 이벤트에서 직접 `BEGIN IMMEDIATE`를 보내 시작 시점에
+# 쓰기 잠금을 확보합니다. (그 외 트랜잭션은 드라이버 기본 동작 유지)
+SQLITE_BEGIN_OPTION = "sqlite_begin"
+
+
+def setup_sqlite_engine(target: Engine, read_only: bool = False):
+    """SQLite 엔진에 PRAGMA/쓰기 트랜잭션 시작 이벤트 등록
+
+    `read_only=True`면 커넥션마다 `PRAGMA query_only`를 켜서 쓰기 시도를 에러로 만듭니다.
+    """
+    if target.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(target, "connect")
+    def set_sqlite_pragma(dbapi_conn, connection_record):
+        """SQLite 동시성 설정"""
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")  # Write-Ahead Logging
+        cursor.execute(f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}")
+        for statement in pragma_statements(sqlite_profile):
+            cursor.execute(statement)
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+    @event.listens_for(target, "begin")
+    def do_begin(conn):
+        """`sqlite_begin` 실행 옵션이 있으면 `BEGIN <mode>`로 트랜잭션 시작"""
+        mode = conn.get_execution_options().get(SQLITE_BEGIN_OPTION)
+        if mode:
+            conn.exec_driver_sql(f"BEGIN {mode}")
+
+
+def begin_write(db: Session):
+    """세션의 트랜잭션을 쓰기 잠금(BEGIN IMMEDIATE)으로 시작
+
+    이미 트랜잭션이 열려 있으면 그대로 사용합니다.
+    """
+    if not db.in_transaction():
+        db.connection(execution_options={SQLITE_BEGIN_OPTION: "IMMEDIATE"})
+
+
+# ==================== 커밋 후 훅 ====================
+# 인메모리 상태(좌석/학점 카운터 등)는 트랜잭션이 실제로 커밋된 뒤에만 반영해야 하므로
+# 세션에 콜백을 걸어두고 커밋 시 실행, 롤백 시 폐기합니다. (재시도 시 다시 등록됨)
+AFTER_COMMIT_KEY = "after_commit_callbacks"
+
+
+def after_commit(db: Session, callback):
+    """현재 트랜잭션이 커밋되면 `callback()` 실행"""
+    db.info.setdefault(AFTER_COMMIT_KEY, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session: Session):
+    for callback in session.info.pop(AFTER_COMMIT_KEY, ()):
+        try:
+            callback()
+        except Exception:
+            logger.exception("❌ 커밋 후 훅 실패")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit(session: Session):
+    session.info.pop(AFTER_COMMIT_KEY, None)
+
+
 # 엔진 생성
-engine = create_engine(
-    settings.database_url,
-    echo=settings.database_echo,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
-    poolclass=StaticPool if "sqlite" in settings.database_url else None,
+engine = create_app_engine(settings.database_url, "primary")
+
+# 읽기 전용 엔진 (조회 라우트용, 쓰기 잠금을 잡지 않음)
+# 인메모리 DB는 커넥션마다 별도 DB이므로 쓰기 엔진을 그대로 사용
+read_engine = (
+    engine
+    if _is_sqlite_memory(settings.database_url)
+    else create_app_engine(settings.database_url, "read", read_only=True)
 )
 
 # 세션 팩토리
@@ -25,14 +160,126 @@ SessionLocal = sessionmaker(
     autoflush=False,
     bind=engine,
 )
+ReadSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=read_engine,
+)
 
 # Base 임포트 (모든 모델이 이를 상속)
 from sqlalchemy.orm import declarative_base
 Base = declarative_base()
 
 
+# ==================== 학과별 샤딩 (선택) ====================
+# `SHARD_BY_DEPARTMENT=true`면 강좌/시간표/수강신청(좌석 카운터 포함)을 학과별 SQLite
+# 파일(`SHARD_DIR/dept_<학과ID>.db`)에 두고, 학과/교수/학생/학생별 신청 학점은 기본 DB
+# (코디네이터)에 둡니다. SQLite의 쓰기 잠금은 파일 단위이므로 서로 다른 학과의
+# 수강신청은 각자의 샤드에서 병렬로 커밋됩니다.
+SHARD_TABLES = ("courses", "schedules", "enrollments")
+
+# 샤드의 수강신청 ID = 샤드 내 순번 * STRIDE + 학과 ID (ID만으로 샤드를 찾기 위함)
+ENROLLMENT_ID_STRIDE = 1000
+
+
+class ShardRouter:
+    """학과 ID → 샤드 엔진/세션 라우팅"""
+
+    def __init__(self, shard_dir: str, enabled: bool = False):
+        self.enabled = enabled
+        self.shard_dir = Path(shard_dir)
+        self._lock = threading.Lock()
+        self._sessions: dict[int, sessionmaker] = {}
+        self._read_sessions: dict[int, sessionmaker] = {}
+        # DB 파일별 프로세스 내 쓰기 게이트: 대기 스레드가 SQLite busy handler의
+        # sleep 폴링(최대 100ms 간격) 대신 락 해제 즉시 깨어남 (프로세스 간은 busy_timeout)
+        self._write_locks: dict[int, threading.Lock] = {}
+        self.coordinator_write_lock = threading.Lock()
+        self._engines: dict[str, Engine] = {}
+        # 강좌 ID → 학과 ID (강좌는 샤드 간 이동하지 않으므로 시작 시 한 번 구성)
+        self._course_departments: dict[int, int] = {}
+
+    def open(self, department_ids) -> list[int]:
+        """학과별 샤드 파일/테이블 준비 (이미 열린 샤드는 그대로 사용)"""
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        tables = [Base.metadata.tables[name] for name in SHARD_TABLES]
+        with self._lock:
+            for department_id in department_ids:
+                if department_id in self._sessions:
+                    continue
+                if not 0 < department_id < ENROLLMENT_ID_STRIDE:
+                    raise ValueError(f"Department id out of shard range: {department_id}")
+                url = f"sqlite:///{self.shard_dir / f'dept_{department_id}.db'}"
+                write = create_app_engine(url, f"shard_{department_id}")
+                read = create_app_engine(url, f"shard_{department_id}_read", read_only=True)
+                Base.metadata.create_all(bind=write, tables=tables)
+                upgrade_schedules_table(write)
+                self._engines.update({f"shard_{department_id}": write, f"shard_{department_id}_read": read})
+                # 샤드 세션은 요청이 끝나기 전에 닫으므로 커밋 후에도 속성을 유지
+                self._sessions[department_id] = sessionmaker(
+                    autoflush=False, bind=write, expire_on_commit=False
+                )
+                self._read_sessions[department_id] = sessionmaker(autoflush=False, bind=read)
+                self._write_locks[department_id] = threading.Lock()
+        logger.info("🧩 학과별 샤드 %d개 준비 (%s)", len(self._sessions), self.shard_dir)
+        return self.department_ids()
+
+    def department_ids(self) -> list[int]:
+        return sorted(self._sessions)
+
+    def session(self, department_id: int) -> Session:
+        """학과 샤드의 쓰기 세션 (호출자가 닫음)"""
+        return self._sessions[department_id]()
+
+    def read_session(self, department_id: int) -> Session:
+        """학과 샤드의 읽기 전용 세션 (호출자가 닫음)"""
+        return self._read_sessions[department_id]()
+
+    def read_engine(self, department_id: int) -> Engine:
+        """학과 샤드의 읽기 전용 엔진 (ORM 없이 가벼운 Core 조회용)"""
+        return self._read_sessions[department_id].kw["bind"]
+
+    def write_lock(self, department_id: int) -> threading.Lock:
+        """학과 샤드 쓰기 트랜잭션(BEGIN IMMEDIATE ~ COMMIT) 동안 잡는 락"""
+        return self._write_locks[department_id]
+
+    def register_courses(self, course_departments: dict[int, int]):
+        """강좌 → 학과 디렉터리 갱신"""
+        with self._lock:
+            self._course_departments.update(course_departments)
+
+    def department_for_course(self, course_id: int) -> Optional[int]:
+        return self._course_departments.get(course_id)
+
+    def department_for_enrollment(self, enrollment_id: int) -> Optional[int]:
+        department_id = enrollment_id % ENROLLMENT_ID_STRIDE
+        return department_id if department_id in self._sessions else None
+
+    @staticmethod
+    def next_enrollment_id(db: Session, department_id: int) -> int:
+        """샤드의 다음 수강신청 ID (쓰기 트랜잭션 안에서 호출)"""
+        last = db.execute(text("SELECT COALESCE(MAX(id), 0) FROM enrollments")).scalar()
+        return (last // ENROLLMENT_ID_STRIDE + 1) * ENROLLMENT_ID_STRIDE + department_id
+
+    def close(self):
+        """샤드 엔진 정리"""
+        with self._lock:
+            for name, shard_engine in self._engines.items():
+                shard_engine.dispose()
+                unregister_pool(name)
+            self._engines.clear()
+            self._sessions.clear()
+            self._read_sessions.clear()
+            self._write_locks.clear()
+            self._course_departments.clear()
+
+
+shard_router = ShardRouter(settings.shard_dir, enabled=settings.shard_by_department)
+
+
 def get_db() -> Generator[Session, None, None]:
     """DB 세션 의존성"""
+    bind_thread()  # 느린 요청 프로파일러에 현재 워커 스레드 연결
     db = SessionLocal()
     try:
         yield db
@@ -40,20 +287,61 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_read_db() -> Generator[Session, None, None]:
+    """읽기 전용 DB 세션 의존성 (GET 라우트)"""
+    bind_thread()
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_schedule_db() -> Generator[Session, None, None]:
+    """학생 시간표 조회용 세션 의존성
+
+    `SCHEDULE_READ_YOUR_WRITES=true`면 방금 커밋한 신청/취소가 반드시 보이도록
+    쓰기 엔진 세션을, 아니면 읽기 전용 세션을 사용합니다. (요청당 세션 1개)
+    """
+    bind_thread()
+    db = SessionLocal() if settings.schedule_read_your_writes else ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def upgrade_schedules_table(bind: Engine):
+    """예전 DB 파일의 `schedules.course_id` UNIQUE(강좌당 수업 1회) 제거
+
+    SQLite는 제약을 따로 지울 수 없으므로 테이블을 새 스키마로 다시 만들고 행을 복사합니다.
+    """
+    if bind.dialect.name != "sqlite":
+        return
+    with bind.begin() as conn:
+        indexes = conn.exec_driver_sql("PRAGMA index_list(schedules)").all()
+        if not any(row.origin == "u" for row in indexes):  # UNIQUE 제약의 자동 인덱스
+            return
+        for row in indexes:
+            if row.origin == "c":  # 새 테이블이 같은 이름으로 다시 만듦
+                conn.exec_driver_sql(f'DROP INDEX "{row.name}"')
+        conn.exec_driver_sql("ALTER TABLE schedules RENAME TO schedules_legacy")
+        Base.metadata.tables["schedules"].create(bind=conn)
+        conn.exec_driver_sql(
+            "INSERT INTO schedules (id, course_id, day_of_week, start_time, end_time, created_at) "
+            "SELECT id, course_id, day_of_week, start_time, end_time, created_at FROM schedules_legacy"
+        )
+        conn.exec_driver_sql("DROP TABLE schedules_legacy")
+    logger.info("🗂️ schedules 테이블 갱신: 강좌당 여러 수업 허용")
+
+
 def init_db():
     """데이터베이스 초기화 (테이블 생성)"""
     logger.info("🗂️ 데이터베이스 테이블 생성 중...")
     Base.metadata.create_all(bind=engine)
+    upgrade_schedules_table(engine)
+    # 기존 DB 파일의 테이블에 나중에 추가된 인덱스 (create_all은 테이블 생성 시에만 만듦)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
     logger.info("✅ 테이블 생성 완료")
-
-
-# SQLite 트랜잭션 격리 레벨 설정 (동시성 제어 필수)
-@event.listens_for(engine, "connect")
-def set_sqlite_pragma(dbapi_conn, connection_record):
-    """SQLite 동시성 설정"""
-    if "sqlite" in settings.database_url:
-        cursor = dbapi_conn.cursor()
-        # SERIALIZABLE 격리 레벨
-        cursor.execute("PRAGMA journal_mode=WAL")  # Write-Ahead Logging
-        cursor.execute("PRAGMA busy_timeout=5000")  # 5초 대기
-        cursor.close()
\ No newline at end of file
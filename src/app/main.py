@@ -12,21 +12,34 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.config import settings
-from app.database import init_db, engine, Base, get_db
+from app.database import init_db, engine, Base, get_read_db
+from app.services.conflict_service import conflict_index
 from app.services.data_service import DataService
-from app.database import SessionLocal
-from app.routes import health, students, courses, professors, enrollments
+from app.services.data_stats_service import DataStatsService, data_stats, data_stats_reconciler
+from app.services.department_stats_service import department_stats, department_stats_verifier
+from app.services.journal_service import JournalService, JournalSnapshotter
+from app.services.reconciliation_service import reconciler
+from app.database import SessionLocal, read_engine, sqlite_profile, shard_router
+from app.utils.sqlite_profile import prewarm
+from app.routes import health, students, courses, professors, enrollments, metrics, admin, exports, imports, preferences, departments
+from app.middleware import MetricsMiddleware, QueryCountMiddleware, ProfilerMiddleware
 from app.utils.exceptions import BusinessException
+from app.utils.metrics import BUSINESS_EXCEPTIONS, UNHANDLED_EXCEPTIONS
+from app.utils.log_pipeline import configure_logging
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# 로깅 설정 (큐 핸들러 + 백그라운드 리스너)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 
 # ==================== 라이프사이클 이벤트 ====================
+snapshotter = JournalSnapshotter(
+    SessionLocal,
+    settings.journal_snapshot_interval_s,
+    settings.journal_snapshot_min_events,
+)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -45,11 +58,33 @@ async def lifespan(app: FastAPI):
         # 초기 데이터 생성
         db = SessionLocal()
         try:
-            # 기존 데이터 정리
-            DataService.clear_all(db)
+            if settings.init_reseed or DataService.is_empty(db):
+                # 기존 데이터 정리 (강좌/학생을 새로 만들므로 저널도 함께)
+                DataService.clear_all(db)
+                
+                # 샘플 데이터 생성
+                stats = DataService.create_sample_data(db)
+                
+                # 학과별 샤딩 모드: 강좌/시간표를 학과 샤드로 이동
+                if shard_router.enabled:
+                    stats["shards"] = len(DataService.distribute_to_shards(db, shard_router))
+            else:
+                # 기존 데이터/저널 유지 → 아래 저널 복구가 스냅샷 + tail을 재생
+                stats = {"reseeded": False}
+            
+            # 데이터 통계 카운터 (이후 생성/신청/취소 시 증감, 주기적으로 다시 세어 점검)
+            DataStatsService.seed(db)
             
-            # 샘플 데이터 생성
-            stats = DataService.create_sample_data(db)
+            # 인메모리 좌석/학생별 학점 복구 (최신 스냅샷 + 저널 tail)
+            JournalService.rebuild(db)
+            
+            # 강좌 간 시간 충돌 인접 비트셋 (샤딩 모드는 시간표가 샤드에 있어 제외)
+            if not shard_router.enabled:
+                conflict_index.load(db)
+            
+            # 학과별 정원/신청 인원 집계 (이후 신청/취소/정원 변경 시 증분 갱신)
+            if not shard_router.enabled:
+                department_stats.load(db)
             
             elapsed = time.time() - start_time
             logger.info(f"✅ 초기화 완료 ({elapsed:.2f}초)")
@@ -60,6 +95,21 @@ async def lifespan(app: FastAPI):
         finally:
             db.close()
         
+        # 페이지 캐시 예열 (SQLite 성능 프로파일)
+        if read_engine.dialect.name == "sqlite" and sqlite_profile["prewarm"]:
+            prewarm(read_engine)
+        
+        # 저널 스냅샷 (tail이 쌓이면 주기적으로 압축)
+        snapshotter.start()
+        
+        # 데이터 통계 카운터 점검 (COUNT로 다시 세어 비교)
+        data_stats_reconciler.start()
+        
+        # Course.enrolled 정합성 점검 (샤딩 모드는 강좌가 샤드에 있어 제외)
+        if not shard_router.enabled:
+            reconciler.start()
+            department_stats_verifier.start()
+        
         yield
         
     except Exception as e:
@@ -68,6 +118,11 @@ async def lifespan(app: FastAPI):
     
     # ✅ SHUTDOWN
     logger.info("🛑 서버 종료 중...")
+    snapshotter.stop()
+    reconciler.stop()
+    department_stats_verifier.stop()
+    data_stats_reconciler.stop()
+    shard_router.close()
 
 
 # ==================== FastAPI 앱 생성 ====================
@@ -93,15 +148,18 @@ app.add_middleware(
 @app.exception_handler(BusinessException)
 async def business_exception_handler(request: Request, exc: BusinessException):
     """비즈니스 예외 처리"""
+    BUSINESS_EXCEPTIONS.inc(type(exc).__name__)
     return JSONResponse(
         status_code=exc.status_code,
         content=exc.detail,
+        headers=exc.headers,
     )
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """일반 예외 처리"""
+    UNHANDLED_EXCEPTIONS.inc(type(exc).__name__)
     logger.error(f"❌ 예상치 못한 오류: {exc}")
     return JSONResponse(
         status_code=500,
@@ -113,23 +171,13 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
-# ==================== 요청/응답 로깅 미들웨어 ====================
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """HTTP 요청/응답 로깅"""
-    start_time = time.time()
-    
-    # 요청 로깅
-    logger.debug(f"→ {request.method} {request.url.path}")
-    
-    # 응답 처리
-    response = await call_next(request)
-    
-    # 응답 로깅
-    elapsed = time.time() - start_time
-    logger.debug(f"← {request.method} {request.url.path} [{response.status_code}] ({elapsed:.3f}s)")
-    
-    return response
+# ==================== 요청 메트릭/로깅 미들웨어 ====================
+# 순수 ASGI 미들웨어 (라우트 템플릿별 지연 시간 히스토그램 + 디버그 로깅)
+# + 요청별 SQL 수/DB 시간 집계 (N+1 경고, DEBUG=true면 응답 헤더 노출)
+# + 느린 요청 샘플링 프로파일러 (PROFILER_ENABLED=true)
+app.add_middleware(ProfilerMiddleware)
+app.add_middleware(QueryCountMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 
 # ==================== 라우트 등록 ====================
@@ -138,6 +186,12 @@ app.include_router(students.router)
 app.include_router(courses.router)
 app.include_router(professors.router)
 app.include_router(enrollments.router)
+app.include_router(metrics.router)
+app.include_router(admin.router)
+app.include_router(exports.router)
+app.include_router(imports.router)
+app.include_router(preferences.router)
+app.include_router(departments.router)
 
 
 # ==================== 루트 경로 ====================
@@ -154,20 +208,12 @@ async def root():
 
 # ==================== 개발용 테스트 엔드포인트 ====================
 @app.get("/api/v1/test/data-stats")
-async def get_data_stats(db: Session = Depends(get_db)):
-    """데이터 통계"""
-    from sqlalchemy import func
-    from app.models import Student, Course, Professor, Department, Enrollment
-    
+async def get_data_stats(db: Session = Depends(get_read_db)):
+    """데이터 통계 (메모리 카운터, 아직 적재 전이면 한 번 셈)"""
     try:
-        stats = {
-            "students": db.query(func.count(Student.id)).scalar(),
-            "courses": db.query(func.count(Course.id)).scalar(),
-            "professors": db.query(func.count(Professor.id)).scalar(),
-            "departments": db.query(func.count(Department.id)).scalar(),
-            "enrollments": db.query(func.count(Enrollment.id)).filter(Enrollment.status == "ENROLLED").scalar(),
-        }
-        return stats
+        if not data_stats.loaded:
+            DataStatsService.seed(db)
+        return data_stats.snapshot()
     finally:
         db.close()
 
@@ -0,0 +1,12 @@
+"""
+middleware/ - 순수 ASGI 미들웨어
+
+- metrics.py: MetricsMiddleware (라우트별 지연 시간/진행 중 요청 수 + 요청 로깅)
+- query_counter.py: QueryCountMiddleware (요청별 SQL 수/DB 시간, N+1 경고)
+- profiler.py: ProfilerMiddleware (느린 요청 스택 샘플링)
+"""
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.query_counter import QueryCountMiddleware
+from app.middleware.profiler import ProfilerMiddleware
+
+__all__ = ["MetricsMiddleware", "QueryCountMiddleware", "ProfilerMiddleware"]
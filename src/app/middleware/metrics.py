@@ -0,0 +1,53 @@
+"""
+middleware/metrics.py - 요청 지연 시간 메트릭 미들웨어
+
+`@app.middleware("http")`(BaseHTTPMiddleware)는 요청/응답을 별도 태스크와
+스트림으로 감싸므로, send 래핑만 하는 순수 ASGI 미들웨어로 구현합니다.
+"""
+import logging
+import time
+
+from app.utils.metrics import REQUEST_LATENCY, REQUESTS_IN_FLIGHT
+
+logger = logging.getLogger(__name__)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_template(scope) -> str:
+    """라우팅 후 scope에 기록된 경로 템플릿 (카디널리티 제한)"""
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return path or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """HTTP 요청별 지연 시간 히스토그램 + 진행 중 요청 게이지"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            elapsed = time.perf_counter() - start
+            route = route_template(scope)
+            REQUEST_LATENCY.observe(elapsed, scope["method"], route, str(status_code))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("← %s %s [%s] (%.3fs)", scope["method"], scope["path"], status_code, elapsed)
@@ -0,0 +1,28 @@
+"""
+middleware/profiler.py - 느린 요청 샘플링 프로파일러 미들웨어
+"""
+from app.middleware.metrics import route_template
+from app.utils.profiler import profiler, profile_request
+
+
+class ProfilerMiddleware:
+    """프로파일러가 켜져 있으면 요청마다 스택 샘플링을 활성화"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not profiler.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        with profile_request(scope["method"], scope["path"]) as profile:
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    profile.status = message["status"]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                profile.route = route_template(scope)
@@ -0,0 +1,36 @@
+"""
+middleware/query_counter.py - 요청 단위 SQL 집계 미들웨어
+"""
+from app.config import settings
+from app.utils.query_counter import track_queries
+
+
+class QueryCountMiddleware:
+    """요청마다 SQL 실행 수/DB 시간을 집계하고, 디버그 모드에서 응답 헤더로 노출
+
+    - `X-DB-Query-Count`: 실행된 SQL 수
+    - `X-DB-Time-Ms`: SQL 실행 누적 시간 (ms)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries(f"{scope['method']} {scope['path']}") as stats:
+            if not settings.debug:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-db-query-count", str(stats.count).encode()))
+                    headers.append((b"x-db-time-ms", f"{stats.db_time * 1000:.3f}".encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
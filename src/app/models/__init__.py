@@ -1,7 +1,7 @@
 """
 models/ - 데이터 모델
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Time, Enum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Time, Enum, Text, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from enum import Enum as PyEnum
@@ -73,7 +73,7 @@ class Course(Base):
     # 관계
     professor = relationship("Professor", back_populates="courses")
     department = relationship("Department", back_populates="courses")
-    schedule = relationship("Schedule", back_populates="course", uselist=False, cascade="all, delete-orphan")
+    schedules = relationship("Schedule", back_populates="course", order_by="Schedule.id", cascade="all, delete-orphan")
     enrollments = relationship("Enrollment", back_populates="course", cascade="all, delete-orphan")
     
     def __repr__(self):
@@ -81,11 +81,11 @@ class Course(Base):
 
 
 class Schedule(Base):
-    """강의 시간표"""
+    """강의 시간표 (수업 1회, 강좌당 여러 개)"""
     __tablename__ = "schedules"
     
     id = Column(Integer, primary_key=True, index=True)
-    course_id = Column(Integer, ForeignKey("courses.id"), nullable=False, unique=True)
+    course_id = Column(Integer, ForeignKey("courses.id"), nullable=False, index=True)
     
     day_of_week = Column(Enum(DayOfWeek), nullable=False)  # MON, TUE, ...
     start_time = Column(Time, nullable=False)  # 09:00
@@ -94,7 +94,7 @@ class Schedule(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # 관계
-    course = relationship("Course", back_populates="schedule")
+    course = relationship("Course", back_populates="schedules")
     
     def __repr__(self):
         return f"<Schedule(course_id={self.course_id}, {self.day_of_week} {self.start_time}-{self.end_time})>"
@@ -142,7 +142,87 @@ class Enrollment(Base):
     # 복합 고유 제약 (같은 학생이 같은 강좌 중복 신청 불가)
     __table_args__ = (
         # 추후 unique constraint 추가
+        # 강좌별 ENROLLED 수 집계 (정합성 점검, 커버링 인덱스)
+        Index("ix_enrollments_course_status", "course_id", "status"),
     )
     
     def __repr__(self):
-        return f"<Enrollment(id={self.id}, student_id={self.student_id}, course_id={self.course_id}, status='{self.status}')>"
\ No newline at end of file
+        return f"<Enrollment(id={self.id}, student_id={self.student_id}, course_id={self.course_id}, status='{self.status}')>"
+
+
+class CoursePreference(Base):
+    """사전 신청 희망 강좌 (순위, 일괄 배정 결과)"""
+    __tablename__ = "course_preferences"
+    
+    id = Column(Integer, primary_key=True)
+    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
+    rank = Column(Integer, nullable=False)  # 1 = 1지망
+    
+    # 배정 결과
+    status = Column(String(20), nullable=False, default="PENDING")  # PENDING, ALLOCATED, REJECTED
+    reason = Column(String(30), nullable=True)  # 탈락 사유 (CAPACITY_EXCEEDED 등)
+    
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        UniqueConstraint("student_id", "course_id", name="uq_course_preferences_student_course"),
+        Index("ix_course_preferences_student_rank", "student_id", "rank"),
+    )
+    
+    def __repr__(self):
+        return f"<CoursePreference(student_id={self.student_id}, course_id={self.course_id}, rank={self.rank}, status='{self.status}')>"
+
+
+class StudentCreditLoad(Base):
+    """학생별 신청 학점 (학과별 샤딩 모드에서 코디네이터 DB가 관리)"""
+    __tablename__ = "student_credit_loads"
+    
+    student_id = Column(Integer, ForeignKey("students.id"), primary_key=True)
+    credits = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<StudentCreditLoad(student_id={self.student_id}, credits={self.credits})>"
+
+
+class StudentDepartmentLoad(Base):
+    """학생별·학과별 신청 강좌 수 (샤딩 모드에서 조회할 샤드를 좁히는 인덱스)"""
+    __tablename__ = "student_department_loads"
+    
+    student_id = Column(Integer, ForeignKey("students.id"), primary_key=True)
+    department_id = Column(Integer, ForeignKey("departments.id"), primary_key=True)
+    courses = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<StudentDepartmentLoad(student_id={self.student_id}, department_id={self.department_id}, courses={self.courses})>"
+
+
+class EnrollmentEvent(Base):
+    """수강신청/취소 저널 (추가만 함, id 순서 = 커밋 순서)"""
+    __tablename__ = "enrollment_events"
+    
+    id = Column(Integer, primary_key=True)
+    event_type = Column(String(10), nullable=False)  # ENROLL, CANCEL
+    enrollment_id = Column(Integer, nullable=False)
+    student_id = Column(Integer, nullable=False)
+    course_id = Column(Integer, nullable=False)
+    credits = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<EnrollmentEvent(id={self.id}, {self.event_type}, student_id={self.student_id}, course_id={self.course_id})>"
+
+
+class EnrollmentSnapshot(Base):
+    """저널 스냅샷 (last_event_id까지 반영한 강좌별 인원/학생별 학점, JSON)"""
+    __tablename__ = "enrollment_snapshots"
+    
+    id = Column(Integer, primary_key=True)
+    last_event_id = Column(Integer, nullable=False, index=True)
+    events_folded = Column(Integer, nullable=False)  # 이전 스냅샷 이후 접어 넣은 이벤트 수
+    seats = Column(Text, nullable=False)  # {"course_id": enrolled}
+    student_loads = Column(Text, nullable=False)  # {"student_id": [credits, courses]}
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<EnrollmentSnapshot(id={self.id}, last_event_id={self.last_event_id})>"
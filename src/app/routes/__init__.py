@@ -7,8 +7,14 @@ routes/ - API 엔드포인트 라우터
 - courses.py: 강좌 조회 API
 - professors.py: 교수 조회 API
 - enrollments.py: 수강신청 API (핵심)
+- metrics.py: GET /metrics (Prometheus 메트릭)
+- admin.py: 운영/진단 API (락 경합, 느린 요청 프로파일, 메모리)
+- exports.py: 대량 내보내기 API (수강신청, 수강생 명단, 시간표)
+- imports.py: 대량 등록 API (행정 배정 수강신청)
+- preferences.py: 사전 신청 API (희망 강좌 순위 제출)
+- departments.py: 학과 조회 API (정원/신청 인원/충원율 집계)
 """
 
-from app.routes import health, students, courses, professors, enrollments
+from app.routes import health, students, courses, professors, enrollments, metrics, admin, exports, imports, preferences, departments
 
-__all__ = ["health", "students", "courses", "professors", "enrollments"]
\ No newline at end of file
+__all__ = ["health", "students", "courses", "professors", "enrollments", "metrics", "admin", "exports", "imports", "preferences", "departments"]
\ No newline at end of file
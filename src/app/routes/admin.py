@@ -0,0 +1,287 @@
+"""
+routes/admin.py - 운영/진단용 API
+"""
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.orm import Session
+
+from app.database import get_db, get_read_db, shard_router
+from app.services import enrollment_service
+from app.services.allocation_service import AllocationService
+from app.services.department_stats_service import department_stats, department_stats_verifier
+from app.services.enrollment_service import EnrollmentService
+from app.services.journal_service import JournalService, enrollment_state
+from app.services.reconciliation_service import reconciler
+from app.utils.db_retry import run_write_transaction
+from app.utils.exceptions import ProfileNotFoundException, ShardedModeNotSupportedException
+from app.utils.lock_stats import lock_stats
+from app.utils.memory import memory_tracker, CURRENT
+from app.utils.profiler import profiler
+from app.utils.rate_limit import enrollment_admission
+
+router = APIRouter(prefix="/api/v1/admin", tags=["admin"])
+
+
+# ==================== 락 경합 ====================
+@router.get("/locks")
+def get_lock_stats():
+    """
+    애플리케이션 락 경합 통계
+    
+    - 키 종류(course/student/session/enrollment)별 대기/보유 시간, 현재 대기자 수
+    - 대기 시간 기준 상위 N개 강좌 키
+    """
+    return lock_stats.snapshot(registry_size=len(enrollment_service._LOCKS))
+
+
+@router.post("/locks")
+def configure_lock_stats(
+    enabled: bool = Query(None, description="계측 활성화 여부"),
+    reset: bool = Query(False, description="누적 통계 초기화"),
+):
+    """락 계측 켜기/끄기 및 초기화"""
+    if enabled is not None:
+        lock_stats.enabled = enabled
+    if reset:
+        lock_stats.reset()
+    return lock_stats.snapshot(registry_size=len(enrollment_service._LOCKS))
+
+
+# ==================== 수강신청 입장 제어 ====================
+@router.get("/rate-limits")
+def get_rate_limit_status():
+    """
+    신청/취소 입장 제어 상태
+    
+    - 처리 중인 요청 수/상한, 학생별·IP별 토큰 버킷 키 수와 LRU 제거 수, 마감 강좌 캐시 크기
+    """
+    return enrollment_admission.status()
+
+
+# ==================== 느린 요청 프로파일 ====================
+def _profiler_state() -> dict:
+    return {
+        "enabled": profiler.enabled,
+        "interval_ms": profiler.interval * 1000,
+        "slow_threshold_ms": profiler.slow_threshold * 1000,
+        "sample_rate": profiler.sample_rate,
+        "profiles": [profile.summary() for profile in reversed(profiler.profiles)],
+    }
+
+
+def _collapsed_response(body: str, filename: str) -> PlainTextResponse:
+    return PlainTextResponse(
+        body,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/profiles")
+def list_profiles():
+    """
+    느린 요청 프로파일 목록 (최근 순)
+    
+    - 지연 시간이 임계값 이상이거나 샘플링된 요청만 링 버퍼에 보관
+    """
+    return _profiler_state()
+
+
+@router.post("/profiles")
+def configure_profiler(
+    enabled: bool = Query(None, description="프로파일러 활성화 여부"),
+    slow_threshold_ms: float = Query(None, ge=0, description="보관할 요청의 최소 지연 시간"),
+    sample_rate: float = Query(None, ge=0, le=1, description="무작위 보관 비율"),
+    clear: bool = Query(False, description="보관된 프로파일 삭제"),
+):
+    """프로파일러 설정 변경"""
+    if enabled is not None:
+        profiler.enabled = enabled
+    if slow_threshold_ms is not None:
+        profiler.slow_threshold = slow_threshold_ms / 1000.0
+    if sample_rate is not None:
+        profiler.sample_rate = sample_rate
+    if clear:
+        profiler.clear()
+    return _profiler_state()
+
+
+@router.get("/profiles/collapsed", response_class=PlainTextResponse)
+def download_merged_profile():
+    """보관된 모든 프로파일을 합친 collapsed stack (flamegraph.pl 입력)"""
+    return _collapsed_response(profiler.merged_collapsed(), "profiles.collapsed")
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+def download_profile(profile_id: int):
+    """단일 요청 프로파일 collapsed stack 다운로드"""
+    profile = profiler.get(profile_id)
+    if profile is None:
+        raise ProfileNotFoundException(profile_id)
+    return _collapsed_response(profile.collapsed(), f"profile-{profile_id}.collapsed")
+
+
+# ==================== 메모리 ====================
+@router.get("/memory")
+def get_memory_status():
+    """
+    메모리 계측 상태
+    
+    - tracemalloc 추적 여부/추적 중인 메모리, 저장된 스냅샷 이름
+    - 락 레지스트리 크기, 살아있는 ORM 세션 수, identity map 객체 수
+    """
+    return memory_tracker.status()
+
+
+@router.post("/memory/tracing")
+def configure_memory_tracing(
+    enabled: bool = Query(..., description="tracemalloc 추적 시작/중지"),
+    frames: int = Query(1, ge=1, le=50, description="할당 위치당 저장할 스택 깊이"),
+):
+    """tracemalloc 추적 시작/중지 (중지 시 스냅샷도 삭제)"""
+    if enabled:
+        memory_tracker.start(frames)
+    else:
+        memory_tracker.stop()
+    return memory_tracker.status()
+
+
+@router.post("/memory/snapshots")
+def take_memory_snapshot(name: str = Query(..., min_length=1, max_length=50)):
+    """이름 붙인 스냅샷 저장 (최근 10개 유지)"""
+    return memory_tracker.take_snapshot(name)
+
+
+@router.get("/memory/diff")
+def diff_memory_snapshots(
+    base: str = Query(..., description="기준 스냅샷 이름"),
+    target: str = Query(CURRENT, description="비교 대상 스냅샷 이름 (기본: 현재 시점)"),
+    top: int = Query(20, ge=1, le=200),
+    group_by: str = Query("lineno", pattern="^(lineno|filename)$"),
+):
+    """두 스냅샷 사이 할당 증가량 상위 N개 (파일/라인 단위)"""
+    return {
+        "base": base,
+        "target": target,
+        "group_by": group_by,
+        "stats": memory_tracker.diff(base, target, top, group_by),
+        "objects": memory_tracker.status()["objects"],
+    }
+
+
+# ==================== 수강신청 저널 ====================
+@router.get("/journal")
+def get_journal_status(db: Session = Depends(get_read_db)):
+    """
+    저널/스냅샷 상태
+    
+    - 인메모리 좌석/학생별 학점 상태 요약, 마지막 스냅샷 이후 이벤트 수(tail)
+    - 최신 스냅샷 정보
+    """
+    snapshot = JournalService.latest_snapshot(db)
+    return {
+        "state": enrollment_state.summary(),
+        "latest_snapshot": {
+            "id": snapshot.id,
+            "last_event_id": snapshot.last_event_id,
+            "events_folded": snapshot.events_folded,
+            "created_at": snapshot.created_at,
+        } if snapshot else None,
+    }
+
+
+@router.post("/journal/snapshots")
+def take_journal_snapshot(db: Session = Depends(get_db)):
+    """지금까지의 tail을 접어 스냅샷 저장 (새 이벤트가 없으면 `created=false`)"""
+    result = JournalService.take_snapshot(db)
+    return {"created": result is not None, "snapshot": result}
+
+
+# ==================== 신청 인원 정합성 점검 ====================
+@router.get("/reconciliation")
+def get_reconciliation_status():
+    """
+    Course.enrolled 정합성 점검 상태
+    
+    - 설정(주기/배치 크기/배치 간 대기/최대 점유율/자동 보정), 진행 중 여부
+    - 마지막 패스 결과 (불일치 강좌 수/좌석 차이 합/보정 수/예시)
+    """
+    return {
+        "interval_s": reconciler.interval_s,
+        "batch_size": reconciler.batch_size,
+        "pause_s": reconciler.pause_s,
+        "max_duty": reconciler.max_duty,
+        "repair": reconciler.repair,
+        "running": reconciler.running,
+        "last_pass": reconciler.last_pass,
+    }
+
+
+@router.post("/reconciliation/runs")
+def run_reconciliation(
+    repair: bool = Query(False, description="불일치 강좌를 실제 ENROLLED 수로 보정"),
+    read_db: Session = Depends(get_read_db),
+    write_db: Session = Depends(get_db),
+):
+    """전체 강좌 1회 점검 (백그라운드와 같은 배치/스로틀, 이미 진행 중이면 `started=false`)"""
+    result = reconciler.run_pass(read_db, write_db, repair=repair)
+    return {"started": result is not None, "result": result}
+
+
+# ==================== 학과별 집계 ====================
+@router.get("/department-stats")
+def get_department_stats_status():
+    """
+    학과별 집계 상태
+    
+    - 전체 합계(강좌 수/정원/신청 인원/충원율/마감 강좌 수), 적재 시각
+    - 검증 주기, 진행 중 여부, 마지막 검증 결과 (불일치 강좌 수/예시)
+    """
+    return {
+        "stats": department_stats.summary(),
+        "interval_s": department_stats_verifier.interval_s,
+        "running": department_stats_verifier.running,
+        "last_verification": department_stats_verifier.last_verification,
+    }
+
+
+@router.post("/department-stats/verifications")
+def verify_department_stats(read_db: Session = Depends(get_read_db)):
+    """전체 강좌 스캔으로 학과별 집계 1회 검증 (지난 검증과 같은 불일치 강좌는 교체, 이미 진행 중이면 `started=false`)"""
+    if shard_router.enabled:
+        raise ShardedModeNotSupportedException("department_stats", "Department statistics are not supported in department-sharded mode")
+    result = department_stats_verifier.verify(read_db)
+    return {"started": result is not None, "result": result}
+
+
+@router.put("/courses/{course_id}/capacity")
+def change_course_capacity(
+    course_id: int,
+    capacity: int = Query(..., ge=0, description="새 정원 (현재 신청 인원 이상)"),
+    db: Session = Depends(get_db),
+):
+    """강좌 정원 변경 (커밋되면 학과별 집계에 반영)"""
+    if shard_router.enabled:
+        raise ShardedModeNotSupportedException("capacity_change", "Capacity changes are not supported in department-sharded mode")
+    course = run_write_transaction(
+        db, "change_capacity", lambda: EnrollmentService.change_capacity(db, course_id, capacity)
+    )
+    enrollment_admission.full_courses.discard(course_id)
+    return {"course_id": course_id, "capacity": capacity, "enrolled": course.enrolled}
+
+
+# ==================== 사전 신청 일괄 배정 ====================
+@router.post("/allocations")
+def run_allocation(
+    seed: int = Query(None, description="추첨 시드 (생략 시 무작위, 결과에 기록)"),
+    db: Session = Depends(get_db),
+):
+    """
+    PENDING 희망 강좌 전체를 추첨 라운드 로빈으로 일괄 배정
+    
+    - 정원/학점 한도/시간 충돌/중복을 지키며 배정 결과를 `enrollments`에 한 번에 기록
+    - 희망 강좌마다 ALLOCATED 또는 REJECTED(+사유)로 갱신
+    - 같은 시드 + 같은 입력 → 같은 결과
+    """
+    if shard_router.enabled:
+        raise ShardedModeNotSupportedException("allocation", "Batch allocation is not supported in department-sharded mode")
+    return AllocationService.allocate(db, seed)
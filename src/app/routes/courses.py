@@ -2,27 +2,74 @@
 routes/courses.py - 강좌 관련 API
 """
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import and_
 
-from app.database import get_db
+from app.config import settings
+from app.database import get_read_db, shard_router
 from app.models import Course, Department, Schedule
-from app.schemas import CourseListResponse, CourseResponse
-from app.utils.exceptions import CourseNotFoundException
+from app.schemas import (
+    ConflictCheckRequest,
+    ConflictCheckResponse,
+    CourseListResponse,
+    CourseResponse,
+    TimetableRequest,
+    TimetableResponse,
+)
+from app.services.conflict_service import ConflictService
+from app.services.sharded_enrollment_service import ShardedEnrollmentService
+from app.services.timetable_service import TimetableService
+from app.utils.exceptions import CourseNotFoundException, ShardedModeNotSupportedException
+from app.utils.metrics import READ_COALESCED
+from app.utils.schedule_bits import sort_meetings
+from app.utils.single_flight import course_reads
 
 router = APIRouter(prefix="/api/v1/courses", tags=["courses"])
 
 
-def _format_schedule(schedule: Schedule) -> str:
-    """시간표를 문자열로 변환"""
-    if not schedule:
+def _format_schedule(schedules: list[Schedule]) -> str:
+    """시간표(수업 목록)를 문자열로 변환 ("MON 09:00-10:15, WED 09:00-10:15")"""
+    if not schedules:
         return None
-    return f"{schedule.day_of_week.value} {schedule.start_time.strftime('%H:%M')}-{schedule.end_time.strftime('%H:%M')}"
+    return ", ".join(
+        f"{schedule.day_of_week.value} {schedule.start_time.strftime('%H:%M')}-{schedule.end_time.strftime('%H:%M')}"
+        for schedule in sort_meetings(schedules)
+    )
+
+
+def _course_item(course: Course) -> dict:
+    """강좌 목록 항목 (CourseListResponse)"""
+    return {
+        "id": course.id,
+        "name": course.name,
+        "code": course.code,
+        "credits": course.credits,
+        "capacity": course.capacity,
+        "enrolled": course.enrolled,
+        "professor_id": course.professor_id,
+        "department_id": course.department_id,
+        "schedule": _format_schedule(course.schedules)
+    }
+
+
+def _coalesced(route: str, key: tuple, compute) -> Response:
+    """같은 키의 동시 요청은 조회 + JSON 직렬화 1번을 공유 (`READ_COALESCE_TTL_MS` 동안 결과 재사용)"""
+
+    def render() -> bytes:
+        return JSONResponse(jsonable_encoder(compute())).body
+
+    if not settings.read_coalesce_enabled:
+        return Response(render(), media_type="application/json")
+    body, result = course_reads.do(key, render, settings.read_coalesce_ttl_ms / 1000)
+    READ_COALESCED.inc(route, result)
+    return Response(body, media_type="application/json")
 
 
 @router.get("", response_model=list[CourseListResponse])
 def list_courses(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     department_id: int = Query(None, description="학과 ID (선택)"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000)
@@ -33,41 +80,84 @@ def list_courses(
     - `department_id`: 특정 학과의 강좌만 조회 (옵션)
     - `skip`: 페이징 오프셋
     - `limit`: 페이징 크기
+    
+    같은 조건의 동시 요청은 조회 1번을 공유합니다.
+    """
+
+    def compute():
+        if shard_router.enabled:
+            courses = ShardedEnrollmentService.list_courses(department_id, skip, limit)
+        else:
+            query = db.query(Course).options(selectinload(Course.schedules))
+            
+            if department_id:
+                query = query.filter(Course.department_id == department_id)
+            
+            courses = query.offset(skip).limit(limit).all()
+        
+        return [_course_item(course) for course in courses]
+
+    return _coalesced("list_courses", ("courses", department_id, skip, limit), compute)
+
+
+@router.post("/timetables", response_model=TimetableResponse)
+def build_timetables(
+    request: TimetableRequest,
+    db: Session = Depends(get_read_db)
+):
     """
-    query = db.query(Course)
+    시간 충돌 없는 시간표 조합 탐색
     
-    if department_id:
-        query = query.filter(Course.department_id == department_id)
+    - `groups`: 희망 그룹 목록 (그룹마다 분반 하나). `course_ids` 또는 분반 번호를 뺀 `name`
+      (예: "알고리즘" → "알고리즘 1", "알고리즘 2" ...), `optional`이면 빠져도 됨
+    - `student_id`: 주면 기존 신청 강좌를 고정으로 반영
+    - 빈자리가 있고 학점 한도 안인 조합을 최대 `max_results`개, `time_budget_ms` 안에서 반환
+    """
+    if shard_router.enabled:
+        raise ShardedModeNotSupportedException("timetable", "Timetable builder is not supported in sharded mode")
     
-    courses = query.offset(skip).limit(limit).all()
+    result = TimetableService.build(
+        db, request.groups, request.student_id, request.max_results, request.time_budget_ms
+    )
+    for combination in result["combinations"]:
+        combination["courses"] = [_course_item(course) for course in combination["courses"]]
+    return result
+
+
+@router.post("/conflicts", response_model=ConflictCheckResponse)
+def check_conflicts(
+    request: ConflictCheckRequest,
+    db: Session = Depends(get_read_db)
+):
+    """
+    후보 강좌 시간 충돌 조회 (미리 계산한 충돌 인접 비트셋)
     
-    result = []
-    for course in courses:
-        course_dict = {
-            "id": course.id,
-            "name": course.name,
-            "code": course.code,
-            "credits": course.credits,
-            "capacity": course.capacity,
-            "enrolled": course.enrolled,
-            "professor_id": course.professor_id,
-            "department_id": course.department_id,
-            "schedule": _format_schedule(course.schedule)
-        }
-        result.append(course_dict)
+    - `pairs`: 후보끼리 시간이 겹치는 쌍
+    - `timetable`: `student_id`의 신청 강좌와 겹치는 후보
+    - `conflict_free`: 어디와도 겹치지 않는 후보
+    """
+    if shard_router.enabled:
+        raise ShardedModeNotSupportedException("conflict_check", "Conflict check is not supported in sharded mode")
     
-    return result
+    return ConflictService.check(db, request.course_ids, request.student_id)
 
 
 @router.get("/{course_id}", response_model=CourseResponse)
 def get_course(
     course_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
-    """강좌 상세 조회"""
-    course = db.query(Course).filter(Course.id == course_id).first()
-    
-    if not course:
-        raise CourseNotFoundException(course_id)
-    
-    return course
\ No newline at end of file
+    """강좌 상세 조회 (같은 강좌의 동시 요청은 조회 1번을 공유)"""
+
+    def compute():
+        if shard_router.enabled:
+            course = ShardedEnrollmentService.get_course(course_id)
+        else:
+            course = db.query(Course).filter(Course.id == course_id).first()
+        
+        if not course:
+            raise CourseNotFoundException(course_id)
+        
+        return CourseResponse.model_validate(course)
+
+    return _coalesced("get_course", ("course", course_id), compute)
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""
+routes/departments.py - 학과 관련 API (정원/신청 인원/충원율 집계)
+"""
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.database import get_read_db, shard_router
+from app.models import Department
+from app.schemas import DepartmentResponse
+from app.services.department_stats_service import department_stats
+from app.utils.exceptions import DepartmentNotFoundException, ShardedModeNotSupportedException
+
+router = APIRouter(prefix="/api/v1/departments", tags=["departments"])
+
+
+def _department_item(department: Department) -> dict:
+    return {
+        "id": department.id,
+        "name": department.name,
+        "created_at": department.created_at,
+        **department_stats.department(department.id),
+    }
+
+
+def _ensure_stats(db: Session):
+    if shard_router.enabled:
+        raise ShardedModeNotSupportedException("department_stats", "Department statistics are not supported in department-sharded mode")
+    department_stats.ensure(db)
+
+
+@router.get("", response_model=list[DepartmentResponse])
+def list_departments(db: Session = Depends(get_read_db)):
+    """
+    학과 목록 + 학과별 집계
+    
+    - 강좌 수, 정원 합, 신청 인원 합, 충원율(신청/정원), 마감 강좌 수
+    - 집계는 메모리에서 증분 갱신된 값 (강좌 테이블을 스캔하지 않음)
+    """
+    _ensure_stats(db)
+    departments = db.query(Department).order_by(Department.id).all()
+    return [_department_item(department) for department in departments]
+
+
+@router.get("/{department_id}", response_model=DepartmentResponse)
+def get_department(department_id: int, db: Session = Depends(get_read_db)):
+    """학과 상세 + 집계"""
+    _ensure_stats(db)
+    department = db.get(Department, department_id)
+    if department is None:
+        raise DepartmentNotFoundException(department_id)
+    return _department_item(department)
@@ -1,23 +1,46 @@
 """
 routes/enrollments.py - 수강신청 관련 API (핵심)
 """
-from fastapi import APIRouter, Depends, Query, Header
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Header, Request
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_
 
-from app.database import get_db
+from app.database import get_db, get_read_db, get_schedule_db, shard_router
 from app.models import Enrollment, Student, Course, Schedule
+from app.routes.courses import _format_schedule
 from app.schemas import EnrollmentRequest, EnrollmentResponse, StudentScheduleResponse, CourseListResponse
 from app.services.enrollment_service import EnrollmentService
-from app.utils.exceptions import StudentNotFoundException, EnrollmentNotFoundException
+from app.services.sharded_enrollment_service import ShardedEnrollmentService
+from app.utils.exceptions import StudentNotFoundException, EnrollmentNotFoundException, CapacityExceededException
+from app.utils.metrics import ENROLLMENTS, CANCELLATIONS
+from app.utils.db_retry import run_write_transaction
+from app.utils.rate_limit import AdmissionSlot, enrollment_admission
 
 router = APIRouter(prefix="/api/v1/students", tags=["enrollments"])
 
 
-@router.post("/{student_id}/enrollments", response_model=EnrollmentResponse, status_code=201)
+async def _admit(request: Request, student_id: int):
+    """신청/취소 입장 제어 (스레드풀에 넣기 전 이벤트 루프에서 실행, 한도 초과 시 429)
+
+    자리는 라우트 본문이 끝날 때 반환하고, 본문이 실행되지 않은 경우(요청 검증 실패 등)에만
+    응답 후 여기서 반환합니다.
+    """
+    slot = enrollment_admission.admit(student_id, request.client.host if request.client else None)
+    try:
+        yield slot
+    finally:
+        slot.release()  # 라우트에서 이미 반환했으면 무시
+
+
+@router.post(
+    "/{student_id}/enrollments",
+    response_model=EnrollmentResponse,
+    status_code=201,
+)
 def enroll_course(
     student_id: int,
     request: EnrollmentRequest,
+    slot: AdmissionSlot = Depends(_admit),
     db: Session = Depends(get_db)
 ):
     """
@@ -27,24 +50,44 @@ def enroll_course(
     - `course_id`: 강좌 ID
     
     성공 시 201 Created, 실패 시 400/409 에러 반환
+    (DB 쓰기 잠금 재시도 소진 시 503 + Retry-After, 요청 한도 초과/과부하 시 429 + Retry-After)
     """
-    enrollment = EnrollmentService.enroll_course(
-        db=db,
-        student_id=student_id,
-        course_id=request.course_id
-    )
-    
-    # 트랜잭션 커밋
-    db.commit()
-    db.refresh(enrollment)
-    
-    return enrollment
+    with slot:
+        # 방금 정원 초과로 거절된 강좌는 DB 없이 같은 응답
+        enrollment_admission.check_full(request.course_id)
+        
+        # 학과별 샤딩 모드: 서비스가 코디네이터/샤드 트랜잭션을 직접 커밋
+        service = ShardedEnrollmentService if shard_router.enabled else EnrollmentService
+        
+        # 트랜잭션 커밋 (SQLITE_BUSY면 재시도)
+        try:
+            enrollment = run_write_transaction(
+                db,
+                "enroll",
+                lambda: service.enroll_course(
+                    db=db,
+                    student_id=student_id,
+                    course_id=request.course_id
+                ),
+            )
+        except CapacityExceededException as e:
+            enrollment_admission.full_courses.mark(request.course_id, e.capacity, e.enrolled)
+            raise
+        ENROLLMENTS.inc()
+        if not shard_router.enabled:
+            db.refresh(enrollment)
+        
+        return enrollment
 
 
-@router.delete("/{student_id}/enrollments/{enrollment_id}", response_model=EnrollmentResponse)
+@router.delete(
+    "/{student_id}/enrollments/{enrollment_id}",
+    response_model=EnrollmentResponse,
+)
 def cancel_enrollment(
     student_id: int,
     enrollment_id: int,
+    slot: AdmissionSlot = Depends(_admit),
     db: Session = Depends(get_db)
 ):
     """
@@ -53,22 +96,29 @@ def cancel_enrollment(
     - `student_id`: 학생 ID
     - `enrollment_id`: 수강신청 ID
     """
-    enrollment = EnrollmentService.cancel_enrollment(
-        db=db,
-        student_id=student_id,
-        enrollment_id=enrollment_id
-    )
-    
-    db.commit()
-    db.refresh(enrollment)
-    
-    return enrollment
+    with slot:
+        service = ShardedEnrollmentService if shard_router.enabled else EnrollmentService
+        enrollment = run_write_transaction(
+            db,
+            "cancel",
+            lambda: service.cancel_enrollment(
+                db=db,
+                student_id=student_id,
+                enrollment_id=enrollment_id
+            ),
+        )
+        CANCELLATIONS.inc()
+        if not shard_router.enabled:
+            db.refresh(enrollment)
+        enrollment_admission.full_courses.discard(enrollment.course_id)  # 자리가 생김
+        
+        return enrollment
 
 
 @router.get("/{student_id}/schedule", response_model=StudentScheduleResponse)
 def get_schedule(
     student_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_schedule_db)
 ):
     """
     학생의 이번 학기 시간표 조회
@@ -80,36 +130,42 @@ def get_schedule(
     if not student:
         raise StudentNotFoundException(student_id)
     
-    # 신청 강좌 조회
-    enrollments = db.query(Enrollment).filter(
-        and_(
-            Enrollment.student_id == student_id,
-            Enrollment.status == "ENROLLED"
+    # 신청 강좌 + 시간표 조회 (단일 JOIN + 시간표 eager load, 샤딩 모드는 학과 샤드 fan-out)
+    if shard_router.enabled:
+        enrolled_courses = ShardedEnrollmentService.get_enrolled_courses(db, student_id)
+    else:
+        enrolled_courses = (
+            db.query(Course)
+            .join(Enrollment, Enrollment.course_id == Course.id)
+            .options(joinedload(Course.schedules))
+            .filter(
+                and_(
+                    Enrollment.student_id == student_id,
+                    Enrollment.status == "ENROLLED"
+                )
+            )
+            .order_by(Enrollment.id)
+            .all()
         )
-    ).all()
     
     # 강좌 목록 + 시간표
     courses = []
     total_credits = 0
     
-    for enrollment in enrollments:
-        course = db.query(Course).filter(Course.id == enrollment.course_id).first()
-        if course:
-            schedule = db.query(Schedule).filter(Schedule.course_id == course.id).first()
-            
-            course_dict = CourseListResponse(
-                id=course.id,
-                name=course.name,
-                code=course.code,
-                credits=course.credits,
-                capacity=course.capacity,
-                enrolled=course.enrolled,
-                professor_id=course.professor_id,
-                department_id=course.department_id,
-                schedule=f"{schedule.day_of_week.value} {schedule.start_time.strftime('%H:%M')}-{schedule.end_time.strftime('%H:%M')}" if schedule else None
-            )
-            courses.append(course_dict)
-            total_credits += course.credits
+    for course in enrolled_courses:
+        course_dict = CourseListResponse(
+            id=course.id,
+            name=course.name,
+            code=course.code,
+            credits=course.credits,
+            capacity=course.capacity,
+            enrolled=course.enrolled,
+            professor_id=course.professor_id,
+            department_id=course.department_id,
+            schedule=_format_schedule(course.schedules)
+        )
+        courses.append(course_dict)
+        total_credits += course.credits
     
     return StudentScheduleResponse(
         student_id=student_id,
@@ -122,7 +178,7 @@ def get_schedule(
 @router.get("/{student_id}/enrollments", response_model=list[EnrollmentResponse])
 def list_enrollments(
     student_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     status: str = Query(None, description="상태 필터 (ENROLLED, CANCELLED)")
 ):
     """
@@ -135,6 +191,9 @@ def list_enrollments(
     if not student:
         raise StudentNotFoundException(student_id)
     
+    if shard_router.enabled:
+        return ShardedEnrollmentService.list_enrollments(student_id, status)
+    
     query = db.query(Enrollment).filter(Enrollment.student_id == student_id)
     
     if status:
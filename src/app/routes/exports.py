@@ -0,0 +1,87 @@
+"""
+routes/exports.py - 대량 내보내기 API (수강신청, 수강생 명단, 시간표)
+"""
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.database import get_read_db, shard_router
+from app.services.export_service import ExportService, MEDIA_TYPES
+from app.utils.exceptions import ShardedModeNotSupportedException
+
+router = APIRouter(prefix="/api/v1/exports", tags=["exports"])
+
+FORMAT_PATTERN = "^(csv|ndjson)$"
+STATUS_PATTERN = "^(ENROLLED|CANCELLED)$"
+
+
+def _export(
+    dataset: str,
+    fmt: str,
+    db: Session,
+    department_id: Optional[int],
+    course_id: Optional[int],
+    status: Optional[str],
+) -> StreamingResponse:
+    # 학과별 샤딩 모드: 수강신청이 샤드에, 학생이 코디네이터에 있어 한 스냅샷으로 조인 불가
+    if shard_router.enabled:
+        raise ShardedModeNotSupportedException("export", "Bulk export is not supported in department-sharded mode")
+
+    return StreamingResponse(
+        ExportService.stream(db.get_bind(), dataset, fmt, department_id, course_id, status),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{dataset}.{fmt}"'},
+    )
+
+
+@router.get("/enrollments")
+def export_enrollments(
+    format: str = Query("csv", pattern=FORMAT_PATTERN, description="csv | ndjson"),
+    department_id: int = Query(None, description="강좌 학과 ID (선택)"),
+    course_id: int = Query(None, description="강좌 ID (선택)"),
+    status: str = Query(None, pattern=STATUS_PATTERN, description="ENROLLED | CANCELLED (생략 시 전체)"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    전체 수강신청 내보내기 (스트리밍)
+    
+    - 컬럼: enrollment_id, student_id, course_id, department_id, status, enrolled_at, cancelled_at
+    - 수강신청 ID 순, 요청 시점의 스냅샷
+    """
+    return _export("enrollments", format, db, department_id, course_id, status)
+
+
+@router.get("/rosters")
+def export_rosters(
+    format: str = Query("csv", pattern=FORMAT_PATTERN, description="csv | ndjson"),
+    department_id: int = Query(None, description="강좌 학과 ID (선택)"),
+    course_id: int = Query(None, description="강좌 ID (선택)"),
+    status: str = Query(None, pattern=STATUS_PATTERN, description="ENROLLED | CANCELLED (기본 ENROLLED)"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    강좌별 수강생 명단 내보내기 (스트리밍)
+    
+    - 컬럼: course_id, course_code, course_name, student_id, student_number, student_name, email, enrolled_at
+    - 강좌 ID → 수강신청 ID 순
+    """
+    return _export("rosters", format, db, department_id, course_id, status)
+
+
+@router.get("/schedules")
+def export_schedules(
+    format: str = Query("csv", pattern=FORMAT_PATTERN, description="csv | ndjson"),
+    department_id: int = Query(None, description="강좌 학과 ID (선택)"),
+    course_id: int = Query(None, description="강좌 ID (선택)"),
+    status: str = Query(None, pattern=STATUS_PATTERN, description="ENROLLED | CANCELLED (기본 ENROLLED)"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    학생별 시간표 내보내기 (스트리밍)
+    
+    - 컬럼: student_id, student_number, course_id, course_code, course_name, credits, day_of_week, start_time, end_time
+    - 학생 ID → 수강신청 ID 순
+    """
+    return _export("schedules", format, db, department_id, course_id, status)
@@ -4,7 +4,8 @@ routes/health.py - 헬스 체크 엔드포인트
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from app.database import get_db
+from app.database import get_db, sqlite_profile
+from app.utils.pool_stats import pool_status
 import logging
 
 router = APIRouter(prefix="", tags=["health"])
@@ -33,3 +34,14 @@ def health_check(db: Session = Depends(get_db)):
             "message": str(e),
             "database": "disconnected"
         }
+
+
+@router.get("/health/pool", status_code=200)
+def pool_health():
+    """
+    DB 커넥션 풀 상태
+    
+    풀별 크기, 사용 중(checked_out)/오버플로 커넥션 수, 커넥션 획득 대기 시간, 타임아웃 수,
+    커넥션마다 적용되는 SQLite 성능 프로파일
+    """
+    return {"pools": pool_status(), "sqlite_profile": sqlite_profile}
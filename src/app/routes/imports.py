@@ -0,0 +1,55 @@
+"""
+routes/imports.py - 대량 등록 API (행정 배정 수강신청)
+"""
+import io
+import json
+import tempfile
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.database import get_db, shard_router
+from app.services.bulk_import_service import BulkImportService
+from app.utils.exceptions import ShardedModeNotSupportedException
+
+router = APIRouter(prefix="/api/v1/imports", tags=["imports"])
+
+# 요청 본문을 메모리에 두는 최대 크기 (넘으면 임시 파일로)
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+def _report(bind, spool, fmt: str):
+    """본문 행을 등록하며 오류 행/요약을 NDJSON으로 내보냄 (전용 세션)"""
+    db = Session(bind=bind, autoflush=False)
+    try:
+        with io.TextIOWrapper(spool, encoding="utf-8-sig", newline="") as lines:
+            for line in BulkImportService.run(db, lines, fmt):
+                yield json.dumps(line, ensure_ascii=False) + "\n"
+    finally:
+        db.close()
+
+
+@router.post("/enrollments")
+async def import_enrollments(
+    request: Request,
+    format: str = Query("csv", pattern="^(csv|ndjson)$", description="csv | ndjson"),
+    db: Session = Depends(get_db),
+):
+    """
+    수강신청 대량 등록 (전공 필수/재수강 등 행정 배정)
+    
+    - 본문: CSV(`student_id,course_id` 헤더) 또는 NDJSON 행
+    - 배치(`IMPORT_BATCH_ROWS`행)마다 쓰기 트랜잭션 1개로 학점/시간 충돌/중복/정원 검증 후 등록
+    - 응답: 실패한 행(`row`, `code`, `message`)을 NDJSON으로 스트리밍, 마지막 줄은 `{"summary": ...}`
+    """
+    if shard_router.enabled:
+        raise ShardedModeNotSupportedException("import", "Bulk import is not supported in department-sharded mode")
+
+    # 응답 스트리밍 중에는 요청 본문을 읽을 수 없으므로 먼저 받아 둠 (큰 본문은 디스크로)
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    async for chunk in request.stream():
+        spool.write(chunk)
+    spool.seek(0)
+
+    return StreamingResponse(_report(db.get_bind(), spool, format), media_type="application/x-ndjson")
@@ -0,0 +1,15 @@
+"""
+routes/metrics.py - Prometheus 메트릭 엔드포인트
+"""
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.utils.metrics import registry, CONTENT_TYPE
+
+router = APIRouter(prefix="", tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 텍스트 포맷 메트릭"""
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,49 @@
+"""
+routes/preferences.py - 사전 신청 API (희망 강좌 순위 제출)
+"""
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.database import get_db, get_read_db, shard_router
+from app.schemas import PreferenceRequest, PreferenceResponse
+from app.services.allocation_service import AllocationService
+from app.utils.db_retry import run_write_transaction
+from app.utils.exceptions import ShardedModeNotSupportedException
+
+router = APIRouter(prefix="/api/v1/students", tags=["preferences"])
+
+
+def _check_mode():
+    # 학과별 샤딩 모드: 강좌가 샤드에 있어 코디네이터에서 배정할 수 없음
+    if shard_router.enabled:
+        raise ShardedModeNotSupportedException("allocation", "Pre-registration is not supported in department-sharded mode")
+
+
+@router.put("/{student_id}/preferences", response_model=list[PreferenceResponse])
+def submit_preferences(
+    student_id: int,
+    request: PreferenceRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    희망 강좌 제출 (기존 목록을 교체)
+    
+    - `course_ids`: 1지망부터 순서대로 (중복 불가, 최대 `MAX_PREFERENCES`개)
+    - 제출 기간(`PREFERENCE_WINDOW_START` ~ `PREFERENCE_WINDOW_END`) 밖이면 409
+    """
+    _check_mode()
+    return run_write_transaction(
+        db,
+        "submit_preferences",
+        lambda: AllocationService.submit_preferences(db, student_id, request.course_ids),
+    )
+
+
+@router.get("/{student_id}/preferences", response_model=list[PreferenceResponse])
+def get_preferences(
+    student_id: int,
+    db: Session = Depends(get_read_db),
+):
+    """희망 강좌 목록 (순위순, 일괄 배정 후에는 결과/탈락 사유 포함)"""
+    _check_mode()
+    return AllocationService.get_preferences(db, student_id)
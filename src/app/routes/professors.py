@@ -4,7 +4,7 @@ routes/professors.py - 교수 관련 API
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_read_db
 from app.models import Professor
 from app.schemas import ProfessorResponse
 
@@ -13,7 +13,7 @@ router = APIRouter(prefix="/api/v1/professors", tags=["professors"])
 
 @router.get("", response_model=list[ProfessorResponse])
 def list_professors(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000)
 ):
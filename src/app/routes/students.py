@@ -4,7 +4,7 @@ routes/students.py - 학생 관련 API
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_read_db
 from app.models import Student
 from app.schemas import StudentResponse
 from app.utils.exceptions import StudentNotFoundException
@@ -14,7 +14,7 @@ router = APIRouter(prefix="/api/v1/students", tags=["students"])
 
 @router.get("", response_model=list[StudentResponse])
 def list_students(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000)
 ):
@@ -31,7 +31,7 @@ def list_students(
 @router.get("/{student_id}", response_model=StudentResponse)
 def get_student(
     student_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """학생 상세 조회"""
     student = db.query(Student).filter(Student.id == student_id).first()
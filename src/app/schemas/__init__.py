@@ -6,6 +6,16 @@ from app.schemas.professor import ProfessorResponse
 from app.schemas.course import ScheduleResponse, CourseResponse, CourseListResponse
 from app.schemas.student import StudentResponse, StudentWithEnrollmentsResponse, StudentScheduleResponse
 from app.schemas.enrollment import EnrollmentRequest, EnrollmentResponse, EnrollmentCancelRequest
+from app.schemas.preference import PreferenceRequest, PreferenceResponse
+from app.schemas.timetable import (
+    TimetableGroup,
+    TimetableRequest,
+    TimetableCombination,
+    TimetableResponse,
+    ConflictCheckRequest,
+    TimetableConflict,
+    ConflictCheckResponse,
+)
 
 __all__ = [
     "DepartmentResponse",
@@ -19,6 +29,15 @@ __all__ = [
     "EnrollmentRequest",
     "EnrollmentResponse",
     "EnrollmentCancelRequest",
+    "PreferenceRequest",
+    "PreferenceResponse",
+    "TimetableGroup",
+    "TimetableRequest",
+    "TimetableCombination",
+    "TimetableResponse",
+    "ConflictCheckRequest",
+    "TimetableConflict",
+    "ConflictCheckResponse",
 ]
 
 # Forward refs
@@ -30,7 +30,7 @@ class CourseResponse(BaseModel):
     enrolled: int
     professor_id: int
     department_id: int
-    schedule: Optional[ScheduleResponse] = None
+    schedules: list[ScheduleResponse] = []  # 수업 (요일/시작 순)
     created_at: datetime
 
     class Config:
@@ -47,7 +47,7 @@ class CourseListResponse(BaseModel):
     enrolled: int
     professor_id: int
     department_id: int
-    schedule: Optional[str] = None  # "월 09:00-10:30" 형식
+    schedule: Optional[str] = None  # "MON 09:00-10:15, WED 09:00-10:15" 형식 (수업마다, 요일/시작 순)
 
     class Config:
         from_attributes = True
@@ -6,10 +6,15 @@ from datetime import datetime
 
 
 class DepartmentResponse(BaseModel):
-    """학과 응답"""
+    """학과 응답 (정원/신청 인원 집계 포함)"""
     id: int
     name: str
     created_at: datetime
+    courses: int = 0
+    capacity: int = 0
+    enrolled: int = 0
+    fill_rate: float = 0.0  # enrolled / capacity
+    full_courses: int = 0  # 신청 인원이 정원에 도달한 강좌 수
 
     class Config:
         from_attributes = True
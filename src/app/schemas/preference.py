@@ -0,0 +1,32 @@
+"""
+Preference schemas.
+"""
+from pydantic import BaseModel, Field, field_validator
+from typing import Optional
+
+from app.config import settings
+
+
+class PreferenceRequest(BaseModel):
+    """희망 강좌 제출 요청 (앞쪽이 높은 순위)"""
+    course_ids: list[int] = Field(..., min_length=1, description="희망 강좌 ID (1지망부터)")
+
+    @field_validator("course_ids")
+    @classmethod
+    def check_course_ids(cls, course_ids: list[int]) -> list[int]:
+        if len(course_ids) > settings.max_preferences:
+            raise ValueError(f"at most {settings.max_preferences} preferences")
+        if len(set(course_ids)) != len(course_ids):
+            raise ValueError("duplicate course ids")
+        return course_ids
+
+
+class PreferenceResponse(BaseModel):
+    """희망 강좌 (배정 결과 포함)"""
+    course_id: int
+    rank: int
+    status: str  # PENDING, ALLOCATED, REJECTED
+    reason: Optional[str] = None
+
+    class Config:
+        from_attributes = True
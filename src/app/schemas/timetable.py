@@ -0,0 +1,65 @@
+"""
+Timetable schemas.
+"""
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional
+
+from app.schemas.course import CourseListResponse
+
+
+class TimetableGroup(BaseModel):
+    """희망 그룹 (이 중 분반 하나)"""
+    course_ids: list[int] = Field(default_factory=list, max_length=50, description="후보 강좌 ID")
+    name: Optional[str] = Field(None, min_length=1, max_length=100, description="분반 번호를 뺀 강좌명 (예: 알고리즘)")
+    optional: bool = Field(False, description="조합에서 빠져도 되는 그룹")
+
+    @model_validator(mode="after")
+    def check_candidates(self):
+        if not self.course_ids and not self.name:
+            raise ValueError("either course_ids or name is required")
+        return self
+
+
+class TimetableRequest(BaseModel):
+    """시간표 조합 탐색 요청"""
+    groups: list[TimetableGroup] = Field(..., min_length=1, max_length=20)
+    student_id: Optional[int] = Field(None, gt=0, description="기존 신청 강좌를 고정으로 반영할 학생 ID")
+    max_results: int = Field(5, ge=1, le=50, description="최대 조합 수 (K)")
+    time_budget_ms: Optional[float] = Field(None, gt=0, le=2000, description="탐색 시간 예산 (기본 설정값)")
+
+
+class TimetableCombination(BaseModel):
+    """충돌 없는 조합 1개"""
+    course_ids: list[int]
+    total_credits: int  # 기존 신청 학점 포함
+    courses: list[CourseListResponse]
+
+
+class TimetableResponse(BaseModel):
+    """시간표 조합 탐색 응답"""
+    combinations: list[TimetableCombination]
+    empty_groups: list[int]  # 가능한 분반이 없는 필수 그룹 (요청 순서 인덱스)
+    explored: int  # 탐색 노드 수
+    complete: bool  # 탐색 공간을 끝까지 봤는지
+    timed_out: bool
+    elapsed_ms: float
+
+
+class ConflictCheckRequest(BaseModel):
+    """후보 강좌 시간 충돌 조회 요청"""
+    course_ids: list[int] = Field(..., min_length=1, max_length=100)
+    student_id: Optional[int] = Field(None, gt=0, description="신청 강좌와의 충돌도 볼 학생 ID")
+
+
+class TimetableConflict(BaseModel):
+    """학생 신청 강좌와 겹치는 후보"""
+    course_id: int
+    conflicts_with: list[int]
+
+
+class ConflictCheckResponse(BaseModel):
+    """후보 강좌 시간 충돌 조회 응답"""
+    pairs: list[list[int]]  # 후보끼리 겹치는 쌍 (요청 순서)
+    timetable: list[TimetableConflict]
+    conflict_free: list[int]  # 후보끼리도, 신청 강좌와도 겹치지 않는 후보
+    unscheduled: list[int]  # 시간표 없는 후보
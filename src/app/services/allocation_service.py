@@ -0,0 +1,221 @@
+"""
+services/allocation_service.py - 사전 신청 (희망 강좌 순위 제출) + 추첨 일괄 배정
+
+선착순 대신 제출 기간 동안 학생별 희망 강좌 순위를 받고, 기간이 끝나면
+일괄 배정을 한 번 실행해 결과를 `enrollments`에 한꺼번에 기록합니다.
+
+배정 방식 (라운드 로빈 추첨):
+- 학생 순서를 시드로 섞고, r번째 라운드에서 모든 학생의 r지망을 차례로 처리
+  (홀수 라운드는 역순 → 앞 순번 학생이 모든 라운드에서 유리하지 않게)
+- 정원/학점 한도(`max_credits_per_semester`)/시간 충돌/중복을 확인해 배정 또는 탈락
+- 시간 충돌은 학생 시간표 비트마스크와 강좌 마스크의 AND 한 번 (utils/schedule_bits.py)
+
+계산과 기록은 쓰기 트랜잭션 1개 안에서 하므로 배정은 원자적이고, 같은 시드로
+같은 입력을 배정하면 같은 결과가 나옵니다.
+"""
+import logging
+import random
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import begin_write
+from app.models import Course, CoursePreference, Enrollment, Student
+from app.services.bulk_import_service import BulkImportService
+from app.utils.db_retry import run_write_transaction
+from app.utils.exceptions import (
+    CourseNotFoundException,
+    PreferenceWindowClosedException,
+    StudentNotFoundException,
+)
+from app.utils.metrics import registry
+from app.utils.schedule_bits import load_course_masks
+
+logger = logging.getLogger(__name__)
+
+PENDING = "PENDING"
+ALLOCATED = "ALLOCATED"
+REJECTED = "REJECTED"
+
+ALLOCATION_RESULTS = registry.counter(
+    "allocation_preferences_total",
+    "Preferences processed by batch allocation",
+    ("result",),
+)
+
+
+def preference_window_open(now: datetime = None) -> bool:
+    """희망 강좌 제출 기간 여부 (설정이 없으면 항상 열림)"""
+    now = now or datetime.utcnow()
+    start, end = settings.preference_window_start, settings.preference_window_end
+    return (start is None or now >= start) and (end is None or now < end)
+
+
+class AllocationService:
+    """희망 강좌 제출/일괄 배정"""
+
+    @staticmethod
+    def submit_preferences(db: Session, student_id: int, course_ids: list[int]) -> list[CoursePreference]:
+        """학생의 희망 강좌 목록을 순위대로 교체 (현재 트랜잭션, 커밋은 호출자)"""
+        if not preference_window_open():
+            raise PreferenceWindowClosedException(settings.preference_window_start, settings.preference_window_end)
+
+        begin_write(db)
+        if db.get(Student, student_id) is None:
+            raise StudentNotFoundException(student_id)
+        found = set(db.scalars(select(Course.id).where(Course.id.in_(course_ids))))
+        missing = [course_id for course_id in course_ids if course_id not in found]
+        if missing:
+            raise CourseNotFoundException(missing[0])
+
+        db.execute(delete(CoursePreference).where(CoursePreference.student_id == student_id))
+        preferences = [
+            CoursePreference(student_id=student_id, course_id=course_id, rank=rank)
+            for rank, course_id in enumerate(course_ids, start=1)
+        ]
+        db.add_all(preferences)
+        db.flush()
+        return preferences
+
+    @staticmethod
+    def get_preferences(db: Session, student_id: int) -> list[CoursePreference]:
+        if db.get(Student, student_id) is None:
+            raise StudentNotFoundException(student_id)
+        return (
+            db.query(CoursePreference)
+            .filter(CoursePreference.student_id == student_id)
+            .order_by(CoursePreference.rank)
+            .all()
+        )
+
+    @staticmethod
+    def _allocate(db: Session, seed: int) -> tuple:
+        """PENDING 희망을 배정 → (배정 목록 [(학생, 강좌, 학점)], 결과 {(학생, 강좌): (상태, 사유)}, 라운드 수)"""
+        wishes: dict[int, list[int]] = {}
+        for student_id, course_id in db.execute(
+            select(CoursePreference.student_id, CoursePreference.course_id)
+            .where(CoursePreference.status == PENDING)
+            .order_by(CoursePreference.student_id, CoursePreference.rank)
+        ):
+            wishes.setdefault(student_id, []).append(course_id)
+
+        course_ids = {course_id for courses in wishes.values() for course_id in courses}
+        seats, credits_of = {}, {}
+        for course_id, capacity, enrolled, credits in db.execute(
+            select(Course.id, Course.capacity, Course.enrolled, Course.credits).where(Course.id.in_(course_ids))
+        ):
+            seats[course_id] = capacity - enrolled
+            credits_of[course_id] = credits
+
+        # 이미 신청된 강좌(행정 배정 등)를 학생별 학점/시간표/강좌 집합에 반영
+        enrolled_rows = db.execute(
+            select(Enrollment.student_id, Enrollment.course_id, Course.credits)
+            .join(Course, Course.id == Enrollment.course_id)
+            .where(Enrollment.status == "ENROLLED")
+        ).all()
+        masks = load_course_masks(db)
+        credits = {student_id: 0 for student_id in wishes}
+        timetable = {student_id: 0 for student_id in wishes}
+        taken = {student_id: set() for student_id in wishes}
+        for student_id, course_id, course_credits in enrolled_rows:
+            if student_id in wishes:
+                credits[student_id] += course_credits
+                timetable[student_id] |= masks.get(course_id, 0)
+                taken[student_id].add(course_id)
+
+        order = sorted(wishes)
+        random.Random(seed).shuffle(order)
+        limit = settings.max_credits_per_semester
+        allocated, results = [], {}
+        rounds = max((len(courses) for courses in wishes.values()), default=0)
+
+        for rank in range(rounds):
+            for student_id in (order if rank % 2 == 0 else reversed(order)):
+                courses = wishes[student_id]
+                if rank >= len(courses):
+                    continue
+                course_id = courses[rank]
+                mask = masks.get(course_id, 0)
+                if course_id not in seats:
+                    reason = "COURSE_NOT_FOUND"
+                elif course_id in taken[student_id]:
+                    reason = "ALREADY_ENROLLED"
+                elif credits[student_id] + credits_of[course_id] > limit:
+                    reason = "CREDIT_EXCEEDED"
+                elif timetable[student_id] & mask:
+                    reason = "TIME_CONFLICT"
+                elif seats[course_id] <= 0:
+                    reason = "CAPACITY_EXCEEDED"
+                else:
+                    seats[course_id] -= 1
+                    credits[student_id] += credits_of[course_id]
+                    timetable[student_id] |= mask
+                    taken[student_id].add(course_id)
+                    allocated.append((student_id, course_id, credits_of[course_id]))
+                    results[(student_id, course_id)] = (ALLOCATED, None)
+                    continue
+                results[(student_id, course_id)] = (REJECTED, reason)
+
+        return allocated, results, rounds
+
+    @staticmethod
+    def allocate(db: Session, seed: Optional[int] = None) -> dict:
+        """PENDING 희망 전체를 일괄 배정하고 수강신청/희망 상태를 한 트랜잭션으로 기록"""
+        seed = seed if seed is not None else random.randrange(2 ** 32)
+        start = time.perf_counter()
+        timings = {}
+
+        def work():
+            begin_write(db)
+            compute_start = time.perf_counter()
+            allocated, results, rounds = AllocationService._allocate(db, seed)
+            timings["allocate_s"] = time.perf_counter() - compute_start
+
+            write_start = time.perf_counter()
+            BulkImportService.write_enrollments(db, allocated)
+            if results:
+                preferences = CoursePreference.__table__
+                db.connection().execute(
+                    update(preferences)
+                    .where(
+                        preferences.c.student_id == bindparam("b_student"),
+                        preferences.c.course_id == bindparam("b_course"),
+                    )
+                    .values(status=bindparam("b_status"), reason=bindparam("b_reason")),
+                    [
+                        {"b_student": student_id, "b_course": course_id, "b_status": status, "b_reason": reason}
+                        for (student_id, course_id), (status, reason) in results.items()
+                    ],
+                )
+            timings["write_s"] = time.perf_counter() - write_start
+            return allocated, results, rounds
+
+        allocated, results, rounds = run_write_transaction(db, "allocation", work)
+
+        rejected = Counter(reason for status, reason in results.values() if status == REJECTED)
+        ALLOCATION_RESULTS.inc(ALLOCATED, amount=len(allocated))
+        for reason, count in rejected.items():
+            ALLOCATION_RESULTS.inc(reason, amount=count)
+
+        summary = {
+            "seed": seed,
+            "students": len({student_id for student_id, _ in results}),
+            "preferences": len(results),
+            "rounds": rounds,
+            "allocated": len(allocated),
+            "rejected": dict(rejected),
+            "allocate_s": round(timings.get("allocate_s", 0.0), 4),
+            "write_s": round(timings.get("write_s", 0.0), 4),
+            "elapsed_s": round(time.perf_counter() - start, 4),
+        }
+        logger.info(
+            "🎲 일괄 배정 완료: 희망 %d건 중 %d건 배정 (seed=%s, %.2f초)",
+            summary["preferences"], summary["allocated"], seed, summary["elapsed_s"],
+            extra={"seed": seed, "allocated": summary["allocated"]},
+        )
+        return summary
@@ -0,0 +1,278 @@
+"""
+services/bulk_import_service.py - 수강신청 대량 등록 (전공 필수/재수강 등 행정 배정)
+
+CSV(`student_id,course_id` 헤더) 또는 NDJSON(`{"student_id": 1, "course_id": 2}`) 행을
+`import_batch_rows`행씩 묶어 배치마다 쓰기 트랜잭션 1개로 처리합니다.
+
+- 배치 안의 학생/강좌/기존 신청(학점, 시간표)을 IN 조회 몇 번으로 읽고
+  학점 한도/시간 충돌/중복/정원을 학생별로 메모리에서 한꺼번에 검증 (입력 순서대로 선착순,
+  시간 충돌은 학생별 요일 구간 인덱스 utils/interval_index.py)
+- 정원은 강좌별 증가분을 조건부 UPDATE executemany 1번으로 반영
+  (`enrolled + n <= capacity`, 쓰기 잠금 아래에서 읽은 값이라 항상 성립해야 함)
+- 수강신청/저널 이벤트는 INSERT ... RETURNING executemany로 한 번에 추가
+- 실패한 행만 NDJSON 보고서로 내보내고 마지막에 요약 1줄
+
+CLI:
+    PYTHONPATH=src python -m app.services.bulk_import_service enrollments.csv --report errors.ndjson
+"""
+import argparse
+import csv
+import json
+import logging
+import sys
+import time
+from collections import Counter
+from typing import Iterable, Iterator
+
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import begin_write
+from app.models import Course, Enrollment, Schedule, Student
+from app.services.data_stats_service import data_stats
+from app.services.department_stats_service import department_stats
+from app.services.journal_service import JournalService, ENROLL
+from app.utils.db_retry import run_write_transaction
+from app.utils.exceptions import BusinessException
+from app.utils.interval_index import IntervalIndex
+from app.utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+IMPORT_ROWS = registry.counter(
+    "bulk_import_rows_total",
+    "Rows processed by bulk enrollment import",
+    ("result",),
+)
+
+
+def _error(row_no: int, student_id, course_id, code: str, message: str) -> dict:
+    return {"row": row_no, "student_id": student_id, "course_id": course_id, "code": code, "message": message}
+
+
+def parse_rows(lines: Iterable[str], fmt: str) -> Iterator[tuple]:
+    """입력 행 → (행 번호, student_id, course_id, 오류 dict 또는 None)"""
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        records = ((reader.line_num, record) for record in reader)
+    else:
+        records = ((row_no, line) for row_no, line in enumerate(lines, start=1) if line.strip())
+
+    for row_no, record in records:
+        try:
+            if fmt == "ndjson":
+                record = json.loads(record)
+            student_id, course_id = int(record["student_id"]), int(record["course_id"])
+        except (ValueError, KeyError, TypeError) as e:
+            yield row_no, None, None, _error(row_no, None, None, "INVALID_ROW", f"Cannot parse row: {e}")
+            continue
+        yield row_no, student_id, course_id, None
+
+
+class BulkImportService:
+    """수강신청 대량 등록"""
+
+    @staticmethod
+    def _validate(db: Session, rows: list) -> tuple:
+        """배치 검증 → (등록할 (행 번호, 학생, 강좌, 학점) 목록, 오류 목록)"""
+        student_ids = {student_id for _, student_id, _ in rows}
+        course_ids = {course_id for _, _, course_id in rows}
+
+        students = set(db.scalars(select(Student.id).where(Student.id.in_(student_ids))))
+        courses = {
+            row.id: row
+            for row in db.execute(
+                select(Course.id, Course.credits, Course.capacity, Course.enrolled).where(Course.id.in_(course_ids))
+            )
+        }
+
+        # 학생별 [신청 학점, 신청 강좌 ID 집합, 요일별 수업 구간 인덱스]
+        loads = {student_id: [0, set(), IntervalIndex()] for student_id in students}
+        current = db.execute(
+            select(Enrollment.student_id, Enrollment.course_id, Course.credits)
+            .join(Course, Course.id == Enrollment.course_id)
+            .where(Enrollment.student_id.in_(students), Enrollment.status == "ENROLLED")
+        ).all()
+        meetings: dict[int, list] = {}
+        for row in db.execute(
+            select(Schedule.course_id, Schedule.day_of_week, Schedule.start_time, Schedule.end_time)
+            .where(Schedule.course_id.in_(course_ids | {row.course_id for row in current}))
+        ):
+            meetings.setdefault(row.course_id, []).append(row)
+        for row in current:
+            load = loads[row.student_id]
+            load[0] += row.credits
+            load[1].add(row.course_id)
+            load[2].add_meetings(row.course_id, meetings.get(row.course_id, ()))
+
+        remaining = {course_id: row.capacity - row.enrolled for course_id, row in courses.items()}
+        accepted, errors = [], []
+        for row_no, student_id, course_id in rows:
+            course = courses.get(course_id)
+            if student_id not in students:
+                errors.append(_error(row_no, student_id, course_id, "STUDENT_NOT_FOUND", f"Student not found (id: {student_id})"))
+                continue
+            if course is None:
+                errors.append(_error(row_no, student_id, course_id, "COURSE_NOT_FOUND", f"Course not found (id: {course_id})"))
+                continue
+
+            credits, enrolled, timetable = loads[student_id]
+            if course_id in enrolled:
+                errors.append(_error(row_no, student_id, course_id, "ALREADY_ENROLLED", "Already enrolled in this course"))
+                continue
+            if credits + course.credits > settings.max_credits_per_semester:
+                errors.append(_error(
+                    row_no, student_id, course_id, "CREDIT_EXCEEDED",
+                    f"Credit limit exceeded. Current: {credits}, Adding: {course.credits}, Max: {settings.max_credits_per_semester}",
+                ))
+                continue
+            conflicts = timetable.conflicts(meetings.get(course_id, ()))
+            if conflicts:
+                errors.append(_error(
+                    row_no, student_id, course_id, "TIME_CONFLICT",
+                    f"Time conflict with course {conflicts[0]}",
+                ))
+                continue
+            if remaining[course_id] <= 0:
+                errors.append(_error(
+                    row_no, student_id, course_id, "CAPACITY_EXCEEDED",
+                    f"This course is full (capacity: {course.capacity})",
+                ))
+                continue
+
+            remaining[course_id] -= 1
+            loads[student_id][0] += course.credits
+            enrolled.add(course_id)
+            timetable.add_meetings(course_id, meetings.get(course_id, ()))
+            accepted.append((row_no, student_id, course_id, course.credits))
+
+        return accepted, errors
+
+    @staticmethod
+    def write_enrollments(db: Session, accepted: list) -> list:
+        """검증을 마친 (student_id, course_id, credits) 목록을 현재 쓰기 트랜잭션에 한 번에 반영 → 수강신청 ID
+
+        정원은 강좌별 증가분을 조건부 UPDATE executemany 1번으로 올리고, 조건이 맞지 않는
+        강좌가 있으면 RuntimeError (호출자가 쓰기 잠금 아래에서 읽은 값으로 검증했어야 함)
+        """
+        if not accepted:
+            return []
+        conn = db.connection()
+        seats = Counter(course_id for _, course_id, _ in accepted)
+        courses = Course.__table__
+        result = conn.execute(
+            update(courses)
+            .where(courses.c.id == bindparam("b_id"), courses.c.enrolled + bindparam("b_n") <= courses.c.capacity)
+            .values(enrolled=courses.c.enrolled + bindparam("b_n")),
+            [{"b_id": course_id, "b_n": n} for course_id, n in seats.items()],
+        )
+        if result.rowcount != len(seats):
+            raise RuntimeError(f"capacity update mismatch ({result.rowcount}/{len(seats)})")
+
+        enrollments = Enrollment.__table__
+        enrollment_ids = conn.execute(
+            insert(enrollments).returning(enrollments.c.id, sort_by_parameter_order=True),
+            [{"student_id": student_id, "course_id": course_id, "status": "ENROLLED"}
+             for student_id, course_id, _ in accepted],
+        ).scalars().all()
+        JournalService.record_many(db, [
+            (ENROLL, enrollment_id, student_id, course_id, credits)
+            for enrollment_id, (student_id, course_id, credits) in zip(enrollment_ids, accepted)
+        ])
+        department_stats.record_many(db, dict(seats))
+        data_stats.record(db, "enrollments", len(accepted))
+        return enrollment_ids
+
+    @staticmethod
+    def apply_batch(db: Session, rows: list) -> tuple:
+        """(행 번호, student_id, course_id) 배치를 쓰기 트랜잭션 1개로 등록 → (등록 수, 오류 목록)"""
+
+        def work():
+            begin_write(db)
+            accepted, errors = BulkImportService._validate(db, rows)
+            BulkImportService.write_enrollments(db, [row[1:] for row in accepted])
+            return len(accepted), errors
+
+        try:
+            return run_write_transaction(db, "bulk_import", work)
+        except BusinessException as e:
+            # 배치 전체 실패 (예: 쓰기 잠금 재시도 소진) → 배치의 모든 행을 오류로 보고
+            return 0, [_error(row_no, sid, cid, e.error_code, e.message) for row_no, sid, cid in rows]
+
+    @staticmethod
+    def run(db: Session, lines: Iterable[str], fmt: str, batch_rows: int = None) -> Iterator[dict]:
+        """입력을 배치 단위로 등록하며 오류 행을 내보내고, 마지막에 `{"summary": ...}`"""
+        batch_rows = batch_rows or settings.import_batch_rows
+        start = time.perf_counter()
+        summary = {"rows": 0, "imported": 0, "errors": 0, "batches": 0}
+        batch = []
+
+        def flush():
+            imported, errors = BulkImportService.apply_batch(db, batch)
+            summary["batches"] += 1
+            summary["imported"] += imported
+            summary["errors"] += len(errors)
+            IMPORT_ROWS.inc("imported", amount=imported)
+            for error in errors:
+                IMPORT_ROWS.inc(error["code"])
+            batch.clear()
+            return errors
+
+        for row_no, student_id, course_id, error in parse_rows(lines, fmt):
+            summary["rows"] += 1
+            if error:
+                summary["errors"] += 1
+                IMPORT_ROWS.inc(error["code"])
+                yield error
+                continue
+            batch.append((row_no, student_id, course_id))
+            if len(batch) >= batch_rows:
+                yield from flush()
+        if batch:
+            yield from flush()
+
+        summary["elapsed_s"] = round(time.perf_counter() - start, 3)
+        logger.info(
+            "📥 수강신청 대량 등록: %d행 중 %d건 등록, 오류 %d건 (%.2f초)",
+            summary["rows"], summary["imported"], summary["errors"], summary["elapsed_s"],
+        )
+        yield {"summary": summary}
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description="수강신청 대량 등록 (CSV/NDJSON)")
+    parser.add_argument("path", help="입력 파일 (- 이면 stdin)")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, help="생략 시 확장자로 판단 (.ndjson/.jsonl → ndjson)")
+    parser.add_argument("--batch-rows", type=int, default=settings.import_batch_rows)
+    parser.add_argument("--report", help="오류 보고서(NDJSON) 저장 경로 (생략 시 stdout)")
+    args = parser.parse_args(argv)
+
+    from app.database import SessionLocal, init_db
+
+    fmt = args.format or ("ndjson" if args.path.endswith((".ndjson", ".jsonl")) else "csv")
+    source = sys.stdin if args.path == "-" else open(args.path, encoding="utf-8-sig", newline="")
+    report = open(args.report, "w", encoding="utf-8") if args.report else sys.stdout
+
+    init_db()
+    db = SessionLocal()
+    summary = {}
+    try:
+        for line in BulkImportService.run(db, source, fmt, args.batch_rows):
+            summary = line.get("summary", summary)
+            report.write(json.dumps(line, ensure_ascii=False) + "\n")
+    finally:
+        db.close()
+        if source is not sys.stdin:
+            source.close()
+        if report is not sys.stdout:
+            report.close()
+
+    print(f"✅ {summary}", file=sys.stderr)
+    return summary
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+"""
+services/conflict_service.py - 강좌 간 시간 충돌 인접 비트셋 (학기 중 고정된 시간표를 한 번만 계산)
+
+시간표는 학기 내내 바뀌지 않으므로 신청 때마다 시간표를 다시 읽어 쌍별로 비교하지 않고,
+시작 시 `schedules`에서 한 번 만들어 두고 시간표가 바뀐 트랜잭션이 커밋되면 백그라운드에서 다시 만듭니다.
+
+- 강좌마다 시간표 비트마스크(utils/schedule_bits.py)를 구하고, 같은 마스크를 가진 강좌를
+  "패턴" 하나로 묶음 (생성 데이터 기준 강좌 500개 → 패턴 72개)
+- 패턴 i의 인접 비트셋: i와 겹치는 패턴 j마다 j번 비트 (칸별 패턴 비트셋의 OR로 계산)
+- 두 강좌 충돌 = `adjacency[pattern(a)] >> pattern(b) & 1`, 강좌 X와 충돌하는 전체 강좌 =
+  인접 비트셋에 켜진 패턴의 강좌 목록
+
+비트마스크는 5분 경계로 바깥쪽 반올림하므로 비트셋은 후보만 고르고(prefilter),
+후보는 실제 수업 시각으로 요일별 구간 인덱스(utils/interval_index.py)에서 다시 확인합니다. (`confirm`)
+
+`EnrollmentService`의 시간 충돌 검사와 `POST /api/v1/courses/conflicts`가 사용합니다.
+"""
+import logging
+import threading
+import time
+from typing import Iterable, NamedTuple, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.database import after_commit
+from app.models import Course, Enrollment, Schedule, Student
+from app.utils.exceptions import CourseNotFoundException, StudentNotFoundException
+from app.utils.interval_index import IntervalIndex
+from app.utils.schedule_bits import load_course_masks
+
+logger = logging.getLogger(__name__)
+
+REFRESH_KEY = "conflict_index_refresh"
+
+
+def _bits(value: int):
+    """켜진 비트 번호"""
+    while value:
+        low = value & -value
+        yield low.bit_length() - 1
+        value ^= low
+
+
+def load_meetings(db: Session, course_ids: Iterable[int]) -> dict:
+    """강좌 ID → 수업(Schedule) 목록"""
+    meetings: dict[int, list] = {}
+    for schedule in db.scalars(select(Schedule).where(Schedule.course_id.in_(list(course_ids)))):
+        meetings.setdefault(schedule.course_id, []).append(schedule)
+    return meetings
+
+
+def meetings_overlap(meetings_a, meetings_b) -> bool:
+    """두 수업 목록이 실제 시각으로 겹치는지 (맞닿는 수업은 충돌 아님)"""
+    index = IntervalIndex()
+    index.add_meetings(None, meetings_a)
+    return bool(index.conflicts(meetings_b))
+
+
+class _Snapshot(NamedTuple):
+    """한 번 만들어 교체만 하는 인덱스 (만든 뒤 수정하지 않음)"""
+    pattern_of: dict  # 강좌 ID → 패턴 번호
+    masks: tuple  # 패턴 → 시간표 마스크
+    members: tuple  # 패턴 → 강좌 ID 튜플
+    adjacency: tuple  # 패턴 → 인접 패턴 비트셋
+    built_at: float
+    build_ms: float
+
+
+_EMPTY = _Snapshot({}, (), (), (), 0.0, 0.0)
+
+
+class ConflictIndex:
+    """강좌 ID → 시간표 패턴, 패턴 간 충돌 인접 비트셋
+
+    새 인덱스는 옆에서 다 만든 뒤 `_snapshot` 참조 하나만 바꿔 공개하고,
+    읽는 쪽은 메서드마다 `_snapshot`을 한 번만 읽어 그 스냅샷 안에서만 계산합니다.
+    시간표가 바뀐 트랜잭션의 커밋 후 훅은 다시 만들기를 백그라운드 스레드에 맡기며,
+    그동안(`stale`)은 비트셋으로 후보를 거르지 않고 모든 강좌를 실제 시각으로 확인합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: Optional[_Snapshot] = None
+        self._started = 0  # 시작한 계산 번호
+        self._published = 0  # 공개한(또는 `reset`으로 버린) 마지막 계산 번호
+        self._pending = False
+        self._refreshing = False
+        self._idle = threading.Event()
+        self._idle.set()
+
+    def reset(self):
+        """비우고 미적재 상태로 (테스트용, 진행 중인 재적재가 끝난 뒤 비움)"""
+        self._idle.wait(5)
+        with self._lock:
+            self._published = self._started
+            self._snapshot = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def stale(self) -> bool:
+        """커밋된 시간표 변경이 아직 인덱스에 반영되지 않았는지"""
+        return self._refreshing
+
+    def load(self, db: Session):
+        """`schedules` 전체로 새로 계산해 교체 (더 나중에 시작한 계산이 이미 공개됐으면 버림)"""
+        with self._lock:
+            self._started += 1
+            number = self._started
+        start = time.perf_counter()
+
+        pattern_of, masks, members, index = {}, [], [], {}
+        for course_id, mask in load_course_masks(db).items():
+            if not mask:
+                continue
+            pattern = index.get(mask)
+            if pattern is None:
+                pattern = index[mask] = len(masks)
+                masks.append(mask)
+                members.append([])
+            pattern_of[course_id] = pattern
+            members[pattern].append(course_id)
+
+        # 칸 → 그 칸을 덮는 패턴 비트셋, 패턴의 인접 비트셋 = 덮는 칸들의 OR
+        slots: dict[int, int] = {}
+        for pattern, mask in enumerate(masks):
+            for slot in _bits(mask):
+                slots[slot] = slots.get(slot, 0) | (1 << pattern)
+        adjacency = []
+        for mask in masks:
+            adjacent = 0
+            for slot in _bits(mask):
+                adjacent |= slots[slot]
+            adjacency.append(adjacent)
+
+        build_ms = (time.perf_counter() - start) * 1000
+        snapshot = _Snapshot(
+            pattern_of, tuple(masks), tuple(tuple(ids) for ids in members), tuple(adjacency), time.time(), build_ms,
+        )
+        with self._lock:
+            if number <= self._published:
+                return
+            self._published = number
+            self._snapshot = snapshot
+        logger.info(
+            "🗓️ 시간 충돌 인덱스 적재: 강좌 %d개, 패턴 %d개 (%.1fms)", len(pattern_of), len(masks), build_ms,
+            extra={"courses": len(pattern_of), "patterns": len(masks)},
+        )
+
+    def ensure(self, db: Session):
+        if self._snapshot is None:
+            self.load(db)
+
+    def refresh(self, bind):
+        """커밋 후 훅: 백그라운드 스레드에서 새 세션으로 다시 계산 (진행 중이면 끝난 뒤 한 번 더)"""
+        with self._lock:
+            self._pending = True
+            if self._refreshing:
+                return
+            self._refreshing = True
+            self._idle.clear()
+        threading.Thread(target=self._refresh_loop, args=(bind,), name="conflict-index-refresh", daemon=True).start()
+
+    def _refresh_loop(self, bind):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._refreshing = False
+                    self._idle.set()
+                    return
+                self._pending = False
+            try:
+                with Session(bind=bind) as db:
+                    self.load(db)
+            except Exception:
+                logger.exception("❌ 시간 충돌 인덱스 재적재 실패")
+
+    def wait(self, timeout: float = None) -> bool:
+        """진행 중인 재적재가 끝날 때까지 대기"""
+        return self._idle.wait(timeout)
+
+    def _current(self) -> _Snapshot:
+        return self._snapshot or _EMPTY
+
+    def mask(self, course_id: int) -> int:
+        snapshot = self._current()
+        pattern = snapshot.pattern_of.get(course_id)
+        return 0 if pattern is None else snapshot.masks[pattern]
+
+    def conflicts(self, course_a: int, course_b: int) -> bool:
+        snapshot = self._current()
+        a, b = snapshot.pattern_of.get(course_a), snapshot.pattern_of.get(course_b)
+        if a is None or b is None or course_a == course_b:
+            return False
+        return bool(snapshot.adjacency[a] >> b & 1)
+
+    def conflicting(self, course_id: int, others: Iterable[int]) -> list[int]:
+        """`others` 중 `course_id`와 시간이 겹치는 강좌"""
+        snapshot = self._current()
+        pattern = snapshot.pattern_of.get(course_id)
+        if pattern is None:
+            return []
+        adjacent, pattern_of = snapshot.adjacency[pattern], snapshot.pattern_of
+        return [
+            other for other in others
+            if other != course_id and other in pattern_of and adjacent >> pattern_of[other] & 1
+        ]
+
+    def candidates(self, course_id: int, others: Iterable[int]) -> list[int]:
+        """실제 시각으로 확인할 후보: 인덱스가 최신이면 비트셋으로 거른 강좌, 재적재 중이면 전부"""
+        if self.stale or self._snapshot is None:
+            return [other for other in others if other != course_id]
+        return self.conflicting(course_id, others)
+
+    def confirm(self, db: Session, course_id: int, candidates: list[int]) -> list[int]:
+        """후보 중 실제 수업 시각이 `course_id`와 겹치는 강좌 (시간표 조회 1번)"""
+        if not candidates:
+            return []
+        meetings = load_meetings(db, [course_id, *candidates])
+        own = meetings.get(course_id, [])
+        return [other for other in candidates if meetings_overlap(own, meetings.get(other, []))]
+
+    def conflicting_all(self, course_id: int) -> list[int]:
+        """`course_id`와 시간이 겹치는 전체 강좌"""
+        snapshot = self._current()
+        pattern = snapshot.pattern_of.get(course_id)
+        if pattern is None:
+            return []
+        return sorted(
+            other for adjacent in _bits(snapshot.adjacency[pattern])
+            for other in snapshot.members[adjacent] if other != course_id
+        )
+
+    def summary(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "loaded": snapshot is not None,
+            "stale": self.stale,
+            "courses": len(snapshot.pattern_of) if snapshot else 0,
+            "patterns": len(snapshot.masks) if snapshot else 0,
+            "build_ms": round(snapshot.build_ms, 2) if snapshot else 0.0,
+            "built_at": snapshot.built_at if snapshot else None,
+        }
+
+
+conflict_index = ConflictIndex()
+
+
+def _refresh_after_commit(session: Session):
+    """현재 트랜잭션이 커밋되면 인덱스 재적재 요청 (트랜잭션당 한 번만 등록)"""
+    if session.info.get(REFRESH_KEY):
+        return
+    session.info[REFRESH_KEY] = True
+    bind = session.get_bind()
+
+    def refresh():
+        session.info.pop(REFRESH_KEY, None)
+        conflict_index.refresh(bind)
+
+    after_commit(session, refresh)
+
+
+@event.listens_for(Session, "after_flush")
+def _schedule_flushed(session: Session, flush_context):
+    """ORM 객체: 강좌는 추가/삭제만 (신청 인원 변경은 무관), 시간표는 모든 변경"""
+    if (
+        any(isinstance(obj, Schedule) for obj in (*session.new, *session.dirty, *session.deleted))
+        or any(isinstance(obj, Course) for obj in (*session.new, *session.deleted))
+    ):
+        _refresh_after_commit(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _schedule_executed(orm_execute_state):
+    """세션으로 실행한 INSERT/UPDATE/DELETE 문 (대량 생성/삭제)"""
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None:
+        return
+    if (mapper.class_ is Schedule and not orm_execute_state.is_select) or (
+        mapper.class_ is Course and (orm_execute_state.is_insert or orm_execute_state.is_delete)
+    ):
+        _refresh_after_commit(orm_execute_state.session)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_refresh(session: Session):
+    session.info.pop(REFRESH_KEY, None)
+
+
+class ConflictService:
+    """후보 강좌 간/학생 시간표와의 충돌 조회"""
+
+    @staticmethod
+    def check(db: Session, course_ids: list[int], student_id: Optional[int] = None) -> dict:
+        """후보끼리 겹치는 쌍, 학생 신청 강좌와 겹치는 후보, 어디와도 겹치지 않는 후보"""
+        found = set(db.scalars(select(Course.id).where(Course.id.in_(course_ids))))
+        missing = [course_id for course_id in course_ids if course_id not in found]
+        if missing:
+            raise CourseNotFoundException(missing[0])
+
+        enrolled = []
+        if student_id is not None:
+            if db.get(Student, student_id) is None:
+                raise StudentNotFoundException(student_id)
+            enrolled = list(db.scalars(
+                select(Enrollment.course_id).where(Enrollment.student_id == student_id, Enrollment.status == "ENROLLED")
+            ))
+
+        conflict_index.ensure(db)
+        # 비트셋 후보를 실제 수업 시각으로 확인 (시간표 조회 1번)
+        meetings = load_meetings(db, {*course_ids, *enrolled})
+
+        def overlap(course_a: int, course_b: int) -> bool:
+            return meetings_overlap(meetings.get(course_a, []), meetings.get(course_b, []))
+
+        pairs = [
+            [course_a, course_b]
+            for i, course_a in enumerate(course_ids)
+            for course_b in conflict_index.candidates(course_a, course_ids[i + 1:])
+            if overlap(course_a, course_b)
+        ]
+        timetable = [
+            {"course_id": course_id, "conflicts_with": conflicting}
+            for course_id in course_ids
+            if (conflicting := [
+                other for other in conflict_index.candidates(course_id, enrolled) if overlap(course_id, other)
+            ])
+        ]
+        clashing = {course_id for pair in pairs for course_id in pair} | {item["course_id"] for item in timetable}
+        return {
+            "pairs": pairs,
+            "timetable": timetable,
+            "conflict_free": [course_id for course_id in course_ids if course_id not in clashing],
+            "unscheduled": [course_id for course_id in course_ids if course_id not in meetings],
+        }
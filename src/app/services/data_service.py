@@ -11,12 +11,14 @@ import logging
 from datetime import time
 import random
 from sqlalchemy.orm import Session
-from sqlalchemy import delete
+from sqlalchemy import delete, insert, select
 
 from app.models import (
-    Department, Professor, Course, Student, Schedule, DayOfWeek
+    Department, Professor, Course, Student, Schedule, DayOfWeek, Enrollment, StudentCreditLoad,
+    StudentDepartmentLoad, EnrollmentEvent, EnrollmentSnapshot, CoursePreference,
 )
 from app.config import settings
+from app.services.data_stats_service import data_stats
 
 logger = logging.getLogger(__name__)
 
@@ -55,11 +57,25 @@ COURSE_NAME_PREFIXES = [
 class DataService:
     """초기 데이터 생성 서비스"""
     
+    @staticmethod
+    def is_empty(db: Session) -> bool:
+        """학과가 하나도 없으면 True (샘플 데이터를 아직 만들지 않음)"""
+        empty = db.scalar(select(Department.id).limit(1)) is None
+        db.rollback()  # 읽기 트랜잭션 종료
+        return empty
+    
     @staticmethod
     def clear_all(db: Session):
         """모든 데이터 삭제"""
         logger.info("🗑️ 기존 데이터 삭제 중...")
         
+        # 강좌/학생을 새로 만들므로 신청 내역과 저널도 함께 초기화
+        db.execute(delete(EnrollmentSnapshot))
+        db.execute(delete(EnrollmentEvent))
+        db.execute(delete(Enrollment))
+        db.execute(delete(CoursePreference))
+        db.execute(delete(StudentCreditLoad))
+        db.execute(delete(StudentDepartmentLoad))
         db.execute(delete(Schedule))
         db.execute(delete(Course))
         db.execute(delete(Student))
@@ -67,6 +83,7 @@ class DataService:
         db.execute(delete(Department))
         
         db.commit()
+        data_stats.load({})
         logger.info("✅ 데이터 삭제 완료")
     
     @staticmethod
@@ -109,6 +126,7 @@ class DataService:
             departments.append(dept)
         
         db.add_all(departments)
+        data_stats.record(db, "departments", len(departments))
         db.commit()
         
         return departments
@@ -133,6 +151,7 @@ class DataService:
             professors.append(prof)
         
         db.add_all(professors)
+        data_stats.record(db, "professors", len(professors))
         db.commit()
         
         return professors
@@ -163,6 +182,7 @@ class DataService:
                 courses.append(course)
         
         db.add_all(courses)
+        data_stats.record(db, "courses", len(courses))
         db.commit()
         
         # 시간표 생성 (강좌마다)
@@ -172,23 +192,29 @@ class DataService:
     
     @staticmethod
     def _create_schedules(db: Session, courses: list):
-        """시간표 생성"""
+        """시간표 생성 (1~2학점: 주 1회 90분, 3~4학점: 주 2회 75분)"""
         schedules = []
         
         days = list(DayOfWeek)
+        day_pairs = [(DayOfWeek.MON, DayOfWeek.WED), (DayOfWeek.TUE, DayOfWeek.THU), (DayOfWeek.WED, DayOfWeek.FRI)]
         hours = list(range(8, 17))  # 08:00 - 17:00
         
         for course in courses:
-            day = random.choice(days)
             hour = random.choice(hours)
             
-            schedule = Schedule(
-                course_id=course.id,
-                day_of_week=day,
-                start_time=time(hour=hour, minute=0),
-                end_time=time(hour=hour + 1, minute=30)
-            )
-            schedules.append(schedule)
+            if course.credits >= 3:
+                meetings = [(day, time(hour=hour + 1, minute=15)) for day in random.choice(day_pairs)]
+            else:
+                meetings = [(random.choice(days), time(hour=hour + 1, minute=30))]
+            
+            for day, end_time in meetings:
+                schedule = Schedule(
+                    course_id=course.id,
+                    day_of_week=day,
+                    start_time=time(hour=hour, minute=0),
+                    end_time=end_time
+                )
+                schedules.append(schedule)
         
         db.add_all(schedules)
         db.commit()
@@ -221,7 +247,47 @@ class DataService:
         for batch_start in range(0, len(students), batch_size):
             batch_end = min(batch_start + batch_size, len(students))
             db.add_all(students[batch_start:batch_end])
+            data_stats.record(db, "students", batch_end - batch_start)
             db.commit()
             logger.debug(f"  학생 {batch_end}/{len(students)} 생성 중...")
         
-        return students
\ No newline at end of file
+        return students
+    
+    @staticmethod
+    def distribute_to_shards(db: Session, router) -> dict:
+        """강좌/시간표를 학과별 샤드로 옮김 (학과별 샤딩 모드, ID 유지)"""
+        department_ids = [row[0] for row in db.execute(select(Department.id))]
+        router.open(department_ids)
+        
+        course_rows = [dict(row._mapping) for row in db.execute(select(Course.__table__))]
+        schedule_rows = [dict(row._mapping) for row in db.execute(select(Schedule.__table__))]
+        course_departments = {row["id"]: row["department_id"] for row in course_rows}
+        
+        counts = {}
+        for department_id in department_ids:
+            courses = [row for row in course_rows if row["department_id"] == department_id]
+            course_ids = {row["id"] for row in courses}
+            schedules = [row for row in schedule_rows if row["course_id"] in course_ids]
+            
+            shard = router.session(department_id)
+            try:
+                shard.execute(delete(Enrollment))
+                shard.execute(delete(Schedule))
+                shard.execute(delete(Course))
+                if courses:
+                    shard.execute(insert(Course), courses)
+                if schedules:
+                    shard.execute(insert(Schedule), schedules)
+                shard.commit()
+            finally:
+                shard.close()
+            counts[department_id] = len(courses)
+        
+        # 코디네이터에는 학과/교수/학생/학생별 학점만 남김
+        db.execute(delete(Schedule))
+        db.execute(delete(Course))
+        db.commit()
+        router.register_courses(course_departments)
+        
+        logger.info(f"✅ 학과별 샤드 {len(counts)}개로 강좌 {len(course_rows)}개 분산 완료")
+        return counts
@@ -0,0 +1,177 @@
+"""
+services/data_stats_service.py - 데이터 통계 카운터 (학생/강좌/교수/학과/신청 중 수강신청 수)
+
+모니터링이 `GET /api/v1/test/data-stats`를 주기적으로 호출하므로 호출마다 COUNT 5번
+(학기 내내 커지는 `enrollments` 스캔 포함)을 실행하지 않고 메모리 카운터를 반환합니다.
+
+- 시작 시 샘플 데이터 생성 후 COUNT로 한 번 채움
+- 초기 데이터 삭제/생성(DataService), 신청/취소/대량 등록(일괄 배정 포함)은 커밋 후 훅으로 증감
+  (롤백/재시도된 트랜잭션은 반영 안 됨)
+- 주기적 점검: 다시 세어 카운터와 비교하고, 잠시 뒤 다시 세어도 차이가 같을 때만 그 차이를 더함
+  → 방금 커밋되어 훅이 아직 반영되지 않은 신청은 보정하지 않고, 점검 중의 증감도 덮어쓰지 않음
+"""
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import ReadSessionLocal, after_commit, shard_router
+from app.models import Course, Department, Enrollment, Professor, Student
+from app.utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+COUNTERS = ("students", "courses", "professors", "departments", "enrollments")
+
+# 차이가 일시적인지 확인하기 위해 다시 셀 때까지 대기
+RECHECK_DELAY_S = 0.05
+
+DATA_STATS_DRIFT = registry.counter(
+    "data_stats_drift_total",
+    "Row-count counters corrected by the data-stats reconciler",
+    ("counter",),
+)
+
+
+class DataStats:
+    """행 수 카운터 (`COUNTERS`)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """비우고 미적재 상태로 (다음 조회에서 다시 셈)"""
+        with self._lock:
+            self.counts = dict.fromkeys(COUNTERS, 0)
+            self.loaded = False
+            self.loaded_at: Optional[float] = None
+
+    def load(self, counts: dict):
+        with self._lock:
+            self.counts = {name: counts.get(name, 0) for name in COUNTERS}
+            self.loaded = True
+            self.loaded_at = time.time()
+
+    def add(self, name: str, delta: int):
+        with self._lock:
+            self.counts[name] += delta
+
+    def record(self, db: Session, name: str, delta: int):
+        """현재 트랜잭션이 커밋되면 `name` 카운터에 `delta`를 더함"""
+        after_commit(db, lambda: self.add(name, delta))
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self.counts)
+
+
+data_stats = DataStats()
+
+
+class DataStatsService:
+    """행 수 세기/카운터 점검"""
+
+    @staticmethod
+    def count_all(db: Session) -> dict:
+        """COUNT로 직접 셈 (시작 시 적재와 주기적 점검에만 사용)"""
+        stats = {
+            "students": db.scalar(select(func.count(Student.id))),
+            "courses": db.scalar(select(func.count(Course.id))),
+            "professors": db.scalar(select(func.count(Professor.id))),
+            "departments": db.scalar(select(func.count(Department.id))),
+            "enrollments": db.scalar(select(func.count(Enrollment.id)).where(Enrollment.status == "ENROLLED")),
+        }
+        if shard_router.enabled:
+            # 강좌/수강신청은 학과 샤드에 있음
+            from app.services.sharded_enrollment_service import ShardedEnrollmentService
+            stats["courses"] = ShardedEnrollmentService.count(Course)
+            stats["enrollments"] = ShardedEnrollmentService.count(Enrollment, Enrollment.status == "ENROLLED")
+        db.rollback()  # 읽기 트랜잭션 종료
+        return stats
+
+    @staticmethod
+    def seed(db: Session, stats: DataStats = None) -> dict:
+        stats = stats or data_stats
+        stats.load(DataStatsService.count_all(db))
+        logger.info("📊 데이터 통계 카운터 적재: %s", stats.snapshot())
+        return stats.snapshot()
+
+    @staticmethod
+    def _drift(db: Session, stats: DataStats) -> dict:
+        counted = DataStatsService.count_all(db)
+        current = stats.snapshot()
+        return {name: counted[name] - current[name] for name in COUNTERS if counted[name] != current[name]}
+
+    @staticmethod
+    def reconcile(db: Session, stats: DataStats = None, recheck_delay_s: float = RECHECK_DELAY_S) -> dict:
+        """다시 세어 비교하고 두 번 연속 같은 차이만 보정"""
+        stats = stats or data_stats
+        started = time.perf_counter()
+        result = {"started_at": datetime.utcnow(), "suspected": {}, "corrected": {}}
+
+        if not stats.loaded:
+            DataStatsService.seed(db, stats)
+        else:
+            suspected = DataStatsService._drift(db, stats)
+            result["suspected"] = suspected
+            if suspected:
+                time.sleep(recheck_delay_s)
+                again = DataStatsService._drift(db, stats)
+                for name, delta in suspected.items():
+                    if again.get(name) != delta:
+                        continue
+                    stats.add(name, delta)
+                    result["corrected"][name] = delta
+                    DATA_STATS_DRIFT.inc(name, amount=abs(delta))
+                    logger.warning(
+                        "⚠️ 데이터 통계 불일치 보정: %s %+d", name, delta,
+                        extra={"counter": name, "delta": delta},
+                    )
+
+        result["counts"] = stats.snapshot()
+        result["elapsed_s"] = round(time.perf_counter() - started, 4)
+        return result
+
+
+class DataStatsReconciler:
+    """주기적으로 카운터 점검 (백그라운드 스레드)"""
+
+    def __init__(self, session_factory: Callable[[], Session], interval_s: float):
+        self.session_factory = session_factory
+        self.interval_s = interval_s
+        self.last_pass: Optional[dict] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self.interval_s <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="data-stats-reconciler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            db = self.session_factory()
+            try:
+                self.last_pass = DataStatsService.reconcile(db)
+            except Exception:
+                logger.exception("❌ 데이터 통계 점검 실패")
+            finally:
+                db.close()
+
+
+data_stats_reconciler = DataStatsReconciler(ReadSessionLocal, settings.data_stats_reconcile_interval_s)
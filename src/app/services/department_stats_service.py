@@ -0,0 +1,303 @@
+"""
+services/department_stats_service.py - 학과별 정원/신청 인원/충원율 집계 (증분 갱신)
+
+학과 대시보드가 조회할 때마다 전체 강좌를 읽어 합산하지 않도록, 시작 시 강좌 테이블을
+한 번 읽어 학과별 합계를 만들어 두고 이후에는 변경분만 O(1)로 반영합니다.
+
+- 강좌별 [학과, 정원, 신청 인원], 학과별 [강좌 수, 정원 합, 신청 인원 합, 마감 강좌 수]
+- 신청/취소/대량 등록(+일괄 배정)/정원 변경/점검 보정은 커밋 후 훅으로만 반영
+  (롤백/재시도된 트랜잭션은 반영 안 됨)
+- 주기적 검증: 강좌 전체를 읽기 트랜잭션 1개로 읽어 강좌별 항목과 비교하고, 다른 강좌는
+  의심 목록에만 두었다가 다음 검증에서도 (메모리 항목, DB 항목)이 그대로일 때만 교체
+  → 방금 커밋되어 훅이 아직 반영되지 않은 강좌는 그 사이 훅이 반영되어 항목이 바뀌므로
+    DB 값으로 덮어쓴 뒤 훅이 증감을 한 번 더 더하는 일이 없음
+- 학과별 샤딩 모드에서는 강좌가 샤드에 있으므로 사용하지 않음
+"""
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import ReadSessionLocal, after_commit
+from app.models import Course
+from app.utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# 응답에 담을 불일치 강좌 예시 수
+MAX_DRIFT_SAMPLES = 20
+
+DEPARTMENT_STATS_DRIFT = registry.counter(
+    "department_stats_drift_total",
+    "Courses whose department aggregate entry differed from the courses table",
+)
+DEPARTMENT_STATS_VERIFY_SECONDS = registry.histogram(
+    "department_stats_verify_seconds",
+    "Time spent verifying department aggregates against a full course scan",
+)
+
+# 강좌 항목 인덱스
+DEPARTMENT, CAPACITY, ENROLLED = 0, 1, 2
+
+
+def _figures(totals: Optional[list]) -> dict:
+    courses, capacity, enrolled, full = totals or (0, 0, 0, 0)
+    return {
+        "courses": courses,
+        "capacity": capacity,
+        "enrolled": enrolled,
+        "fill_rate": round(enrolled / capacity, 4) if capacity else 0.0,
+        "full_courses": full,
+    }
+
+
+class DepartmentStats:
+    """강좌별 [학과, 정원, 신청 인원] + 학과별 [강좌 수, 정원, 신청 인원, 마감 강좌 수]"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """비우고 미적재 상태로 (다음 `ensure`에서 다시 적재)"""
+        with self._lock:
+            self.courses: dict[int, list] = {}
+            self.departments: dict[int, list] = {}
+            self.suspects: dict[int, tuple] = {}  # 지난 검증에서 다르던 강좌 → (메모리 항목, DB 항목)
+            self.loaded = False
+            self.loaded_at: Optional[float] = None
+
+    def _apply(self, entry: list, sign: int):
+        """강좌 항목 1개를 학과 합계에 더하거나(+1) 뺌(-1) (락 보유 상태)"""
+        totals = self.departments.setdefault(entry[DEPARTMENT], [0, 0, 0, 0])
+        totals[0] += sign
+        totals[1] += sign * entry[CAPACITY]
+        totals[2] += sign * entry[ENROLLED]
+        totals[3] += sign * (entry[ENROLLED] >= entry[CAPACITY])
+
+    def _put(self, course_id: int, entry: Optional[list]):
+        """강좌 항목 교체 (None이면 제거, 락 보유 상태)"""
+        old = self.courses.pop(course_id, None)
+        if old is not None:
+            self._apply(old, -1)
+        if entry is not None:
+            self.courses[course_id] = entry
+            self._apply(entry, 1)
+
+    def _update(self, course_id: int, field: int, value: int):
+        with self._lock:
+            entry = self.courses.get(course_id)
+            if entry is None:
+                return  # 적재 이후 생긴 강좌는 다음 검증에서 추가됨
+            self._apply(entry, -1)
+            entry[field] = value
+            self._apply(entry, 1)
+
+    def load(self, db: Session):
+        """강좌 전체를 읽어 교체"""
+        start = time.perf_counter()
+        rows = db.execute(select(Course.id, Course.department_id, Course.capacity, Course.enrolled)).all()
+        with self._lock:
+            self.courses, self.departments, self.suspects = {}, {}, {}
+            for course_id, department_id, capacity, enrolled in rows:
+                self._put(course_id, [department_id, capacity, enrolled])
+            self.loaded = True
+            self.loaded_at = time.time()
+        logger.info(
+            "🏫 학과별 집계 적재: 강좌 %d개, 학과 %d개 (%.1fms)",
+            len(rows), len(self.departments), (time.perf_counter() - start) * 1000,
+        )
+
+    def ensure(self, db: Session):
+        if not self.loaded:
+            self.load(db)
+
+    def adjust(self, course_id: int, delta: int):
+        """신청 인원 증감"""
+        with self._lock:
+            entry = self.courses.get(course_id)
+            if entry is None:
+                return
+            self._apply(entry, -1)
+            entry[ENROLLED] += delta
+            self._apply(entry, 1)
+
+    def set_enrolled(self, course_id: int, enrolled: int):
+        self._update(course_id, ENROLLED, enrolled)
+
+    def set_capacity(self, course_id: int, capacity: int):
+        self._update(course_id, CAPACITY, capacity)
+
+    # ==================== 커밋 후 반영 ====================
+    def record(self, db: Session, course_id: int, delta: int):
+        """현재 트랜잭션이 커밋되면 신청 인원 증감 반영"""
+        after_commit(db, lambda: self.adjust(course_id, delta))
+
+    def record_many(self, db: Session, deltas: dict):
+        """`{course_id: 증감}`을 커밋되면 반영"""
+
+        def apply():
+            for course_id, delta in deltas.items():
+                self.adjust(course_id, delta)
+
+        after_commit(db, apply)
+
+    def record_capacity(self, db: Session, course_id: int, capacity: int):
+        after_commit(db, lambda: self.set_capacity(course_id, capacity))
+
+    def record_enrolled(self, db: Session, course_id: int, enrolled: int):
+        after_commit(db, lambda: self.set_enrolled(course_id, enrolled))
+
+    # ==================== 조회 ====================
+    def department(self, department_id: int) -> dict:
+        """학과 1개의 강좌 수/정원/신청 인원/충원율/마감 강좌 수"""
+        with self._lock:
+            return _figures(self.departments.get(department_id))
+
+    def summary(self) -> dict:
+        with self._lock:
+            totals = [sum(values) for values in zip(*self.departments.values())] or None
+            return {
+                "loaded": self.loaded,
+                "loaded_at": self.loaded_at,
+                "departments": len(self.departments),
+                **_figures(totals),
+            }
+
+    def _drifted(self, rows: Iterable) -> list:
+        """DB 행(강좌 전체)과 다른 강좌 → [(course_id, 메모리 항목, DB 항목)]"""
+        with self._lock:
+            seen, drifted = set(), []
+            for course_id, department_id, capacity, enrolled in rows:
+                seen.add(course_id)
+                actual = [department_id, capacity, enrolled]
+                current = self.courses.get(course_id)
+                if current != actual:
+                    drifted.append((course_id, list(current) if current else None, actual))
+            drifted += [(course_id, list(self.courses[course_id]), None) for course_id in self.courses.keys() - seen]
+            return drifted
+
+    def _confirm(self, drifted: list) -> list:
+        """지난 검증과 똑같이 다른 강좌만 교체하고 반환, 나머지는 다음 검증까지 의심 목록에"""
+        with self._lock:
+            confirmed, suspects = [], {}
+            for course_id, current, actual in drifted:
+                if self.suspects.get(course_id) == (current, actual) and self.courses.get(course_id) == current:
+                    self._put(course_id, actual)
+                    confirmed.append((course_id, current, actual))
+                else:
+                    suspects[course_id] = (current, actual)
+            self.suspects = suspects
+            return confirmed
+
+
+department_stats = DepartmentStats()
+
+
+class DepartmentStatsService:
+    """학과별 집계 ↔ 강좌 테이블 검증"""
+
+    @staticmethod
+    def verify(read_db: Session, stats: DepartmentStats = None) -> dict:
+        """전체 스캔으로 검증하고 두 번 연속 같은 불일치 강좌만 교체"""
+        stats = stats or department_stats
+        started = time.perf_counter()
+        columns = (Course.id, Course.department_id, Course.capacity, Course.enrolled)
+        result = {
+            "started_at": datetime.utcnow(),
+            "scanned": 0,
+            "suspected": 0,
+            "drifted": 0,
+            "samples": [],
+        }
+
+        if not stats.loaded:
+            stats.load(read_db)
+            read_db.rollback()
+            result["elapsed_s"] = round(time.perf_counter() - started, 4)
+            return result
+
+        rows = read_db.execute(select(*columns)).all()
+        read_db.rollback()  # 읽기 트랜잭션 종료
+        result["scanned"] = len(rows)
+        suspected = stats._drifted(rows)
+        result["suspected"] = len(suspected)
+
+        confirmed = stats._confirm(suspected)
+        if confirmed:
+            result["drifted"] = len(confirmed)
+            DEPARTMENT_STATS_DRIFT.inc(amount=len(confirmed))
+            for course_id, current, actual in confirmed:
+                if len(result["samples"]) < MAX_DRIFT_SAMPLES:
+                    result["samples"].append({"course_id": course_id, "aggregate": current, "actual": actual})
+                logger.warning(
+                    "⚠️ 학과별 집계 불일치: course_id=%s aggregate=%s actual=%s", course_id, current, actual,
+                    extra={"course_id": course_id},
+                )
+
+        elapsed = time.perf_counter() - started
+        DEPARTMENT_STATS_VERIFY_SECONDS.observe(elapsed)
+        result["elapsed_s"] = round(elapsed, 4)
+        logger.info(
+            "🏫 학과별 집계 검증: 강좌 %d개, 불일치 %d개 (%.3f초)",
+            result["scanned"], result["drifted"], result["elapsed_s"],
+        )
+        return result
+
+
+class DepartmentStatsVerifier:
+    """주기적으로 학과별 집계를 검증 (백그라운드 스레드, 한 번에 한 번만)"""
+
+    def __init__(self, session_factory: Callable[[], Session], interval_s: float):
+        self.session_factory = session_factory
+        self.interval_s = interval_s
+        self.last_verification: Optional[dict] = None
+        self._run_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._run_lock.locked()
+
+    def start(self):
+        if self.interval_s <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="department-stats-verifier", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+
+    def verify(self, read_db: Session) -> Optional[dict]:
+        """1회 검증 (다른 검증이 진행 중이면 None)"""
+        if not self._run_lock.acquire(blocking=False):
+            return None
+        try:
+            self.last_verification = DepartmentStatsService.verify(read_db)
+            return self.last_verification
+        finally:
+            self._run_lock.release()
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            db = self.session_factory()
+            try:
+                self.verify(db)
+            except Exception:
+                logger.exception("❌ 학과별 집계 검증 실패")
+            finally:
+                db.close()
+
+
+department_stats_verifier = DepartmentStatsVerifier(ReadSessionLocal, settings.department_stats_verify_interval_s)
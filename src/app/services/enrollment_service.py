@@ -11,20 +11,31 @@ import threading
 from contextlib import contextmanager
 from typing import Tuple
 from datetime import time
+from time import perf_counter
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, update, func
 
 from app.models import Student, Course, Enrollment, Schedule, DayOfWeek
 from app.utils.exceptions import (
+    BusinessException,
     StudentNotFoundException,
     CourseNotFoundException,
     EnrollmentNotFoundException,
     CapacityExceededException,
+    CapacityBelowEnrolledException,
     CreditExceededException,
     TimeConflictException,
     AlreadyEnrolledException,
 )
 from app.config import settings
+from app.database import begin_write
+from app.utils.interval_index import IntervalIndex
+from app.utils.lock_stats import lock_stats, key_kind
+from app.utils.schedule_bits import sort_meetings
+from app.services.conflict_service import conflict_index
+from app.services.data_stats_service import data_stats
+from app.services.department_stats_service import department_stats
+from app.services.journal_service import JournalService, ENROLL, CANCEL
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +55,11 @@ def _get_lock(key: str) -> threading.Lock:
 
 @contextmanager
 def _acquire_locks(*keys: str):
+    if lock_stats.enabled:
+        with _acquire_locks_instrumented(keys):
+            yield
+        return
+
     locks = []
     for key in sorted(set(keys)):
         lock = _get_lock(key)
@@ -56,6 +72,32 @@ def _acquire_locks(*keys: str):
             lock.release()
 
 
+@contextmanager
+def _acquire_locks_instrumented(keys):
+    """`_acquire_locks`와 동일하되 키 종류별 대기/보유 시간을 기록"""
+    acquired = []
+    try:
+        for key in sorted(set(keys)):
+            lock = _get_lock(key)
+            kind = key_kind(key)
+            start = perf_counter()
+            contended = not lock.acquire(blocking=False)
+            if contended:
+                lock_stats.begin_wait(key, kind)
+                try:
+                    lock.acquire()
+                finally:
+                    lock_stats.end_wait(key, kind, perf_counter() - start, True)
+            else:
+                lock_stats.end_wait(key, kind, 0.0, False)
+            acquired.append((lock, kind, perf_counter()))
+        yield
+    finally:
+        for lock, kind, acquired_at in reversed(acquired):
+            lock.release()
+            lock_stats.record_hold(kind, perf_counter() - acquired_at)
+
+
 class EnrollmentService:
     """수강신청 서비스"""
     
@@ -80,7 +122,7 @@ class EnrollmentService:
             TimeConflictException: 시간 충돌
             AlreadyEnrolledException: 이미 신청함
         """
-        logger.info(f"📝 수강신청 시작: student_id={student_id}, course_id={course_id}")
+        logger.debug("📝 수강신청 시작: student_id=%s, course_id=%s", student_id, course_id)
 
         lock_keys = (
             f"session:{id(db)}",
@@ -90,13 +132,16 @@ class EnrollmentService:
 
         try:
             with _acquire_locks(*lock_keys):
+                # 앱 락을 잡은 뒤 DB 쓰기 잠금 확보 (읽기→쓰기 승격 중 SQLITE_BUSY 방지)
+                begin_write(db)
+
                 # 1️⃣ 학생 조회
                 student = db.query(Student).filter(
                     Student.id == student_id
                 ).first()
 
                 if not student:
-                    logger.error(f"❌ 학생 없음: {student_id}")
+                    logger.error("❌ 학생 없음: %s", student_id, extra={"student_id": student_id})
                     raise StudentNotFoundException(student_id)
 
                 # 2️⃣ 강좌 조회
@@ -105,7 +150,7 @@ class EnrollmentService:
                 ).first()
 
                 if not course:
-                    logger.error(f"❌ 강좌 없음: {course_id}")
+                    logger.error("❌ 강좌 없음: %s", course_id, extra={"course_id": course_id})
                     raise CourseNotFoundException(course_id)
 
                 # 3️⃣ 중복 신청 체크
@@ -118,7 +163,10 @@ class EnrollmentService:
                 ).first()
 
                 if existing:
-                    logger.warning(f"⚠️ 이미 신청함: {student_id} -> {course_id}")
+                    logger.warning(
+                        "⚠️ 이미 신청함: %s -> %s", student_id, course_id,
+                        extra={"student_id": student_id, "course_id": course_id, "reason": "already_enrolled"},
+                    )
                     raise AlreadyEnrolledException(course_id)
 
                 # 4️⃣ 학점 체크
@@ -127,7 +175,9 @@ class EnrollmentService:
 
                 if new_total > settings.max_credits_per_semester:
                     logger.warning(
-                        f"⚠️ 학점 초과: {current_credits} + {course.credits} > {settings.max_credits_per_semester}"
+                        "⚠️ 학점 초과: %s + %s > %s",
+                        current_credits, course.credits, settings.max_credits_per_semester,
+                        extra={"student_id": student_id, "course_id": course_id, "reason": "credit_exceeded"},
                     )
                     raise CreditExceededException(
                         current_credits,
@@ -137,7 +187,10 @@ class EnrollmentService:
 
                 # 5️⃣ 시간 충돌 체크
                 if EnrollmentService._has_time_conflict(db, student_id, course_id):
-                    logger.warning(f"⚠️ 시간 충돌: {student_id} -> {course_id}")
+                    logger.warning(
+                        "⚠️ 시간 충돌: %s -> %s", student_id, course_id,
+                        extra={"student_id": student_id, "course_id": course_id, "reason": "time_conflict"},
+                    )
                     conflicting = EnrollmentService._get_conflicting_courses(db, student_id, course_id)
                     raise TimeConflictException(conflicting)
 
@@ -157,7 +210,16 @@ class EnrollmentService:
                     latest = db.query(Course).filter(Course.id == course_id).first()
                     if not latest:
                         raise CourseNotFoundException(course_id)
-                    logger.warning(f"⚠️ 정원 초과: {latest.name} ({latest.enrolled}/{latest.capacity})")
+                    # 인기 강좌는 정원 초과 거절이 대량으로 발생하므로 강좌별로 샘플링
+                    logger.warning(
+                        "⚠️ 정원 초과: %s (%s/%s)", latest.name, latest.enrolled, latest.capacity,
+                        extra={
+                            "student_id": student_id,
+                            "course_id": course_id,
+                            "reason": "capacity_exceeded",
+                            "sample_key": ("capacity_exceeded", course_id),
+                        },
+                    )
                     raise CapacityExceededException(latest.capacity, latest.enrolled)
 
                 # 7️⃣ 수강신청 생성
@@ -170,12 +232,23 @@ class EnrollmentService:
                 db.add(enrollment)
                 db.flush()  # 강제 커밋 전 실행
 
-                logger.info(f"✅ 수강신청 성공: student_id={student_id}, course_id={course_id}, enrollment_id={enrollment.id}")
+                # 8️⃣ 저널 기록 (같은 트랜잭션)
+                JournalService.record(db, ENROLL, enrollment.id, student_id, course_id, course.credits)
+                department_stats.record(db, course_id, 1)
+                data_stats.record(db, "enrollments", 1)
+
+                logger.info(
+                    "✅ 수강신청 성공: student_id=%s, course_id=%s, enrollment_id=%s",
+                    student_id, course_id, enrollment.id,
+                    extra={"student_id": student_id, "course_id": course_id, "enrollment_id": enrollment.id},
+                )
 
                 return enrollment
 
+        except BusinessException:
+            raise
         except Exception as e:
-            logger.error(f"❌ 수강신청 실패: {str(e)}")
+            logger.error("❌ 수강신청 실패: %s", e, extra={"student_id": student_id, "course_id": course_id})
             raise
     
     @staticmethod
@@ -191,7 +264,7 @@ class EnrollmentService:
         Returns:
             취소된 Enrollment 객체
         """
-        logger.info(f"🗑️ 수강취소 시작: student_id={student_id}, enrollment_id={enrollment_id}")
+        logger.debug("🗑️ 수강취소 시작: student_id=%s, enrollment_id=%s", student_id, enrollment_id)
         
         lock_keys = (
             f"session:{id(db)}",
@@ -201,6 +274,8 @@ class EnrollmentService:
 
         try:
             with _acquire_locks(*lock_keys):
+                begin_write(db)
+
                 # 수강신청 조회
                 enrollment = db.query(Enrollment).filter(
                     and_(
@@ -211,10 +286,10 @@ class EnrollmentService:
                 ).first()
 
                 if not enrollment:
-                    logger.error(f"❌ 수강신청 없음: {enrollment_id}")
+                    logger.error("❌ 수강신청 없음: %s", enrollment_id, extra={"student_id": student_id, "enrollment_id": enrollment_id})
                     raise EnrollmentNotFoundException(enrollment_id)
 
-                # 강좌 인원 감소 (원자적 업데이트)
+                # 강좌 인원 감소 (원자적 업데이트, 저널용 학점을 함께 반환)
                 update_stmt = (
                     update(Course)
                     .where(
@@ -222,8 +297,11 @@ class EnrollmentService:
                         Course.enrolled > 0
                     )
                     .values(enrolled=Course.enrolled - 1)
+                    .returning(Course.credits)
                 )
-                db.execute(update_stmt)
+                credits = db.execute(update_stmt).scalar_one_or_none()
+                if credits is None:
+                    credits = db.query(Course.credits).filter(Course.id == enrollment.course_id).scalar() or 0
 
                 # 상태 변경
                 enrollment.status = "CANCELLED"
@@ -231,15 +309,48 @@ class EnrollmentService:
                 enrollment.cancelled_at = datetime.utcnow()
 
                 db.flush()
+                JournalService.record(db, CANCEL, enrollment.id, student_id, enrollment.course_id, credits)
+                department_stats.record(db, enrollment.course_id, -1)
+                data_stats.record(db, "enrollments", -1)
 
-                logger.info(f"✅ 수강취소 완료: enrollment_id={enrollment_id}")
+                logger.info(
+                    "✅ 수강취소 완료: enrollment_id=%s", enrollment_id,
+                    extra={"student_id": student_id, "enrollment_id": enrollment_id},
+                )
 
                 return enrollment
 
+        except BusinessException:
+            raise
         except Exception as e:
-            logger.error(f"❌ 수강취소 실패: {str(e)}")
+            logger.error("❌ 수강취소 실패: %s", e, extra={"student_id": student_id, "enrollment_id": enrollment_id})
             raise
     
+    @staticmethod
+    def change_capacity(db: Session, course_id: int, capacity: int) -> Course:
+        """
+        정원 변경 (현재 신청 인원보다 작게는 불가)
+        
+        신청과 같은 강좌 락을 잡으므로 정원 확인과 변경 사이에 신청이 끼어들지 않습니다.
+        """
+        with _acquire_locks(f"session:{id(db)}", f"course:{course_id}"):
+            begin_write(db)
+            course = db.query(Course).filter(Course.id == course_id).first()
+            if not course:
+                raise CourseNotFoundException(course_id)
+            if capacity < course.enrolled:
+                raise CapacityBelowEnrolledException(capacity, course.enrolled)
+
+            course.capacity = capacity
+            db.flush()
+            department_stats.record_capacity(db, course_id, capacity)
+
+            logger.info(
+                "✅ 정원 변경: course_id=%s, capacity=%s", course_id, capacity,
+                extra={"course_id": course_id, "capacity": capacity},
+            )
+            return course
+
     @staticmethod
     def _get_current_credits(db: Session, student_id: int) -> int:
         """학생의 현재 신청 학점 계산"""
@@ -257,83 +368,65 @@ class EnrollmentService:
         return result or 0
     
     @staticmethod
-    def _has_time_conflict(db: Session, student_id: int, new_course_id: int) -> bool:
-        """시간 충돌 확인"""
-        # 새 강좌의 시간표
-        new_schedule = db.query(Schedule).filter(
-            Schedule.course_id == new_course_id
-        ).first()
-        
-        if not new_schedule:
-            return False
-        
-        # 학생의 기존 신청 강좌
-        existing_enrollments = db.query(Enrollment).filter(
-            and_(
-                Enrollment.student_id == student_id,
-                Enrollment.status == "ENROLLED"
+    def _enrolled_course_ids(db: Session, student_id: int) -> list[int]:
+        """학생의 신청 강좌 ID"""
+        return [
+            course_id for (course_id,) in db.query(Enrollment.course_id).filter(
+                and_(
+                    Enrollment.student_id == student_id,
+                    Enrollment.status == "ENROLLED"
+                )
             )
-        ).all()
-        
-        for enrollment in existing_enrollments:
-            existing_schedule = db.query(Schedule).filter(
-                Schedule.course_id == enrollment.course_id
-            ).first()
-            
-            if existing_schedule and EnrollmentService._schedules_conflict(
-                new_schedule, existing_schedule
-            ):
-                return True
-        
-        return False
+        ]
     
     @staticmethod
-    def _schedules_conflict(schedule1: Schedule, schedule2: Schedule) -> bool:
-        """두 시간표가 충돌하는지 확인"""
-        # 같은 요일이고 시간이 겹치는 경우
-        if schedule1.day_of_week != schedule2.day_of_week:
+    def _has_time_conflict(db: Session, student_id: int, new_course_id: int) -> bool:
+        """시간 충돌 확인 (충돌 인접 비트셋으로 후보 → 실제 수업 시각으로 확인, services/conflict_service.py)"""
+        conflict_index.ensure(db)
+        if not conflict_index.stale and not conflict_index.mask(new_course_id):
             return False
         
-        # 시간 겹침 체크: s1.start < s2.end AND s2.start < s1.end
-        return (
-            schedule1.start_time < schedule2.end_time and
-            schedule2.start_time < schedule1.end_time
-        )
+        existing = EnrollmentService._enrolled_course_ids(db, student_id)
+        candidates = conflict_index.candidates(new_course_id, existing)
+        return bool(candidates) and bool(conflict_index.confirm(db, new_course_id, candidates))
+    
+    @staticmethod
+    def _schedules_conflict(meetings1, meetings2) -> bool:
+        """두 강좌의 수업 목록이 겹치는지 확인 (요일별 구간 인덱스)"""
+        # 한쪽을 요일별 정렬 구간으로 두고 다른 쪽 수업마다 이분 탐색
+        index = IntervalIndex()
+        index.add_meetings(None, meetings1)
+        return bool(index.conflicts(meetings2))
     
     @staticmethod
     def _get_conflicting_courses(db: Session, student_id: int, new_course_id: int) -> list:
         """충돌하는 강좌 목록 반환"""
-        new_schedule = db.query(Schedule).filter(
-            Schedule.course_id == new_course_id
-        ).first()
-        
-        if not new_schedule:
+        conflict_index.ensure(db)
+        existing = EnrollmentService._enrolled_course_ids(db, student_id)
+        conflicting_ids = conflict_index.confirm(
+            db, new_course_id, conflict_index.candidates(new_course_id, existing)
+        )
+        if not conflicting_ids:
             return []
         
-        conflicting = []
-        existing_enrollments = db.query(Enrollment).filter(
-            and_(
-                Enrollment.student_id == student_id,
-                Enrollment.status == "ENROLLED"
-            )
-        ).all()
+        rows = db.query(Course.id, Course.name, Schedule).join(
+            Schedule, Schedule.course_id == Course.id
+        ).filter(
+            Course.id.in_(conflicting_ids)
+        ).order_by(Course.id).all()
         
-        for enrollment in existing_enrollments:
-            existing_schedule = db.query(Schedule).filter(
-                Schedule.course_id == enrollment.course_id
-            ).first()
-            
-            if existing_schedule and EnrollmentService._schedules_conflict(
-                new_schedule, existing_schedule
-            ):
-                course = db.query(Course).filter(
-                    Course.id == enrollment.course_id
-                ).first()
-                if course:
-                    conflicting.append({
-                        "id": course.id,
-                        "name": course.name,
-                        "schedule": f"{existing_schedule.day_of_week.value} {existing_schedule.start_time}-{existing_schedule.end_time}"
-                    })
+        meetings: dict[int, tuple] = {}
+        for course_id, name, schedule in rows:
+            meetings.setdefault(course_id, (name, []))[1].append(schedule)
         
-        return conflicting
+        return [
+            {
+                "id": course_id,
+                "name": name,
+                "schedule": ", ".join(
+                    f"{schedule.day_of_week.value} {schedule.start_time}-{schedule.end_time}"
+                    for schedule in sort_meetings(schedules)
+                )
+            }
+            for course_id, (name, schedules) in meetings.items()
+        ]
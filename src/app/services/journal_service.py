@@ -0,0 +1,311 @@
+"""
+services/journal_service.py - 수강신청 저널 + 스냅샷 복구
+
+신청/취소 트랜잭션 안에서 `enrollment_events`에 이벤트를 추가하고(append-only),
+주기적으로 마지막 스냅샷 + 이후 이벤트(tail)를 접어 새 스냅샷을 만듭니다.
+시작 시 최신 스냅샷을 읽고 tail만 재생해 인메모리 좌석 카운터/학생별 학점을
+복구하므로 복구 시간은 테이블 크기가 아니라 tail 길이에 비례합니다.
+
+- 이벤트 id는 SQLite 쓰기 잠금 아래에서 증가하므로 커밋 순서와 같음
+  (읽기 트랜잭션은 항상 이벤트 id의 앞부분(prefix)만 봄)
+- 인메모리 상태는 커밋 후 훅으로만 반영 (롤백/재시도된 트랜잭션은 반영 안 됨)
+- 학과별 샤딩 모드의 신청/취소는 저널에 기록하지 않음
+"""
+import json
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.database import after_commit, begin_write
+from app.models import EnrollmentEvent, EnrollmentSnapshot
+from app.utils.db_retry import run_write_transaction
+from app.utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+ENROLL = "ENROLL"
+CANCEL = "CANCEL"
+
+JOURNAL_EVENTS = registry.counter(
+    "enrollment_journal_events_total",
+    "Committed enrollment journal events",
+    ("event_type",),
+)
+JOURNAL_SNAPSHOTS = registry.counter(
+    "enrollment_journal_snapshots_total",
+    "Enrollment journal snapshots written",
+)
+
+
+def _fold(seats: dict, loads: dict, event_type: str, student_id: int, course_id: int, credits: int):
+    """이벤트 1건을 강좌별 인원/학생별 [학점, 강좌 수]에 반영 (0이 되면 항목 제거)"""
+    sign = 1 if event_type == ENROLL else -1
+    enrolled = seats.get(course_id, 0) + sign
+    if enrolled:
+        seats[course_id] = enrolled
+    else:
+        seats.pop(course_id, None)
+
+    load = loads.get(student_id, (0, 0))
+    load = (load[0] + sign * credits, load[1] + sign)
+    if load[1]:
+        loads[student_id] = load
+    else:
+        loads.pop(student_id, None)
+
+
+class EnrollmentState:
+    """인메모리 강좌별 신청 인원 + 학생별 (학점, 강좌 수)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.seats: dict[int, int] = {}
+            self.student_loads: dict[int, tuple] = {}
+            self.last_event_id = 0
+            self.snapshot_event_id = 0
+
+    def load(self, seats: dict, student_loads: dict, last_event_id: int, snapshot_event_id: int):
+        with self._lock:
+            self.seats = seats
+            self.student_loads = student_loads
+            self.last_event_id = last_event_id
+            self.snapshot_event_id = snapshot_event_id
+
+    def apply(self, event_id: int, event_type: str, student_id: int, course_id: int, credits: int):
+        with self._lock:
+            _fold(self.seats, self.student_loads, event_type, student_id, course_id, credits)
+            self.last_event_id = max(self.last_event_id, event_id)
+
+    def enrolled(self, course_id: int) -> int:
+        return self.seats.get(course_id, 0)
+
+    def student_load(self, student_id: int) -> tuple:
+        """(신청 학점, 신청 강좌 수)"""
+        return self.student_loads.get(student_id, (0, 0))
+
+    @property
+    def tail_events(self) -> int:
+        """마지막 스냅샷 이후 이벤트 수 (대략, 커밋 순서로 반영되지 않은 이벤트 포함 가능)"""
+        return self.last_event_id - self.snapshot_event_id
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "courses": len(self.seats),
+                "students": len(self.student_loads),
+                "enrolled": sum(self.seats.values()),
+                "last_event_id": self.last_event_id,
+                "snapshot_event_id": self.snapshot_event_id,
+                "tail_events": self.last_event_id - self.snapshot_event_id,
+            }
+
+
+enrollment_state = EnrollmentState()
+
+
+class JournalService:
+    """수강신청 저널 기록/스냅샷/복구"""
+
+    @staticmethod
+    def record(
+        db: Session,
+        event_type: str,
+        enrollment_id: int,
+        student_id: int,
+        course_id: int,
+        credits: int,
+        state: EnrollmentState = None,
+    ) -> EnrollmentEvent:
+        """현재 트랜잭션에 이벤트 추가 (커밋되면 인메모리 상태에 반영)"""
+        state = state or enrollment_state
+        event = EnrollmentEvent(
+            event_type=event_type,
+            enrollment_id=enrollment_id,
+            student_id=student_id,
+            course_id=course_id,
+            credits=credits,
+        )
+        db.add(event)
+        db.flush()
+
+        event_id = event.id
+
+        def apply():
+            state.apply(event_id, event_type, student_id, course_id, credits)
+            JOURNAL_EVENTS.inc(event_type)
+
+        after_commit(db, apply)
+        return event
+
+    @staticmethod
+    def record_many(db: Session, events: list, state: EnrollmentState = None) -> list:
+        """이벤트 여러 건을 한 번에 추가 (`events`: (event_type, enrollment_id, student_id, course_id, credits))"""
+        state = state or enrollment_state
+        if not events:
+            return []
+        table = EnrollmentEvent.__table__
+        event_ids = db.connection().execute(
+            insert(table).returning(table.c.id, sort_by_parameter_order=True),
+            [
+                {
+                    "event_type": event_type,
+                    "enrollment_id": enrollment_id,
+                    "student_id": student_id,
+                    "course_id": course_id,
+                    "credits": credits,
+                }
+                for event_type, enrollment_id, student_id, course_id, credits in events
+            ],
+        ).scalars().all()
+
+        def apply():
+            for event_id, (event_type, _, student_id, course_id, credits) in zip(event_ids, events):
+                state.apply(event_id, event_type, student_id, course_id, credits)
+                JOURNAL_EVENTS.inc(event_type)
+
+        after_commit(db, apply)
+        return event_ids
+
+    @staticmethod
+    def latest_snapshot(db: Session) -> Optional[EnrollmentSnapshot]:
+        return db.query(EnrollmentSnapshot).order_by(EnrollmentSnapshot.last_event_id.desc()).first()
+
+    @staticmethod
+    def _replay(db: Session) -> tuple:
+        """최신 스냅샷 + tail 이벤트 재생 → (seats, loads, last_event_id, snapshot_event_id, replayed)"""
+        snapshot = JournalService.latest_snapshot(db)
+        seats, loads, base = {}, {}, 0
+        if snapshot:
+            seats = {int(course_id): enrolled for course_id, enrolled in json.loads(snapshot.seats).items()}
+            loads = {int(student_id): tuple(load) for student_id, load in json.loads(snapshot.student_loads).items()}
+            base = snapshot.last_event_id
+
+        last, replayed = base, 0
+        tail = db.execute(
+            select(
+                EnrollmentEvent.id,
+                EnrollmentEvent.event_type,
+                EnrollmentEvent.student_id,
+                EnrollmentEvent.course_id,
+                EnrollmentEvent.credits,
+            )
+            .where(EnrollmentEvent.id > base)  # rowid 범위 스캔
+            .order_by(EnrollmentEvent.id)
+            .execution_options(yield_per=1000)
+        )
+        for event_id, event_type, student_id, course_id, credits in tail:
+            _fold(seats, loads, event_type, student_id, course_id, credits)
+            last = event_id
+            replayed += 1
+        return seats, loads, last, base, replayed
+
+    @staticmethod
+    def take_snapshot(db: Session, min_events: int = 1, state: EnrollmentState = None) -> Optional[dict]:
+        """tail을 접어 새 스냅샷 저장 (tail이 `min_events`건 미만이면 None)
+
+        계산은 읽기 트랜잭션에서, 저장만 짧은 쓰기 트랜잭션으로 합니다.
+        """
+        state = state or enrollment_state
+        start = time.perf_counter()
+        seats, loads, last, base, folded = JournalService._replay(db)
+        db.rollback()  # 읽기 트랜잭션 종료
+        if folded < max(min_events, 1):
+            return None
+
+        snapshot = EnrollmentSnapshot(
+            last_event_id=last,
+            events_folded=folded,
+            seats=json.dumps(seats, separators=(",", ":")),
+            student_loads=json.dumps({sid: list(load) for sid, load in loads.items()}, separators=(",", ":")),
+        )
+
+        def write():
+            begin_write(db)
+            db.add(snapshot)
+
+        run_write_transaction(db, "journal_snapshot", write)
+        state.snapshot_event_id = max(state.snapshot_event_id, last)
+        JOURNAL_SNAPSHOTS.inc()
+
+        elapsed = time.perf_counter() - start
+        logger.info(
+            "📸 저널 스냅샷 #%s: 이벤트 %d건 반영 (last_event_id=%s, %.3f초)", snapshot.id, folded, last, elapsed,
+            extra={"snapshot_id": snapshot.id, "last_event_id": last, "events_folded": folded},
+        )
+        return {
+            "id": snapshot.id,
+            "last_event_id": last,
+            "events_folded": folded,
+            "courses": len(seats),
+            "students": len(loads),
+            "elapsed_s": round(elapsed, 4),
+        }
+
+    @staticmethod
+    def rebuild(db: Session, state: EnrollmentState = None) -> dict:
+        """최신 스냅샷 + tail 재생으로 인메모리 상태 복구"""
+        state = state or enrollment_state
+        start = time.perf_counter()
+        seats, loads, last, base, replayed = JournalService._replay(db)
+        db.rollback()
+        state.load(seats, loads, last, base)
+
+        elapsed = time.perf_counter() - start
+        logger.info("🧾 저널 복구: 스냅샷(last_event_id=%s) + 이벤트 %d건 재생 (%.3f초)", base, replayed, elapsed)
+        return {
+            "snapshot_event_id": base,
+            "replayed_events": replayed,
+            "last_event_id": last,
+            "elapsed_s": round(elapsed, 4),
+        }
+
+
+class JournalSnapshotter:
+    """tail이 일정 건수 이상 쌓이면 주기적으로 스냅샷 (백그라운드 스레드)"""
+
+    def __init__(self, session_factory: Callable[[], Session], interval_s: float, min_events: int):
+        self.session_factory = session_factory
+        self.interval_s = interval_s
+        self.min_events = min_events
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self.interval_s <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="journal-snapshotter", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+
+    def run_once(self) -> Optional[dict]:
+        # 인메모리 tail 길이로 먼저 거름 (저널을 읽지 않음)
+        if enrollment_state.tail_events < self.min_events:
+            return None
+        db = self.session_factory()
+        try:
+            return JournalService.take_snapshot(db, self.min_events)
+        finally:
+            db.close()
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("❌ 저널 스냅샷 실패")
+
@@ -0,0 +1,261 @@
+"""
+services/reconciliation_service.py - Course.enrolled 정합성 점검 (백그라운드, 점진적)
+
+강좌를 id 순으로 작은 배치로 나눠 `Course.enrolled`와 실제 ENROLLED 수를 비교합니다.
+
+- 배치마다 짧은 읽기 트랜잭션 1개 (WAL에서 쓰기를 막지 않음)
+- 실제 인원은 `(course_id, status)` 인덱스만으로 셈 (커버링 인덱스, 테이블 접근 없음)
+- 배치 사이에 쉬어 CPU/GIL을 신청 요청에 양보 (스로틀): 대기 시간은 최소 `pause_s`,
+  그리고 배치 처리 시간이 전체의 `max_duty` 이하가 되도록 늘림
+  → 부하가 높아 배치가 느려지면 점검이 자동으로 물러남
+- 보정(repair)은 불일치 강좌마다 BEGIN IMMEDIATE 안에서 다시 세고 UPDATE 1건
+  → 쓰기 잠금은 강좌 1개 분량만 잡음
+
+같은 읽기 트랜잭션에서 두 값을 함께 읽으므로(신청/취소는 둘을 한 트랜잭션에서 바꿈)
+진행 중인 신청 때문에 생기는 일시적 차이는 불일치로 보고되지 않습니다.
+학과별 샤딩 모드에서는 강좌가 샤드에 있으므로 점검하지 않습니다.
+"""
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import ReadSessionLocal, SessionLocal, begin_write
+from app.models import Course, Enrollment
+from app.services.department_stats_service import department_stats
+from app.utils.db_retry import run_write_transaction
+from app.utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# 응답에 담을 불일치 강좌 예시 수
+MAX_DRIFT_SAMPLES = 20
+
+RECONCILE_SCANNED = registry.counter(
+    "reconcile_courses_scanned_total",
+    "Courses checked by the enrolled-count reconciler",
+)
+RECONCILE_DRIFT = registry.counter(
+    "reconcile_drift_detected_total",
+    "Courses whose enrolled counter differed from ENROLLED rows",
+)
+RECONCILE_REPAIRED = registry.counter(
+    "reconcile_repaired_total",
+    "Courses whose enrolled counter was repaired",
+)
+RECONCILE_DRIFT_COURSES = registry.gauge(
+    "reconcile_drift_courses",
+    "Drifted courses found by the last completed reconciliation pass",
+)
+RECONCILE_DRIFT_SEATS = registry.gauge(
+    "reconcile_drift_seats",
+    "Sum of |enrolled - actual| found by the last completed reconciliation pass",
+)
+RECONCILE_BATCH_SECONDS = registry.histogram(
+    "reconcile_batch_seconds",
+    "Time spent reading one reconciliation batch",
+)
+
+
+def _actual_enrolled(course_id):
+    """강좌별 ENROLLED 수 (ix_enrollments_course_status 커버링 조회)"""
+    return (
+        select(func.count())
+        .select_from(Enrollment)
+        .where(Enrollment.course_id == course_id, Enrollment.status == "ENROLLED")
+    )
+
+
+class ReconciliationService:
+    """Course.enrolled ↔ ENROLLED 수 점검/보정"""
+
+    @staticmethod
+    def check_batch(db: Session, after_id: int, batch_size: int) -> list:
+        """`after_id` 다음 강좌 `batch_size`개의 (id, enrolled, actual)"""
+        actual = _actual_enrolled(Course.id).correlate(Course).scalar_subquery()
+        rows = db.execute(
+            select(Course.id, Course.enrolled, actual.label("actual"))
+            .where(Course.id > after_id)  # rowid 범위 스캔
+            .order_by(Course.id)
+            .limit(batch_size)
+        ).all()
+        db.rollback()  # 배치마다 읽기 트랜잭션 종료
+        return rows
+
+    @staticmethod
+    def repair_course(db: Session, course_id: int) -> Optional[tuple]:
+        """쓰기 잠금 아래에서 다시 세어 보정 → (이전 값, 실제 값), 이미 맞으면 None"""
+
+        def work():
+            begin_write(db)
+            before = db.scalar(select(Course.enrolled).where(Course.id == course_id))
+            actual = db.scalar(_actual_enrolled(course_id))
+            if before is None or before == actual:
+                return None
+            db.execute(update(Course).where(Course.id == course_id).values(enrolled=actual))
+            department_stats.record_enrolled(db, course_id, actual)
+            return before, actual
+
+        return run_write_transaction(db, "reconcile_repair", work)
+
+    @staticmethod
+    def run_pass(
+        read_db: Session,
+        write_db: Session,
+        batch_size: int,
+        pause_s: float = 0.0,
+        repair: bool = False,
+        stop: threading.Event = None,
+        max_duty: float = 1.0,
+    ) -> dict:
+        """전체 강좌 1회 점검 (stop이 설정되면 배치 경계에서 중단)"""
+        stop = stop or threading.Event()
+        started = time.perf_counter()
+        result = {
+            "started_at": datetime.utcnow(),
+            "repair": repair,
+            "batches": 0,
+            "scanned": 0,
+            "drifted": 0,
+            "drift_seats": 0,
+            "repaired": 0,
+            "samples": [],
+            "completed": False,
+        }
+
+        after_id = 0
+        while True:
+            batch_start = time.perf_counter()
+            rows = ReconciliationService.check_batch(read_db, after_id, batch_size)
+            batch_elapsed = time.perf_counter() - batch_start
+            RECONCILE_BATCH_SECONDS.observe(batch_elapsed)
+            if not rows:
+                result["completed"] = True
+                break
+
+            after_id = rows[-1].id
+            result["batches"] += 1
+            result["scanned"] += len(rows)
+            RECONCILE_SCANNED.inc(amount=len(rows))
+
+            for course_id, enrolled, actual in rows:
+                if enrolled == actual:
+                    continue
+                result["drifted"] += 1
+                result["drift_seats"] += abs(enrolled - actual)
+                RECONCILE_DRIFT.inc()
+                if len(result["samples"]) < MAX_DRIFT_SAMPLES:
+                    result["samples"].append({"course_id": course_id, "enrolled": enrolled, "actual": actual})
+                logger.warning(
+                    "⚠️ 신청 인원 불일치: course_id=%s enrolled=%s actual=%s", course_id, enrolled, actual,
+                    extra={"course_id": course_id, "enrolled": enrolled, "actual": actual},
+                )
+                if repair and ReconciliationService.repair_course(write_db, course_id):
+                    result["repaired"] += 1
+                    RECONCILE_REPAIRED.inc()
+
+            if len(rows) < batch_size:
+                result["completed"] = True
+                break
+            # 스로틀: 점검 시간 비율이 max_duty를 넘지 않게 (종료 요청 시 중단)
+            if stop.wait(max(pause_s, batch_elapsed * (1 - max_duty) / max_duty)):
+                break
+
+        result["elapsed_s"] = round(time.perf_counter() - started, 4)
+        if result["completed"]:
+            RECONCILE_DRIFT_COURSES.set(result["drifted"])
+            RECONCILE_DRIFT_SEATS.set(result["drift_seats"])
+        logger.info(
+            "🔎 신청 인원 점검: 강좌 %d개, 불일치 %d개, 보정 %d개 (%.3f초)",
+            result["scanned"], result["drifted"], result["repaired"], result["elapsed_s"],
+        )
+        return result
+
+
+class Reconciler:
+    """주기적으로 전체 강좌를 점검 (백그라운드 스레드, 한 번에 한 패스만)"""
+
+    def __init__(
+        self,
+        read_session_factory: Callable[[], Session],
+        write_session_factory: Callable[[], Session],
+        interval_s: float,
+        batch_size: int,
+        pause_s: float,
+        repair: bool,
+        max_duty: float = 1.0,
+    ):
+        self.read_session_factory = read_session_factory
+        self.write_session_factory = write_session_factory
+        self.interval_s = interval_s
+        self.batch_size = batch_size
+        self.pause_s = pause_s
+        self.repair = repair
+        self.max_duty = max_duty
+        self.last_pass: Optional[dict] = None
+        self._pass_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._pass_lock.locked()
+
+    def start(self):
+        if self.interval_s <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="enrolled-reconciler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+
+    def run_pass(self, read_db: Session, write_db: Session, repair: bool = None) -> Optional[dict]:
+        """1회 점검 (다른 패스가 진행 중이면 None)"""
+        if not self._pass_lock.acquire(blocking=False):
+            return None
+        try:
+            self.last_pass = ReconciliationService.run_pass(
+                read_db,
+                write_db,
+                self.batch_size,
+                self.pause_s,
+                self.repair if repair is None else repair,
+                self._stop,
+                self.max_duty,
+            )
+            return self.last_pass
+        finally:
+            self._pass_lock.release()
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            read_db, write_db = self.read_session_factory(), self.write_session_factory()
+            try:
+                self.run_pass(read_db, write_db)
+            except Exception:
+                logger.exception("❌ 신청 인원 점검 실패")
+            finally:
+                read_db.close()
+                write_db.close()
+
+
+reconciler = Reconciler(
+    ReadSessionLocal,
+    SessionLocal,
+    settings.reconcile_interval_s,
+    settings.reconcile_batch_size,
+    settings.reconcile_batch_pause_ms / 1000,
+    settings.reconcile_repair,
+    settings.reconcile_max_duty,
+)
@@ -0,0 +1,452 @@
+"""
+services/sharded_enrollment_service.py - 학과별 샤딩 모드 수강신청 서비스
+
+`SHARD_BY_DEPARTMENT=true`일 때 사용합니다. (`database.ShardRouter`)
+  - 강좌/시간표/좌석 카운터/수강신청: 강좌 학과의 샤드 DB
+  - 학생/학생별 신청 학점(`StudentCreditLoad`): 코디네이터(기본) DB
+  - 학생이 신청한 강좌가 있는 학과(`StudentDepartmentLoad`): 코디네이터 DB.
+    학생별 조회(시간 충돌/시간표)는 이 학과의 샤드만 읽음
+    (샤드 커밋 전에 늘리고 취소 커밋 후에 줄이므로 항상 실제 학과의 상위 집합)
+
+🔒 동시성 제어:
+  - 앱 락 순서는 단일 DB 모드와 동일 (강좌/학생 키)
+  - 학점 예약: 코디네이터에서 짧은 `BEGIN IMMEDIATE` 조건부 UPDATE 후 바로 커밋
+  - 좌석 + 수강신청: 샤드에서 `BEGIN IMMEDIATE` → 다른 학과 샤드와 병렬 커밋
+  - 샤드 트랜잭션이 실패하면 예약한 학점을 되돌림 (보상 트랜잭션)
+"""
+import heapq
+import logging
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import and_, func, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.config import settings
+from app.database import ShardRouter, begin_write, shard_router
+from app.models import Course, Enrollment, Schedule, Student, StudentCreditLoad, StudentDepartmentLoad
+from app.services.data_stats_service import data_stats
+from app.services.enrollment_service import _acquire_locks
+from app.utils.exceptions import (
+    BusinessException,
+    StudentNotFoundException,
+    CourseNotFoundException,
+    EnrollmentNotFoundException,
+    CapacityExceededException,
+    CreditExceededException,
+    TimeConflictException,
+    AlreadyEnrolledException,
+)
+from app.utils.interval_index import IntervalIndex
+from app.utils.schedule_bits import sort_meetings
+
+logger = logging.getLogger(__name__)
+
+
+def _format_schedule(meetings) -> Optional[str]:
+    if not meetings:
+        return None
+    return ", ".join(
+        f"{meeting.day_of_week.value} {meeting.start_time}-{meeting.end_time}" for meeting in sort_meetings(meetings)
+    )
+
+
+class ShardedEnrollmentService:
+    """학과별 샤드 수강신청/조회"""
+
+    @staticmethod
+    def enroll_course(db: Session, student_id: int, course_id: int, router: ShardRouter = None) -> Enrollment:
+        """
+        수강신청 (학점은 코디네이터, 좌석/신청 내역은 학과 샤드에 커밋)
+
+        Args:
+            db: 코디네이터 DB 세션
+            student_id: 학생 ID
+            course_id: 강좌 ID
+            router: 샤드 라우터 (기본: 전역 `shard_router`)
+
+        Raises:
+            EnrollmentService.enroll_course와 동일
+        """
+        router = router or shard_router
+        logger.debug("📝 수강신청 시작 (샤드): student_id=%s, course_id=%s", student_id, course_id)
+
+        department_id = router.department_for_course(course_id)
+        if department_id is None:
+            raise CourseNotFoundException(course_id)
+
+        lock_keys = (
+            f"course:{course_id}",
+            f"student:{student_id}",
+        )
+
+        try:
+            with _acquire_locks(*lock_keys):
+                if db.get(Student, student_id) is None:
+                    raise StudentNotFoundException(student_id)
+                departments = ShardedEnrollmentService._student_departments(db, student_id)
+                db.rollback()  # 조회 트랜잭션 종료 (학점 예약은 새 쓰기 트랜잭션)
+
+                shard = router.session(department_id)
+                try:
+                    course = shard.query(Course).options(joinedload(Course.schedules)).filter(
+                        Course.id == course_id
+                    ).first()
+                    if not course:
+                        raise CourseNotFoundException(course_id)
+
+                    existing = shard.query(Enrollment.id).filter(
+                        and_(
+                            Enrollment.student_id == student_id,
+                            Enrollment.course_id == course_id,
+                            Enrollment.status == "ENROLLED",
+                        )
+                    ).first()
+                    if existing:
+                        logger.warning(
+                            "⚠️ 이미 신청함: %s -> %s", student_id, course_id,
+                            extra={"student_id": student_id, "course_id": course_id, "reason": "already_enrolled"},
+                        )
+                        raise AlreadyEnrolledException(course_id)
+                    # 읽기 트랜잭션 종료 (expire_on_commit=False라 로드한 강좌/시간표 유지)
+                    shard.commit()
+
+                    conflicting = ShardedEnrollmentService._get_conflicting_courses(
+                        router, departments, student_id, course.schedules
+                    )
+                    if conflicting:
+                        logger.warning(
+                            "⚠️ 시간 충돌: %s -> %s", student_id, course_id,
+                            extra={"student_id": student_id, "course_id": course_id, "reason": "time_conflict"},
+                        )
+                        raise TimeConflictException(conflicting)
+
+                    ShardedEnrollmentService._reserve_credits(
+                        db, router, student_id, course_id, department_id, course.credits
+                    )
+                    try:
+                        enrollment = ShardedEnrollmentService._commit_seat(router, shard, department_id, student_id, course)
+                    except Exception:
+                        ShardedEnrollmentService._release_credits(db, router, student_id, department_id, course.credits)
+                        raise
+                finally:
+                    shard.close()
+
+                logger.info(
+                    "✅ 수강신청 성공 (샤드 %s): student_id=%s, course_id=%s, enrollment_id=%s",
+                    department_id, student_id, course_id, enrollment.id,
+                    extra={"student_id": student_id, "course_id": course_id, "enrollment_id": enrollment.id},
+                )
+                return enrollment
+
+        except BusinessException:
+            raise
+        except Exception as e:
+            logger.error("❌ 수강신청 실패 (샤드): %s", e, extra={"student_id": student_id, "course_id": course_id})
+            raise
+
+    @staticmethod
+    def cancel_enrollment(db: Session, student_id: int, enrollment_id: int, router: ShardRouter = None) -> Enrollment:
+        """수강취소 (샤드에서 좌석 반환 후 코디네이터 학점 차감)"""
+        router = router or shard_router
+        logger.debug("🗑️ 수강취소 시작 (샤드): student_id=%s, enrollment_id=%s", student_id, enrollment_id)
+
+        department_id = router.department_for_enrollment(enrollment_id)
+        if department_id is None:
+            raise EnrollmentNotFoundException(enrollment_id)
+
+        lock_keys = (
+            f"student:{student_id}",
+            f"enrollment:{enrollment_id}",
+        )
+
+        try:
+            with _acquire_locks(*lock_keys):
+                shard = router.session(department_id)
+                try:
+                    with router.write_lock(department_id):
+                        try:
+                            begin_write(shard)
+                            enrollment = shard.query(Enrollment).options(
+                                joinedload(Enrollment.course).joinedload(Course.schedules)
+                            ).filter(
+                                and_(
+                                    Enrollment.id == enrollment_id,
+                                    Enrollment.student_id == student_id,
+                                    Enrollment.status == "ENROLLED",
+                                )
+                            ).first()
+                            if not enrollment:
+                                raise EnrollmentNotFoundException(enrollment_id)
+
+                            course = enrollment.course
+                            shard.execute(
+                                update(Course)
+                                .where(Course.id == enrollment.course_id, Course.enrolled > 0)
+                                .values(enrolled=Course.enrolled - 1)
+                            )
+                            credits = course.credits
+                            enrollment.status = "CANCELLED"
+                            enrollment.cancelled_at = datetime.utcnow()
+                            data_stats.record(shard, "enrollments", -1)
+                            shard.commit()
+                        except Exception:
+                            shard.rollback()
+                            raise
+                finally:
+                    shard.close()
+
+                ShardedEnrollmentService._release_credits(db, router, student_id, department_id, credits)
+
+                logger.info(
+                    "✅ 수강취소 완료 (샤드 %s): enrollment_id=%s", department_id, enrollment_id,
+                    extra={"student_id": student_id, "enrollment_id": enrollment_id},
+                )
+                return enrollment
+
+        except BusinessException:
+            raise
+        except Exception as e:
+            logger.error("❌ 수강취소 실패 (샤드): %s", e, extra={"student_id": student_id, "enrollment_id": enrollment_id})
+            raise
+
+    @staticmethod
+    def _reserve_credits(
+        db: Session, router: ShardRouter, student_id: int, course_id: int, department_id: int, credits: int
+    ):
+        """코디네이터에서 학점 예약 (최대 학점을 넘으면 CreditExceededException)"""
+        with router.coordinator_write_lock:
+            try:
+                current = ShardedEnrollmentService._try_reserve(db, student_id, department_id, credits)
+            except Exception:
+                db.rollback()
+                raise
+        if current is not None:
+            logger.warning(
+                "⚠️ 학점 초과: %s + %s > %s", current, credits, settings.max_credits_per_semester,
+                extra={"student_id": student_id, "course_id": course_id, "reason": "credit_exceeded"},
+            )
+            raise CreditExceededException(current, credits, settings.max_credits_per_semester)
+
+    @staticmethod
+    def _try_reserve(db: Session, student_id: int, department_id: int, credits: int) -> Optional[int]:
+        """조건부 UPDATE로 학점 예약 후 커밋 (초과 시 롤백하고 현재 학점 반환)"""
+        begin_write(db)
+        db.execute(
+            sqlite_insert(StudentCreditLoad)
+            .values(student_id=student_id, credits=0)
+            .on_conflict_do_nothing()
+        )
+        result = db.execute(
+            update(StudentCreditLoad)
+            .where(
+                StudentCreditLoad.student_id == student_id,
+                StudentCreditLoad.credits + credits <= settings.max_credits_per_semester,
+            )
+            .values(credits=StudentCreditLoad.credits + credits)
+        )
+        if result.rowcount != 1:
+            current = db.query(StudentCreditLoad.credits).filter(
+                StudentCreditLoad.student_id == student_id
+            ).scalar() or 0
+            db.rollback()
+            return current
+        db.execute(
+            sqlite_insert(StudentDepartmentLoad)
+            .values(student_id=student_id, department_id=department_id, courses=1)
+            .on_conflict_do_update(
+                index_elements=["student_id", "department_id"],
+                set_={"courses": StudentDepartmentLoad.courses + 1},
+            )
+        )
+        db.commit()
+        return None
+
+    @staticmethod
+    def _release_credits(db: Session, router: ShardRouter, student_id: int, department_id: int, credits: int):
+        """코디네이터 학점/학과별 신청 수 차감"""
+        with router.coordinator_write_lock:
+            try:
+                begin_write(db)
+                db.execute(
+                    update(StudentCreditLoad)
+                    .where(StudentCreditLoad.student_id == student_id)
+                    .values(credits=func.max(StudentCreditLoad.credits - credits, 0))
+                )
+                db.execute(
+                    update(StudentDepartmentLoad)
+                    .where(
+                        StudentDepartmentLoad.student_id == student_id,
+                        StudentDepartmentLoad.department_id == department_id,
+                    )
+                    .values(courses=func.max(StudentDepartmentLoad.courses - 1, 0))
+                )
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+
+    @staticmethod
+    def _commit_seat(router: ShardRouter, shard: Session, department_id: int, student_id: int, course: Course) -> Enrollment:
+        """샤드 쓰기 트랜잭션: 좌석 확보 + 수강신청 생성"""
+        with router.write_lock(department_id):
+            try:
+                return ShardedEnrollmentService._insert_enrollment(shard, department_id, student_id, course)
+            except Exception:
+                shard.rollback()
+                raise
+
+    @staticmethod
+    def _insert_enrollment(shard: Session, department_id: int, student_id: int, course: Course) -> Enrollment:
+        course_id = course.id
+        begin_write(shard)
+        result = shard.execute(
+            update(Course)
+            .where(Course.id == course_id, Course.enrolled < Course.capacity)
+            .values(enrolled=Course.enrolled + 1)
+        )
+        if result.rowcount != 1:
+            latest = shard.query(Course.capacity, Course.enrolled).filter(Course.id == course_id).first()
+            logger.warning(
+                "⚠️ 정원 초과: %s (%s/%s)", course_id, latest.enrolled, latest.capacity,
+                extra={
+                    "student_id": student_id,
+                    "course_id": course_id,
+                    "reason": "capacity_exceeded",
+                    "sample_key": ("capacity_exceeded", course_id),
+                },
+            )
+            raise CapacityExceededException(latest.capacity, latest.enrolled)
+
+        enrollment = Enrollment(
+            id=ShardRouter.next_enrollment_id(shard, department_id),
+            student_id=student_id,
+            course=course,
+            status="ENROLLED",
+        )
+        shard.add(enrollment)
+        data_stats.record(shard, "enrollments", 1)
+        shard.commit()
+        return enrollment
+
+    @staticmethod
+    def _student_departments(db: Session, student_id: int) -> list[int]:
+        """학생이 신청한 강좌가 있는 학과 (코디네이터 인덱스)"""
+        return [
+            row[0] for row in db.query(StudentDepartmentLoad.department_id).filter(
+                StudentDepartmentLoad.student_id == student_id,
+                StudentDepartmentLoad.courses > 0,
+            ).order_by(StudentDepartmentLoad.department_id)
+        ]
+
+    @staticmethod
+    def _get_conflicting_courses(router: ShardRouter, departments: list[int], student_id: int, new_meetings) -> list:
+        """학생의 신청 학과 샤드에서 시간이 겹치는 강좌 (샤드당 Core 쿼리 1회, 요일별 구간 인덱스)"""
+        if not new_meetings:
+            return []
+        query = (
+            select(Course.id, Course.name, Schedule.day_of_week, Schedule.start_time, Schedule.end_time)
+            .join(Enrollment, Enrollment.course_id == Course.id)
+            .join(Schedule, Schedule.course_id == Course.id)
+            .where(
+                Enrollment.student_id == student_id,
+                Enrollment.status == "ENROLLED",
+                Schedule.day_of_week.in_({meeting.day_of_week for meeting in new_meetings}),
+            )
+        )
+        timetable, names, meetings = IntervalIndex(), {}, {}
+        for department_id in departments:
+            with router.read_engine(department_id).connect() as conn:
+                for row in conn.execute(query):
+                    timetable.add(row.id, row.day_of_week, row.start_time, row.end_time)
+                    names[row.id] = row.name
+                    meetings.setdefault(row.id, []).append(row)
+        return [
+            {"id": course_id, "name": names[course_id], "schedule": _format_schedule(meetings[course_id])}
+            for course_id in sorted(timetable.conflicts(new_meetings))
+        ]
+
+    # ==================== 조회 (샤드 fan-out) ====================
+    @staticmethod
+    def get_course(course_id: int, router: ShardRouter = None) -> Course:
+        router = router or shard_router
+        department_id = router.department_for_course(course_id)
+        if department_id is None:
+            raise CourseNotFoundException(course_id)
+        with router.read_session(department_id) as shard:
+            course = shard.query(Course).options(joinedload(Course.schedules)).filter(
+                Course.id == course_id
+            ).first()
+        if not course:
+            raise CourseNotFoundException(course_id)
+        return course
+
+    @staticmethod
+    def list_courses(department_id: int = None, skip: int = 0, limit: int = 100, router: ShardRouter = None) -> list:
+        """강좌 목록 (학과 미지정 시 샤드별 결과를 ID 순으로 병합)"""
+        router = router or shard_router
+        if department_id:
+            if department_id not in router.department_ids():
+                return []
+            department_ids = [department_id]
+        else:
+            department_ids = router.department_ids()
+
+        per_shard = []
+        for shard_id in department_ids:
+            with router.read_session(shard_id) as shard:
+                per_shard.append(
+                    shard.query(Course)
+                    .options(selectinload(Course.schedules))
+                    .order_by(Course.id)
+                    .limit(skip + limit)
+                    .all()
+                )
+        merged = heapq.merge(*per_shard, key=lambda course: course.id)
+        return list(merged)[skip:skip + limit]
+
+    @staticmethod
+    def get_enrolled_courses(db: Session, student_id: int, router: ShardRouter = None) -> list:
+        """학생이 신청한 강좌 (시간표 포함, 신청 순)"""
+        router = router or shard_router
+        rows = []
+        for department_id in ShardedEnrollmentService._student_departments(db, student_id):
+            with router.read_session(department_id) as shard:
+                rows.extend(
+                    shard.query(Enrollment.enrolled_at, Course)
+                    .join(Course, Enrollment.course_id == Course.id)
+                    .options(joinedload(Course.schedules))
+                    .filter(
+                        and_(
+                            Enrollment.student_id == student_id,
+                            Enrollment.status == "ENROLLED",
+                        )
+                    )
+                    .all()
+                )
+        rows.sort(key=lambda row: row[0])
+        return [course for _, course in rows]
+
+    @staticmethod
+    def list_enrollments(student_id: int, status: str = None, router: ShardRouter = None) -> list:
+        router = router or shard_router
+        enrollments = []
+        for department_id in router.department_ids():
+            with router.read_session(department_id) as shard:
+                query = shard.query(Enrollment).filter(Enrollment.student_id == student_id)
+                if status:
+                    query = query.filter(Enrollment.status == status)
+                enrollments.extend(query.all())
+        enrollments.sort(key=lambda enrollment: enrollment.enrolled_at)
+        return enrollments
+
+    @staticmethod
+    def count(model, *criteria, router: ShardRouter = None) -> int:
+        """샤드 테이블 전체 행 수"""
+        router = router or shard_router
+        total = 0
+        for department_id in router.department_ids():
+            with router.read_session(department_id) as shard:
+                total += shard.query(func.count()).select_from(model).filter(*criteria).scalar()
+        return total
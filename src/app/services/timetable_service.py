@@ -0,0 +1,179 @@
+"""
+services/timetable_service.py - 시간 충돌 없는 시간표 조합 탐색
+
+학생이 신청을 여러 번 시도하며 맞는 분반 조합을 찾지 않도록, 희망 그룹(강좌 ID 목록
+또는 "알고리즘"처럼 분반 번호를 뺀 강좌명) 마다 분반 하나씩 골라 시간 충돌 없이
+학점 한도 안에 들고 빈자리가 있는 조합을 최대 K개 찾습니다.
+
+- 분기 한정(branch-and-bound) DFS: 후보가 적은 그룹부터, 빈자리 많은 분반부터 시도
+- 가지치기: 학점(남은 필수 그룹의 최소 학점 합), 전방 검사(남은 필수 그룹마다
+  현재 시간표와 겹치지 않는 분반이 하나라도 있는지)
+- 충돌 검사는 시간표 비트마스크 AND (utils/schedule_bits.py)
+- `time_budget_ms`를 넘으면 그때까지 찾은 조합만 반환 (`complete=false`)
+
+읽기만 하므로 DB 쓰기 잠금을 잡지 않습니다.
+"""
+import re
+import time
+from typing import Optional
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session, selectinload
+
+from app.config import settings
+from app.models import Course, Enrollment, Student
+from app.utils.exceptions import StudentNotFoundException
+from app.utils.schedule_bits import load_course_masks
+
+# 시간 예산 확인 간격 (탐색 노드 수)
+BUDGET_CHECK_INTERVAL = 256
+
+
+class _Stop(Exception):
+    """탐색 중단 (K개 도달 또는 시간 예산 초과)"""
+
+
+class TimetableService:
+    """시간표 조합 탐색"""
+
+    @staticmethod
+    def _candidates(db: Session, groups: list) -> tuple:
+        """그룹별 후보 강좌 ID 목록과 강좌 객체 (이름 그룹은 '이름' 또는 '이름 N')"""
+        names = {group.name for group in groups if group.name}
+        ids = {course_id for group in groups for course_id in group.course_ids}
+        criteria = [Course.id.in_(ids)] if ids else []
+        for name in names:
+            criteria += [Course.name == name, Course.name.like(f"{name} %")]
+        courses = {}
+        if criteria:
+            courses = {
+                course.id: course
+                for course in db.scalars(select(Course).options(selectinload(Course.schedules)).where(or_(*criteria)))
+            }
+
+        candidates = []
+        for group in groups:
+            found = [course_id for course_id in group.course_ids if course_id in courses]
+            if group.name:
+                pattern = re.compile(rf"{re.escape(group.name)}( \d+)?")
+                found += [c.id for c in courses.values() if pattern.fullmatch(c.name) and c.id not in found]
+            candidates.append(found)
+        return candidates, courses
+
+    @staticmethod
+    def build(
+        db: Session,
+        groups: list,
+        student_id: Optional[int] = None,
+        max_results: int = 5,
+        time_budget_ms: Optional[float] = None,
+    ) -> dict:
+        """그룹마다 분반 하나씩 고른 충돌 없는 조합을 최대 `max_results`개 탐색
+
+        `groups`: `course_ids`/`name`/`optional` 속성을 가진 객체 목록
+        `student_id`: 주면 기존 신청 강좌의 시간표/학점을 고정으로 반영
+        (`total_credits`는 기존 신청 학점 포함)
+        """
+        start = time.perf_counter()
+        budget_ms = time_budget_ms if time_budget_ms is not None else settings.timetable_time_budget_ms
+        deadline = start + budget_ms / 1000
+
+        candidates, courses = TimetableService._candidates(db, groups)
+
+        base_mask, base_credits, taken = 0, 0, set()
+        if student_id is not None:
+            if db.get(Student, student_id) is None:
+                raise StudentNotFoundException(student_id)
+            taken = set(db.scalars(
+                select(Enrollment.course_id).where(Enrollment.student_id == student_id, Enrollment.status == "ENROLLED")
+            ))
+            for course_id, mask in load_course_masks(db, taken).items():
+                base_mask |= mask
+            base_credits = sum(db.scalars(select(Course.credits).where(Course.id.in_(taken)))) if taken else 0
+
+        masks = load_course_masks(db, courses)
+        limit = settings.max_credits_per_semester
+
+        # 그룹별 (강좌 ID, 학점, 마스크): 빈자리/기존 신청/기존 시간표 충돌 제외, 빈자리 많은 순
+        options, empty_groups = [], []
+        for index, (group, found) in enumerate(zip(groups, candidates)):
+            usable = [
+                (course_id, courses[course_id].credits, masks.get(course_id, 0))
+                for course_id in sorted(found, key=lambda c: courses[c].enrolled - courses[c].capacity)
+                if courses[course_id].enrolled < courses[course_id].capacity
+                and course_id not in taken
+                and not masks.get(course_id, 0) & base_mask
+            ]
+            if not usable and not group.optional:
+                empty_groups.append(index)
+            options.append((index, group.optional, usable))
+
+        result = {
+            "combinations": [],
+            "empty_groups": empty_groups,
+            "explored": 0,
+            "complete": True,  # 탐색 공간을 끝까지 봤는지
+            "timed_out": False,
+        }
+        if empty_groups:
+            result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 2)
+            return result
+
+        # 필수 그룹(후보 적은 순) → 선택 그룹
+        options.sort(key=lambda option: (option[1], len(option[2])))
+        min_credits = [0] * (len(options) + 1)
+        for i in range(len(options) - 1, -1, -1):
+            _, optional, usable = options[i]
+            min_credits[i] = min_credits[i + 1] + (0 if optional else min(c for _, c, _ in usable))
+
+        found_combinations = []
+        chosen: list[int] = []
+        explored = 0
+
+        def feasible(i: int, mask: int) -> bool:
+            """남은 필수 그룹마다 현재 시간표와 겹치지 않는 분반이 있는지"""
+            return all(
+                optional or any(not m & mask for _, _, m in usable)
+                for _, optional, usable in options[i:]
+            )
+
+        def search(i: int, mask: int, credits: int):
+            nonlocal explored
+            explored += 1
+            if explored % BUDGET_CHECK_INTERVAL == 0 and time.perf_counter() > deadline:
+                raise _Stop("time_budget")
+            if i == len(options):
+                found_combinations.append((list(chosen), credits))
+                if len(found_combinations) >= max_results:
+                    raise _Stop("max_results")
+                return
+            if credits + min_credits[i] > limit or not feasible(i, mask):
+                return
+
+            _, optional, usable = options[i]
+            for course_id, course_credits, course_mask in usable:
+                if course_mask & mask or credits + course_credits > limit or course_id in chosen:
+                    continue
+                chosen.append(course_id)
+                search(i + 1, mask | course_mask, credits + course_credits)
+                chosen.pop()
+            if optional:
+                search(i + 1, mask, credits)
+
+        try:
+            search(0, base_mask, base_credits)
+        except _Stop as stop:
+            result["complete"] = False
+            result["timed_out"] = stop.args[0] == "time_budget"
+
+        result["combinations"] = [
+            {
+                "course_ids": course_ids,
+                "total_credits": total,
+                "courses": [courses[course_id] for course_id in course_ids],
+            }
+            for course_ids, total in found_combinations
+        ]
+        result["explored"] = explored
+        result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        return result
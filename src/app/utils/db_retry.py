@@ -0,0 +1,71 @@
+"""
+utils/db_retry.py - SQLite 쓰기 트랜잭션 재시도 정책
+
+`database is locked`(SQLITE_BUSY)로 실패한 쓰기 트랜잭션만 지수 백오프 +
+full jitter로 제한된 횟수만큼 다시 실행합니다. 재시도를 모두 소진하면
+503 + `Retry-After`(`DatabaseBusyException`)로 응답합니다.
+"""
+import logging
+import random
+import time
+from typing import Callable, TypeVar
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.utils.exceptions import DatabaseBusyException
+from app.utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DB_BUSY_RETRIES = registry.counter(
+    "db_busy_retries_total",
+    "Write transactions retried after SQLITE_BUSY",
+    ("operation",),
+)
+DB_BUSY_EXHAUSTED = registry.counter(
+    "db_busy_exhausted_total",
+    "Write transactions that failed with SQLITE_BUSY after all retries",
+    ("operation",),
+)
+
+
+def is_sqlite_busy(exc: BaseException) -> bool:
+    """SQLITE_BUSY(`database is locked`/`database is busy`) 여부"""
+    if not isinstance(exc, OperationalError):
+        return False
+    message = str(exc.orig).lower()
+    return "database is locked" in message or "database is busy" in message
+
+
+def backoff_delay(attempt: int) -> float:
+    """attempt번째 재시도 전 대기 시간 (초, full jitter)"""
+    ceiling = min(settings.db_busy_retry_max_ms, settings.db_busy_retry_base_ms * (2 ** (attempt - 1)))
+    return random.uniform(0, ceiling) / 1000.0
+
+
+def run_write_transaction(db: Session, operation: str, work: Callable[[], T]) -> T:
+    """`work()` 실행 후 커밋, SQLITE_BUSY면 롤백 후 재시도
+
+    `work`는 재실행해도 안전해야 합니다. (실패 시 롤백되므로 부분 반영 없음)
+    그 밖의 예외는 롤백 후 그대로 전달합니다. (쓰기 잠금을 즉시 해제)
+    """
+    attempts = max(1, settings.db_busy_retry_attempts)
+    for attempt in range(1, attempts + 1):
+        try:
+            result = work()
+            db.commit()
+            return result
+        except Exception as exc:
+            db.rollback()
+            if not is_sqlite_busy(exc):
+                raise
+            if attempt == attempts:
+                DB_BUSY_EXHAUSTED.inc(operation)
+                logger.warning("🔒 DB 잠금 재시도 소진: %s (%d회)", operation, attempts, extra={"operation": operation})
+                raise DatabaseBusyException(settings.db_busy_retry_after_s) from exc
+            DB_BUSY_RETRIES.inc(operation)
+            time.sleep(backoff_delay(attempt))
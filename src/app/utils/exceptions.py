@@ -13,6 +13,7 @@ class BusinessException(HTTPException):
         error_code: str,
         message: str,
         detail: dict = None,
+        headers: dict = None,
     ):
         self.error_code = error_code
         self.message = message
@@ -24,7 +25,8 @@ class BusinessException(HTTPException):
                 "code": error_code,
                 "message": message,
                 **self.detail,
-            }
+            },
+            headers=headers,
         )
 
 
@@ -32,6 +34,8 @@ class BusinessException(HTTPException):
 class CapacityExceededException(BusinessException):
     """정원 초과"""
     def __init__(self, capacity: int, enrolled: int):
+        self.capacity = capacity
+        self.enrolled = enrolled
         super().__init__(
             status_code=status.HTTP_400_BAD_REQUEST,
             error_code="CAPACITY_EXCEEDED",
@@ -39,6 +43,16 @@ class CapacityExceededException(BusinessException):
         )
 
 
+class CapacityBelowEnrolledException(BusinessException):
+    """정원을 현재 신청 인원보다 작게 변경"""
+    def __init__(self, capacity: int, enrolled: int):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            error_code="CAPACITY_BELOW_ENROLLED",
+            message=f"Capacity cannot be lower than current enrollment (capacity: {capacity}, enrolled: {enrolled})",
+        )
+
+
 # 학점 관련
 class CreditExceededException(BusinessException):
     """학점 초과"""
@@ -94,6 +108,16 @@ class CourseNotFoundException(BusinessException):
         )
 
 
+class DepartmentNotFoundException(BusinessException):
+    """학과 없음"""
+    def __init__(self, department_id: int):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            error_code="DEPARTMENT_NOT_FOUND",
+            message=f"Department not found (id: {department_id})",
+        )
+
+
 class EnrollmentNotFoundException(BusinessException):
     """수강신청 없음"""
     def __init__(self, enrollment_id: int):
@@ -104,6 +128,58 @@ class EnrollmentNotFoundException(BusinessException):
         )
 
 
+class ProfileNotFoundException(BusinessException):
+    """프로파일 없음"""
+    def __init__(self, profile_id: int):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            error_code="PROFILE_NOT_FOUND",
+            message=f"Profile not found or evicted from ring buffer (id: {profile_id})",
+        )
+
+
+class SnapshotNotFoundException(BusinessException):
+    """메모리 스냅샷 없음"""
+    def __init__(self, name: str):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            error_code="SNAPSHOT_NOT_FOUND",
+            message=f"Memory snapshot not found (name: {name})",
+        )
+
+
+class TracingNotStartedException(BusinessException):
+    """tracemalloc 추적 미시작"""
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            error_code="TRACING_NOT_STARTED",
+            message="Memory tracing is not started. Start it before taking snapshots.",
+        )
+
+
+class ShardedModeNotSupportedException(BusinessException):
+    """학과별 샤딩 모드에서 지원하지 않는 기능 (`feature`: export, import, allocation, ...)"""
+    def __init__(self, feature: str, message: str):
+        super().__init__(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            error_code="NOT_SUPPORTED_IN_SHARDED_MODE",
+            message=message,
+            detail={"feature": feature},
+        )
+
+
+# 사전 신청
+class PreferenceWindowClosedException(BusinessException):
+    """희망 강좌 제출 기간 아님"""
+    def __init__(self, start=None, end=None):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            error_code="PREFERENCE_WINDOW_CLOSED",
+            message=f"Preference submission window is closed (start: {start}, end: {end})",
+        )
+
+
 # 데이터 정합성
 class DatabaseError(BusinessException):
     """데이터베이스 오류"""
@@ -122,4 +198,39 @@ class DeadlockException(BusinessException):
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             error_code="DEADLOCK",
             message="Request failed due to database lock. Please retry.",
-        )
\ No newline at end of file
+        )
+
+
+class DatabaseBusyException(BusinessException):
+    """SQLite 쓰기 잠금 대기 재시도 소진"""
+    def __init__(self, retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            error_code="DATABASE_BUSY",
+            message="Database is busy. Please retry shortly.",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+# 요청 제한 (수강신청 라우트 입장 제어)
+class RateLimitedException(BusinessException):
+    """학생/클라이언트 IP별 요청 한도 초과"""
+    def __init__(self, retry_after: int, limit: str):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            error_code="RATE_LIMITED",
+            message=f"Too many requests. Please retry after {retry_after}s.",
+            detail={"limit": limit},
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class ServerOverloadedException(BusinessException):
+    """처리 대기 중인 요청이 너무 많음 (부하 차단)"""
+    def __init__(self, retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            error_code="SERVER_OVERLOADED",
+            message="Server is handling too many requests. Please retry shortly.",
+            headers={"Retry-After": str(retry_after)},
+        )
@@ -0,0 +1,65 @@
+"""
+utils/interval_index.py - 요일별 수업 시간 구간 인덱스
+
+강좌마다 수업이 여러 번(요일/시작/종료)일 때 "이 수업들과 겹치는 강좌"를
+수업 수 × 신청 강좌 수만큼 쌍별 비교하지 않고, 요일별로 시작 시각 순 정렬된
+구간 목록에서 이분 탐색으로 찾습니다.
+
+- 추가: 요일 목록에 정렬 삽입 + 누적 최대 종료 시각 갱신
+- 조회 [start, end): 시작 < end 인 마지막 구간을 bisect로 찾고, 거기서 앞으로
+  누적 최대 종료 시각 > start 인 동안만 확인
+  → 서로 겹치지 않는 구간 집합(정상 시간표)에서는 O(log n + 겹친 구간 수)
+- 맞닿는 수업(앞 수업 종료 == 다음 수업 시작)은 충돌 아님
+"""
+from bisect import bisect_left, bisect_right
+from typing import Hashable, Iterable
+
+
+class IntervalIndex:
+    """요일 → 시작 시각 순 (시작, 종료, 키) 목록"""
+
+    def __init__(self):
+        # 요일 → [시작 목록, (시작, 종료, 키) 목록, 누적 최대 종료 목록]
+        self._days: dict = {}
+
+    def add(self, key: Hashable, day_of_week, start_time, end_time):
+        starts, entries, max_ends = self._days.setdefault(day_of_week, ([], [], []))
+        position = bisect_right(starts, start_time)
+        starts.insert(position, start_time)
+        entries.insert(position, (start_time, end_time, key))
+        max_ends.insert(position, end_time)
+        running = max_ends[position - 1] if position else None
+        for i in range(position, len(entries)):
+            end = entries[i][1]
+            running = end if running is None or end > running else running
+            max_ends[i] = running
+
+    def add_meetings(self, key: Hashable, meetings: Iterable):
+        """`day_of_week`/`start_time`/`end_time` 속성을 가진 수업들을 `key`로 추가"""
+        for meeting in meetings:
+            self.add(key, meeting.day_of_week, meeting.start_time, meeting.end_time)
+
+    def overlapping(self, day_of_week, start_time, end_time) -> list:
+        """[start_time, end_time)과 겹치는 구간의 키 (시작 시각 역순)"""
+        day = self._days.get(day_of_week)
+        if day is None:
+            return []
+        starts, entries, max_ends = day
+        found = []
+        i = bisect_left(starts, end_time) - 1
+        while i >= 0 and max_ends[i] > start_time:
+            if entries[i][1] > start_time:
+                found.append(entries[i][2])
+            i -= 1
+        return found
+
+    def conflicts(self, meetings: Iterable) -> list:
+        """수업들과 겹치는 키 (중복 제거, 처음 찾은 순)"""
+        found = {}
+        for meeting in meetings:
+            for key in self.overlapping(meeting.day_of_week, meeting.start_time, meeting.end_time):
+                found.setdefault(key, None)
+        return list(found)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for _, entries, _ in self._days.values())
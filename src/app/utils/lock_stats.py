@@ -0,0 +1,204 @@
+"""
+utils/lock_stats.py - 애플리케이션 락 경합 계측
+
+`enrollment_service._acquire_locks`에서 락 키 종류(course/student/session/enrollment)별
+대기 시간/보유 시간, 현재 대기자 수, 가장 경합이 심한 강좌 키를 기록합니다.
+비활성화 상태에서는 `_acquire_locks`가 `enabled` 플래그 하나만 확인합니다.
+"""
+import heapq
+import threading
+
+from app.config import settings
+from app.utils.metrics import registry
+
+LOCK_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+LOCK_WAIT = registry.histogram(
+    "app_lock_wait_seconds",
+    "Time spent waiting to acquire application locks by key kind",
+    ("kind",),
+    buckets=LOCK_BUCKETS,
+)
+LOCK_HOLD = registry.histogram(
+    "app_lock_hold_seconds",
+    "Time application locks were held by key kind",
+    ("kind",),
+    buckets=LOCK_BUCKETS,
+)
+
+
+def key_kind(key: str) -> str:
+    """`course:12` → `course`"""
+    return key.split(":", 1)[0]
+
+
+class _KindStats:
+    """키 종류 1개의 누적값 (종류마다 락을 따로 두어 종류끼리는 서로 기다리지 않음)"""
+    __slots__ = ("lock", "acquisitions", "contended", "wait_total", "wait_max", "hold_total", "hold_max", "waiters")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.waiters = 0
+        self.zero()
+
+    def zero(self):
+        """누적값만 0으로 (현재 대기자 수는 유지, 락 보유 상태)"""
+        self.acquisitions = 0
+        self.contended = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.hold_total = 0.0
+        self.hold_max = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+            "waiters": self.waiters,
+            "wait_total_s": round(self.wait_total, 6),
+            "wait_max_s": round(self.wait_max, 6),
+            "wait_avg_s": round(self.wait_total / self.acquisitions, 6) if self.acquisitions else 0.0,
+            "hold_total_s": round(self.hold_total, 6),
+            "hold_max_s": round(self.hold_max, 6),
+            "hold_avg_s": round(self.hold_total / self.acquisitions, 6) if self.acquisitions else 0.0,
+        }
+
+
+class _CourseStats:
+    """course 키 1개의 누적값 (키마다 락)"""
+    __slots__ = ("lock", "acquisitions", "contended", "wait_total", "waiters")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.acquisitions = 0
+        self.contended = 0
+        self.wait_total = 0.0
+        self.waiters = 0
+
+
+class LockStats:
+    """락 경합 통계
+
+    전역 락 하나로 모든 기록을 직렬화하지 않도록 키 종류별/course 키별 항목이 각자 락을 가집니다.
+    항목은 처음 쓸 때 `dict.setdefault`로 한 번만 만들고 지우지 않으므로(`reset`은 0으로만)
+    대기 시작/종료가 항상 같은 항목을 갱신합니다.
+    """
+
+    def __init__(self, enabled: bool = False, top_n: int = 10):
+        self.enabled = enabled
+        self.top_n = top_n
+        self._kinds: dict[str, _KindStats] = {}
+        self._courses: dict[str, _CourseStats] = {}
+
+    def _kind(self, kind: str) -> _KindStats:
+        stats = self._kinds.get(kind)
+        return stats if stats is not None else self._kinds.setdefault(kind, _KindStats())
+
+    def _course(self, key: str) -> _CourseStats:
+        stats = self._courses.get(key)
+        return stats if stats is not None else self._courses.setdefault(key, _CourseStats())
+
+    def begin_wait(self, key: str, kind: str):
+        stats = self._kind(kind)
+        with stats.lock:
+            stats.waiters += 1
+        if kind == "course":
+            course = self._course(key)
+            with course.lock:
+                course.waiters += 1
+
+    def end_wait(self, key: str, kind: str, waited: float, contended: bool):
+        stats = self._kind(kind)
+        with stats.lock:
+            if contended:
+                stats.waiters -= 1
+            stats.acquisitions += 1
+            stats.contended += contended
+            stats.wait_total += waited
+            if waited > stats.wait_max:
+                stats.wait_max = waited
+        if kind == "course":
+            course = self._course(key)
+            with course.lock:
+                course.acquisitions += 1
+                course.contended += contended
+                course.wait_total += waited
+                if contended:
+                    course.waiters -= 1
+        LOCK_WAIT.observe(waited, kind)
+
+    def record_hold(self, kind: str, held: float):
+        stats = self._kind(kind)
+        with stats.lock:
+            stats.hold_total += held
+            if held > stats.hold_max:
+                stats.hold_max = held
+        LOCK_HOLD.observe(held, kind)
+
+    def hottest_courses(self, n: int = None) -> list[dict]:
+        items = []
+        for key, course in list(self._courses.items()):
+            with course.lock:
+                if course.acquisitions or course.waiters:
+                    items.append((key, course.acquisitions, course.contended, course.wait_total, course.waiters))
+        top = heapq.nlargest(n or self.top_n, items, key=lambda item: item[3])
+        return [
+            {
+                "key": key,
+                "acquisitions": acquisitions,
+                "contended": contended,
+                "wait_total_s": round(wait_total, 6),
+                "waiters": waiters,
+            }
+            for key, acquisitions, contended, wait_total, waiters in top
+        ]
+
+    def snapshot(self, registry_size: int = None) -> dict:
+        kinds = {}
+        for kind, stats in list(self._kinds.items()):
+            with stats.lock:
+                kinds[kind] = stats.as_dict()
+        return {
+            "enabled": self.enabled,
+            "lock_registry_size": registry_size,
+            "kinds": kinds,
+            "hottest_courses": self.hottest_courses(),
+        }
+
+    def reset(self):
+        """누적값을 0으로 (지금 기다리는 스레드의 대기자 수는 유지)"""
+        for stats in list(self._kinds.values()):
+            with stats.lock:
+                stats.zero()
+        for course in list(self._courses.values()):
+            with course.lock:
+                course.acquisitions = 0
+                course.contended = 0
+                course.wait_total = 0.0
+        LOCK_WAIT.clear()
+        LOCK_HOLD.clear()
+
+    def collect(self) -> list[str]:
+        """메트릭 수집기: 대기자 수 + 상위 N 강좌 키 대기 시간"""
+        if not self.enabled:
+            return []
+        waiters = [(kind, stats.waiters) for kind, stats in list(self._kinds.items())]
+        lines = [
+            "# HELP app_lock_waiters Threads currently waiting on application locks by key kind",
+            "# TYPE app_lock_waiters gauge",
+        ]
+        lines.extend(f'app_lock_waiters{{kind="{kind}"}} {count}' for kind, count in waiters)
+        lines.extend([
+            # 상위 N개 키는 수집마다 바뀌므로 counter가 아닌 gauge (rate()용 아님)
+            "# HELP app_lock_hot_course_wait_seconds Cumulative wait on the current top-N hottest course locks",
+            "# TYPE app_lock_hot_course_wait_seconds gauge",
+        ])
+        lines.extend(
+            f'app_lock_hot_course_wait_seconds{{key="{item["key"]}"}} {item["wait_total_s"]}'
+            for item in self.hottest_courses()
+        )
+        return lines
+
+
+lock_stats = LockStats(enabled=settings.lock_metrics_enabled, top_n=settings.lock_metrics_top_n)
+registry.register_collector(lock_stats.collect)
@@ -0,0 +1,174 @@
+"""
+utils/log_pipeline.py - 큐 기반 비동기 로깅 파이프라인
+
+요청 스레드는 `LogRecord`를 큐에 넣기만 하고, 메시지 포맷팅과 콘솔/파일 I/O는
+백그라운드 `QueueListener` 스레드가 처리합니다. 수강신청/취소 로그는 락을 잡은
+상태에서 남기므로, 디스크 I/O가 락 보유 시간에 포함되지 않게 하기 위함입니다.
+
+- 지연 포맷팅: `%` 인자를 레코드에 그대로 담아 리스너 스레드에서 `getMessage()`
+  (인자로는 ORM 객체가 아닌 원시값만 넘길 것)
+- 반복 로그 샘플링: `extra={"sample_key": ...}`가 붙은 레코드는 키별로 윈도우당
+  처음 N건만 남기고, 다음 윈도우 첫 레코드에 생략 건수(`suppressed`)를 붙임
+- 구조화 로그: JSON lines (`extra`로 넘긴 필드 포함)
+- 큐가 가득 차면 요청 스레드를 막지 않고 레코드를 버림 (`log_records_dropped_total`)
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
+
+from app.config import settings
+from app.utils.metrics import registry
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+LOG_DROPPED = registry.counter(
+    "log_records_dropped_total",
+    "Log records dropped because the log queue was full",
+)
+LOG_SAMPLED = registry.counter(
+    "log_records_sampled_out_total",
+    "Repetitive log records suppressed by sampling",
+)
+
+# LogRecord 기본 속성 (JSON 출력 시 extra 필드와 구분)
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "sample_key"}
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 하나의 JSON 객체"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class RepeatSampler(logging.Filter):
+    """`sample_key`별로 윈도우(초)당 `burst`건만 통과"""
+
+    def __init__(self, burst: int, window: float):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self._lock = threading.Lock()
+        # sample_key → [윈도우 시작, 윈도우 내 건수, 생략 건수]
+        self._keys: dict = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = getattr(record, "sample_key", None)
+        if key is None or self.burst <= 0:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            state = self._keys.get(key)
+            if state is None or now - state[0] >= self.window:
+                suppressed = state[2] if state else 0
+                if len(self._keys) >= 10000:
+                    self._keys.clear()
+                self._keys[key] = [now, 1, 0]
+                if suppressed:
+                    record.suppressed = suppressed
+                return True
+            state[1] += 1
+            if state[1] <= self.burst:
+                return True
+            state[2] += 1
+        LOG_SAMPLED.inc()
+        return False
+
+    def reset(self):
+        with self._lock:
+            self._keys.clear()
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """레코드를 포맷팅하지 않고 큐에 넣음 (가득 차면 버림)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 같은 프로세스 안의 큐이므로 pickle용 사전 포맷팅이 필요 없음
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_DROPPED.inc()
+
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[NonBlockingQueueHandler] = None
+_replaced: list[logging.Handler] = []  # 큐 핸들러로 교체한 기존 루트 핸들러 (종료 시 복원)
+sampler = RepeatSampler(settings.log_sample_burst, settings.log_sample_window_s)
+
+
+def _build_handlers() -> list[logging.Handler]:
+    formatter = JsonFormatter() if settings.log_json else logging.Formatter(TEXT_FORMAT)
+    handlers: list[logging.Handler] = [logging.StreamHandler(sys.stderr)]
+    if settings.log_to_file:
+        os.makedirs(os.path.dirname(settings.log_file), exist_ok=True)
+        handlers.append(
+            RotatingFileHandler(settings.log_file, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8")
+        )
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    return handlers
+
+
+def configure_logging():
+    """루트 로거를 큐 핸들러로 교체하고 리스너 스레드 시작 (중복 호출 시 무시)
+
+    basicConfig/uvicorn 등이 먼저 붙인 루트 핸들러는 떼어 둡니다.
+    (남겨 두면 같은 레코드가 요청 스레드에서 동기로 한 번 더 출력됨)
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.log_queue_size)
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    _queue_handler.addFilter(sampler)
+    _listener = QueueListener(log_queue, *_build_handlers(), respect_handler_level=True)
+    _listener.start()
+
+    root = logging.getLogger()
+    root.setLevel(settings.log_level.upper())
+    _replaced[:] = root.handlers
+    for handler in _replaced:
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """큐에 남은 레코드를 모두 출력하고 리스너 종료 (떼어 둔 루트 핸들러 복원)"""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    root = logging.getLogger()
+    root.removeHandler(_queue_handler)
+    for handler in _replaced:
+        root.addHandler(handler)
+    _replaced.clear()
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+    _queue_handler = None
@@ -0,0 +1,131 @@
+"""
+utils/memory.py - 메모리 계측 (tracemalloc 스냅샷/비교 + 주요 객체 수)
+
+운영 중 tracemalloc 추적을 켜고 이름 붙인 스냅샷을 찍은 뒤, 두 스냅샷(또는
+현재 시점) 사이의 할당 증가량 상위 N개를 파일/라인 단위로 비교합니다.
+락 레지스트리(`_LOCKS`) 크기와 살아있는 ORM 세션 수/identity map 크기도 함께
+노출해, 추세로 누수를 확인할 수 있게 합니다.
+"""
+import threading
+import tracemalloc
+from collections import OrderedDict
+
+from sqlalchemy.orm import session as orm_session
+
+from app.utils.exceptions import (
+    TracingNotStartedException,
+    SnapshotNotFoundException,
+)
+from app.utils.metrics import registry
+
+MAX_SNAPSHOTS = 10
+CURRENT = "current"
+
+_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def object_counts() -> dict:
+    """누수 의심 대상 객체 수"""
+    from app.services import enrollment_service
+
+    sessions = list(orm_session._sessions.values())
+    return {
+        "lock_registry_entries": len(enrollment_service._LOCKS),
+        "live_orm_sessions": len(sessions),
+        "identity_map_objects": sum(len(s.identity_map) for s in sessions),
+    }
+
+
+class MemoryTracker:
+    """tracemalloc 스냅샷 관리"""
+
+    def __init__(self, max_snapshots: int = MAX_SNAPSHOTS):
+        self.max_snapshots = max_snapshots
+        self._snapshots: OrderedDict[str, tracemalloc.Snapshot] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 1):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def stop(self):
+        tracemalloc.stop()
+        with self._lock:
+            self._snapshots.clear()
+
+    def take_snapshot(self, name: str) -> dict:
+        if not tracemalloc.is_tracing():
+            raise TracingNotStartedException()
+        snapshot = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+        with self._lock:
+            self._snapshots.pop(name, None)
+            self._snapshots[name] = snapshot
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return {"name": name, "total_bytes": sum(stat.size for stat in snapshot.statistics("filename"))}
+
+    def _get(self, name: str) -> tracemalloc.Snapshot:
+        if name == CURRENT:
+            if not tracemalloc.is_tracing():
+                raise TracingNotStartedException()
+            return tracemalloc.take_snapshot().filter_traces(_FILTERS)
+        with self._lock:
+            snapshot = self._snapshots.get(name)
+        if snapshot is None:
+            raise SnapshotNotFoundException(name)
+        return snapshot
+
+    def diff(self, base: str, target: str = CURRENT, top: int = 20, group_by: str = "lineno") -> list[dict]:
+        """base → target 할당 증가량 상위 `top`개"""
+        stats = self._get(target).compare_to(self._get(base), group_by)
+        return [
+            {
+                "location": str(stat.traceback[0]) if stat.traceback else "?",
+                "size_diff_bytes": stat.size_diff,
+                "size_bytes": stat.size,
+                "count_diff": stat.count_diff,
+                "count": stat.count,
+            }
+            for stat in stats[:top]
+        ]
+
+    def status(self) -> dict:
+        current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        with self._lock:
+            names = list(self._snapshots)
+        return {
+            "tracing": tracemalloc.is_tracing(),
+            "traced_current_bytes": current,
+            "traced_peak_bytes": peak,
+            "snapshots": names,
+            "objects": object_counts(),
+        }
+
+
+memory_tracker = MemoryTracker()
+
+
+def _collect() -> list[str]:
+    counts = object_counts()
+    return [
+        "# HELP app_lock_registry_entries Entries in the enrollment lock registry",
+        "# TYPE app_lock_registry_entries gauge",
+        f"app_lock_registry_entries {counts['lock_registry_entries']}",
+        "# HELP orm_live_sessions Live SQLAlchemy ORM sessions",
+        "# TYPE orm_live_sessions gauge",
+        f"orm_live_sessions {counts['live_orm_sessions']}",
+        "# HELP orm_identity_map_objects Objects held in identity maps of live sessions",
+        "# TYPE orm_identity_map_objects gauge",
+        f"orm_identity_map_objects {counts['identity_map_objects']}",
+    ]
+
+
+registry.register_collector(_collect)
@@ -0,0 +1,150 @@
+"""
+utils/pool_stats.py - DB 커넥션 풀 계측
+
+`database.py`의 풀 클래스가 커넥션을 꺼낼 때마다 대기 시간을 기록하고,
+풀 상태(크기/사용 중/오버플로)와 함께 `/health/pool`, `/metrics`로 노출합니다.
+"""
+import threading
+from time import perf_counter
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool, QueuePool, StaticPool
+
+from app.utils.metrics import registry
+
+POOL_WAIT = registry.histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a pooled DB connection",
+    ("pool",),
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+
+
+class PoolStats:
+    """커넥션 획득 대기 통계"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, waited: float, timed_out: bool = False):
+        with self._lock:
+            self.checkouts += not timed_out
+            self.timeouts += timed_out
+            self.wait_total += waited
+            if waited > self.wait_max:
+                self.wait_max = waited
+        POOL_WAIT.observe(waited, self.name)
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_total_s": round(self.wait_total, 6),
+                "wait_max_s": round(self.wait_max, 6),
+                "wait_avg_s": round(self.wait_total / attempts, 6) if attempts else 0.0,
+            }
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = self.timeouts = 0
+            self.wait_total = self.wait_max = 0.0
+
+
+class _TimedPoolMixin:
+    """`_do_get`(풀에서 커넥션 꺼내기) 소요 시간 기록"""
+
+    stats: PoolStats = None
+
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            if self.stats is not None:
+                self.stats.record(perf_counter() - start, timed_out=True)
+            raise
+        if self.stats is not None:
+            self.stats.record(perf_counter() - start)
+        return conn
+
+    def recreate(self):
+        # engine.dispose() 등으로 풀이 재생성돼도 통계 유지
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    """크기/오버플로가 있는 큐 풀 (파일 DB)"""
+
+
+class TimedStaticPool(_TimedPoolMixin, StaticPool):
+    """모든 스레드가 커넥션 1개를 공유 (인메모리 DB용)"""
+
+
+_pools: dict[str, Pool] = {}
+
+
+def register_pool(name: str, pool: Pool):
+    """이름으로 풀 등록 (상태 조회/메트릭 대상)"""
+    if getattr(pool, "stats", None) is None:
+        pool.stats = PoolStats(name)
+    _pools[name] = pool
+
+
+def unregister_pool(name: str):
+    """등록 해제 (엔진 dispose 후)"""
+    _pools.pop(name, None)
+
+
+def _pool_counts(pool: Pool) -> dict:
+    if isinstance(pool, QueuePool):
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+        }
+    return {"size": 1}
+
+
+def pool_status() -> dict:
+    """등록된 풀별 상태 + 대기 통계"""
+    return {
+        name: {
+            "class": type(pool).__name__,
+            **_pool_counts(pool),
+            **(pool.stats.as_dict() if pool.stats else {}),
+        }
+        for name, pool in _pools.items()
+    }
+
+
+def _collect() -> list[str]:
+    status = pool_status()
+    lines = []
+    for metric, key, help_text in (
+        ("db_pool_size", "size", "Configured pool size"),
+        ("db_pool_checked_out", "checked_out", "Connections currently checked out"),
+        ("db_pool_overflow", "overflow", "Overflow connections currently open"),
+        ("db_pool_timeouts_total", "timeouts", "Checkouts that timed out waiting for a connection"),
+    ):
+        values = [(name, pool[key]) for name, pool in status.items() if key in pool]
+        if not values:
+            continue
+        kind = "counter" if metric.endswith("_total") else "gauge"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        lines.extend(f'{metric}{{pool="{name}"}} {value}' for name, value in values)
+    return lines
+
+
+registry.register_collector(_collect)
@@ -0,0 +1,207 @@
+"""
+utils/profiler.py - 느린 요청 샘플링 프로파일러
+
+요청이 처리되는 동안 백그라운드 스레드가 `sys._current_frames()`로 해당 요청의
+워커 스레드 콜스택을 주기적으로 샘플링합니다. 요청이 끝났을 때 지연 시간이
+임계값을 넘었거나 샘플링 비율에 당첨된 요청만 링 버퍼에 보관하며,
+flamegraph용 collapsed stack 포맷(`a;b;c 12`)으로 내려받을 수 있습니다.
+
+동기 라우트는 스레드풀에서 실행되므로, 요청 컨텍스트(ContextVar)를 가진 코드가
+`bind_thread()`로 현재 스레드를 요청에 연결합니다. (`get_db` 의존성, SQL 실행 이벤트)
+"""
+import itertools
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAX_STACK_DEPTH = 128
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    directory, filename = os.path.split(code.co_filename)
+    return f"{os.path.basename(directory)}/{filename}:{code.co_name}"
+
+
+def collapse_stack(frame) -> tuple[str, bool]:
+    """루트→리프 순서의 collapsed stack 문자열과 앱 코드 포함 여부"""
+    labels = []
+    in_app = False
+    depth = 0
+    while frame is not None and depth < MAX_STACK_DEPTH:
+        if frame.f_code.co_filename.startswith(APP_ROOT):
+            in_app = True
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+        depth += 1
+    labels.reverse()
+    return ";".join(labels), in_app
+
+
+class RequestProfile:
+    """한 요청의 스택 샘플"""
+
+    def __init__(self, profile_id: int, method: str, path: str, sampled: bool):
+        self.id = profile_id
+        self.method = method
+        self.path = path
+        self.route: Optional[str] = None
+        self.status: Optional[int] = None
+        self.sampled = sampled
+        self.started_at = time.time()
+        self.elapsed = 0.0
+        self.threads: set[int] = set()
+        self.stacks: Counter = Counter()
+        self.idle_samples = 0
+
+    @property
+    def reason(self) -> str:
+        return "sampled" if self.sampled else "slow"
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status": self.status,
+            "reason": self.reason,
+            "started_at": self.started_at,
+            "elapsed_ms": round(self.elapsed * 1000, 3),
+            "samples": sum(self.stacks.values()),
+            "idle_samples": self.idle_samples,
+        }
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+_current: ContextVar[Optional[RequestProfile]] = ContextVar("request_profile", default=None)
+
+
+class SamplingProfiler:
+    """진행 중 요청의 스택을 샘플링하고 느린 요청 프로파일을 보관"""
+
+    def __init__(self, enabled: bool, interval_ms: float, slow_threshold_ms: float, sample_rate: float, ring_size: int):
+        self.enabled = enabled
+        self.interval = interval_ms / 1000.0
+        self.slow_threshold = slow_threshold_ms / 1000.0
+        self.sample_rate = sample_rate
+        self.profiles: deque = deque(maxlen=ring_size)
+        self._active: dict[int, RequestProfile] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._has_active = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start_request(self, method: str, path: str) -> RequestProfile:
+        profile = RequestProfile(next(self._ids), method, path, random.random() < self.sample_rate)
+        with self._lock:
+            self._active[profile.id] = profile
+            self._has_active.set()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+        return profile
+
+    def finish_request(self, profile: RequestProfile, elapsed: float):
+        profile.elapsed = elapsed
+        with self._lock:
+            self._active.pop(profile.id, None)
+            if not self._active:
+                self._has_active.clear()
+        if profile.sampled or elapsed >= self.slow_threshold:
+            self.profiles.append(profile)
+
+    def get(self, profile_id: int) -> Optional[RequestProfile]:
+        for profile in list(self.profiles):
+            if profile.id == profile_id:
+                return profile
+        return None
+
+    def merged_collapsed(self) -> str:
+        merged: Counter = Counter()
+        for profile in list(self.profiles):
+            merged.update(profile.stacks)
+        return "".join(f"{stack} {count}\n" for stack, count in merged.most_common())
+
+    def clear(self):
+        self.profiles.clear()
+
+    def sample_once(self):
+        """활성 요청에 연결된 스레드의 스택을 1회 샘플링"""
+        with self._lock:
+            if not self._active:
+                return
+            frames = sys._current_frames()
+            for profile in self._active.values():
+                self._sample_profile(profile, frames)
+
+    @staticmethod
+    def _sample_profile(profile: RequestProfile, frames: dict):
+        for ident in list(profile.threads):
+            frame = frames.get(ident)
+            if frame is None:
+                continue
+            stack, in_app = collapse_stack(frame)
+            if in_app:
+                profile.stacks[stack] += 1
+            else:
+                # 요청과 무관하게 유휴 대기 중인 워커 스레드
+                profile.idle_samples += 1
+
+    def _run(self):
+        while True:
+            self._has_active.wait()
+            time.sleep(self.interval)
+            self.sample_once()
+
+
+profiler = SamplingProfiler(
+    enabled=settings.profiler_enabled,
+    interval_ms=settings.profiler_interval_ms,
+    slow_threshold_ms=settings.profiler_slow_threshold_ms,
+    sample_rate=settings.profiler_sample_rate,
+    ring_size=settings.profiler_ring_size,
+)
+
+
+def current_profile() -> Optional[RequestProfile]:
+    return _current.get()
+
+
+@contextmanager
+def profile_request(method: str, path: str):
+    """요청 구간 동안 프로파일을 활성화 (종료 시 보관 여부 결정)"""
+    profile = profiler.start_request(method, path)
+    token = _current.set(profile)
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        _current.reset(token)
+        profiler.finish_request(profile, time.perf_counter() - start)
+
+
+def bind_thread():
+    """현재 스레드를 진행 중인 요청 프로파일에 연결"""
+    profile = _current.get()
+    if profile is not None:
+        profile.threads.add(threading.get_ident())
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _bind_sql_thread(conn, cursor, statement, parameters, context, executemany):
+    bind_thread()
@@ -0,0 +1,124 @@
+"""
+utils/query_counter.py - 요청 단위 SQL 실행 수/DB 시간 집계 및 N+1 감지
+
+SQLAlchemy `before_cursor_execute`/`after_cursor_execute` 이벤트를 모든 Engine에
+등록하고, 요청마다 `QueryCountMiddleware`가 설정한 ContextVar의 `QueryStats`에
+누적합니다. (동기 라우트는 스레드풀에서 실행되지만 컨텍스트가 복사되므로
+같은 `QueryStats` 객체를 공유합니다.)
+
+테스트에서는 `assert_max_queries(engine, n)`으로 엔드포인트별 쿼리 상한을 검증합니다.
+"""
+import logging
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """파라미터 개수와 무관한 SQL 형태 (`IN (?, ?, ?)` → `IN (?)`)"""
+    return _IN_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class QueryStats:
+    """한 요청(또는 측정 구간)의 SQL 통계"""
+
+    def __init__(self, label: str = "", repeat_threshold: int = None):
+        self.label = label
+        self.repeat_threshold = repeat_threshold
+        self.count = 0
+        self.db_time = 0.0
+        self.shapes: Counter = Counter()
+        self.warned: set = set()
+
+    def record(self, statement: str, elapsed: float):
+        self.count += 1
+        self.db_time += elapsed
+        shape = statement_shape(statement)
+        self.shapes[shape] += 1
+        if (
+            self.repeat_threshold
+            and self.shapes[shape] > self.repeat_threshold
+            and shape not in self.warned
+        ):
+            self.warned.add(shape)
+            logger.warning(
+                "⚠️ N+1 의심: %s 에서 동일 SQL %d회 초과 반복: %s",
+                self.label or "(unknown)", self.repeat_threshold, shape[:200],
+            )
+
+    def repeated(self, minimum: int = 2) -> list[tuple[str, int]]:
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= minimum]
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+@contextmanager
+def track_queries(label: str = "", repeat_threshold: int = None):
+    """현재 컨텍스트에서 실행되는 SQL을 새 QueryStats에 집계"""
+    if repeat_threshold is None:
+        repeat_threshold = settings.sql_repeat_warning_threshold
+    stats = QueryStats(label, repeat_threshold)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("query_start", []).append(perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    starts = conn.info.get("query_start")
+    elapsed = perf_counter() - starts.pop() if starts else 0.0
+    stats.record(statement, elapsed)
+
+
+@contextmanager
+def count_queries(engine: Engine):
+    """특정 엔진에서 실행된 SQL을 스레드와 무관하게 집계 (테스트용)"""
+    stats = QueryStats()
+
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        stats.record(statement, 0.0)
+
+    event.listen(engine, "after_cursor_execute", _on_execute)
+    try:
+        yield stats
+    finally:
+        event.remove(engine, "after_cursor_execute", _on_execute)
+
+
+@contextmanager
+def assert_max_queries(engine: Engine, maximum: int):
+    """블록 안에서 실행된 SQL 수가 `maximum` 이하인지 검증"""
+    with count_queries(engine) as stats:
+        yield stats
+    if stats.count > maximum:
+        detail = "\n".join(f"  {n}× {shape}" for shape, n in stats.shapes.most_common(5))
+        raise AssertionError(f"SQL {stats.count}건 실행 (최대 {maximum}건)\n{detail}")
@@ -0,0 +1,227 @@
+"""
+utils/rate_limit.py - 수강신청 라우트 입장 제어 (부하 차단 + 토큰 버킷 + 마감 강좌 단락)
+
+스크립트 몇 개가 마감된 강좌에 신청을 연타해 워커 스레드풀을 독점하지 않도록,
+신청/취소 요청을 스레드풀에 넣기 전에(이벤트 루프에서) 다음 순서로 거릅니다.
+
+1. 부하 차단: 입장했지만 끝나지 않은 요청이 `max_in_flight` 이상이면 429 + Retry-After
+   (확인과 자리 예약을 같은 락 안에서, 라우트 본문이 끝나면 바로 반환)
+2. 클라이언트 IP별, 학생별 토큰 버킷 (초당 `rate`개 충전, 최대 `burst`개) → 부족하면 429 + Retry-After
+   (IP별은 기본 끔: 전송 주소 기준이라 NAT/프록시 뒤에서는 여러 학생이 한 버킷을 공유)
+3. (신청만) 최근 `window_s` 안에 정원 초과로 거절된 강좌는 DB 없이 같은 CAPACITY_EXCEEDED 응답
+   (취소/정원 변경으로 자리가 생기면 즉시 해제)
+
+버킷/마감 강좌는 키 수 상한이 있는 LRU(OrderedDict)라 메모리가 제한됩니다.
+오래 쓰지 않은 키부터 버리며, 버려진 키는 가득 찬 버킷으로 다시 시작합니다.
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from app.config import settings
+from app.utils.exceptions import CapacityExceededException, RateLimitedException, ServerOverloadedException
+from app.utils.metrics import registry
+
+ADMISSION_REJECTED = registry.counter(
+    "enrollment_admission_rejected_total",
+    "Enrollment requests rejected before reaching the worker threadpool",
+    ("reason",),
+)
+ADMISSION_IN_FLIGHT = registry.gauge(
+    "enrollment_admission_in_flight",
+    "Admitted enrollment requests that have not finished",
+)
+
+
+class TokenBucketLimiter:
+    """키별 토큰 버킷 (키 수는 `max_keys`로 제한, 가장 오래 쓰지 않은 키부터 제거)"""
+
+    def __init__(self, rate_per_s: float, burst: int, max_keys: int):
+        self.rate = rate_per_s
+        self.burst = burst
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._buckets: OrderedDict = OrderedDict()  # 키 → (남은 토큰, 마지막 갱신 시각)
+        self.evictions = 0
+
+    def acquire(self, key, now: float = None) -> float:
+        """토큰 1개 사용 → 0.0이면 허용, 아니면 토큰 1개가 찰 때까지 남은 초"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            bucket = self._buckets.pop(key, None)
+            tokens = self.burst if bucket is None else min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / self.rate
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+                self.evictions += 1
+            return wait
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class FullCourseCache:
+    """최근 정원 초과로 거절된 강좌 → (정원, 신청 인원, 만료 시각)"""
+
+    def __init__(self, window_s: float, max_keys: int):
+        self.window_s = window_s
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._courses: OrderedDict = OrderedDict()
+
+    def mark(self, course_id: int, capacity: int, enrolled: int, now: float = None):
+        if self.window_s <= 0:
+            return
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._courses.pop(course_id, None)
+            self._courses[course_id] = (capacity, enrolled, now + self.window_s)
+            if len(self._courses) > self.max_keys:
+                self._courses.popitem(last=False)
+
+    def get(self, course_id: int, now: float = None) -> Optional[tuple]:
+        """창 안이면 (정원, 신청 인원), 아니면 None"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            entry = self._courses.get(course_id)
+            if entry is None:
+                return None
+            if entry[2] <= now:
+                del self._courses[course_id]
+                return None
+            return entry[:2]
+
+    def discard(self, course_id: int):
+        with self._lock:
+            self._courses.pop(course_id, None)
+
+    def reset(self):
+        with self._lock:
+            self._courses.clear()
+
+    def __len__(self) -> int:
+        return len(self._courses)
+
+
+class AdmissionSlot:
+    """입장한 요청의 `in_flight` 자리 (`release`는 여러 번 불러도 한 번만 반환)"""
+
+    def __init__(self, admission: "EnrollmentAdmission"):
+        self._admission = admission
+        self._held = True
+
+    def release(self):
+        if self._held:
+            self._held = False
+            self._admission.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+def _retry_after(seconds: float) -> int:
+    """Retry-After 헤더 값 (정수 초, 최소 1)"""
+    return max(1, math.ceil(seconds))
+
+
+class EnrollmentAdmission:
+    """수강신청/취소 요청 입장 제어"""
+
+    def __init__(
+        self,
+        student_per_s: float,
+        student_burst: int,
+        ip_per_s: float,
+        ip_burst: int,
+        max_keys: int,
+        max_in_flight: int,
+        full_course_window_s: float,
+        shed_retry_after_s: int = 1,
+    ):
+        # 초당 충전량이 0 이하이면 해당 제한 끔
+        self.students = TokenBucketLimiter(student_per_s, student_burst, max_keys) if student_per_s > 0 else None
+        self.ips = TokenBucketLimiter(ip_per_s, ip_burst, max_keys) if ip_per_s > 0 else None
+        self.full_courses = FullCourseCache(full_course_window_s, max_keys)
+        self.max_in_flight = max_in_flight
+        self.shed_retry_after_s = shed_retry_after_s
+        self._lock = threading.Lock()
+        self.in_flight = 0
+
+    def admit(self, student_id: int, client_ip: Optional[str]) -> AdmissionSlot:
+        """입장 허용이면 `in_flight` 자리 예약 후 반환 (끝나면 `release`), 아니면 429 예외"""
+        with self._lock:
+            if self.max_in_flight > 0 and self.in_flight >= self.max_in_flight:
+                ADMISSION_REJECTED.inc("overloaded")
+                raise ServerOverloadedException(self.shed_retry_after_s)
+            self.in_flight += 1
+            ADMISSION_IN_FLIGHT.set(self.in_flight)
+        slot = AdmissionSlot(self)
+        for reason, limiter, key in (("ip", self.ips, client_ip), ("student", self.students, student_id)):
+            if limiter is None or key is None:
+                continue
+            wait = limiter.acquire(key)
+            if wait:
+                slot.release()
+                ADMISSION_REJECTED.inc(reason)
+                raise RateLimitedException(_retry_after(wait), reason)
+        return slot
+
+    def release(self):
+        with self._lock:
+            self.in_flight -= 1
+            ADMISSION_IN_FLIGHT.set(self.in_flight)
+
+    def check_full(self, course_id: int):
+        """최근 정원 초과로 거절된 강좌면 DB 없이 같은 예외"""
+        cached = self.full_courses.get(course_id)
+        if cached is not None:
+            ADMISSION_REJECTED.inc("full_course")
+            raise CapacityExceededException(*cached)
+
+    def reset(self):
+        for limiter in (self.students, self.ips):
+            if limiter is not None:
+                limiter.reset()
+        self.full_courses.reset()
+
+    def status(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "students": {
+                "keys": len(self.students), "rate_per_s": self.students.rate, "burst": self.students.burst,
+                "evictions": self.students.evictions,
+            } if self.students else None,
+            "ips": {
+                "keys": len(self.ips), "rate_per_s": self.ips.rate, "burst": self.ips.burst,
+                "evictions": self.ips.evictions,
+            } if self.ips else None,
+            "full_courses": {"keys": len(self.full_courses), "window_s": self.full_courses.window_s},
+        }
+
+
+enrollment_admission = EnrollmentAdmission(
+    student_per_s=settings.rate_limit_student_per_s,
+    student_burst=settings.rate_limit_student_burst,
+    ip_per_s=settings.rate_limit_ip_per_s,
+    ip_burst=settings.rate_limit_ip_burst,
+    max_keys=settings.rate_limit_max_keys,
+    max_in_flight=settings.enroll_max_in_flight,
+    full_course_window_s=settings.full_course_window_ms / 1000,
+    shed_retry_after_s=settings.enroll_shed_retry_after_s,
+)
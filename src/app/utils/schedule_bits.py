@@ -0,0 +1,63 @@
+"""
+utils/schedule_bits.py - 주간 시간표 비트마스크
+
+요일(월~금) × 하루 288칸(5분 단위)을 정수 하나의 비트로 표현합니다.
+강좌 시간표는 수업 시간이 덮는 칸의 비트를 모두 켠 값이고,
+
+- 두 강좌 충돌: `a & b != 0`
+- 학생 시간표: 신청 강좌 마스크의 OR
+- 후보 강좌가 시간표와 충돌: `timetable & mask != 0`
+
+이므로 충돌 검사가 수업 수와 무관하게 정수 AND 한 번입니다.
+시각은 5분 경계로 바깥쪽 반올림(시작 내림, 종료 올림)하므로 5분 단위가 아닌
+시각끼리는 실제보다 넓게 충돌로 볼 수 있습니다. (맞닿는 수업은 충돌 아님)
+"""
+from datetime import time
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import DayOfWeek, Schedule
+
+SLOT_MINUTES = 5
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+DAY_INDEX = {day: index for index, day in enumerate(DayOfWeek)}
+
+
+def _minutes(value: time) -> int:
+    return value.hour * 60 + value.minute
+
+
+def schedule_mask(day_of_week: DayOfWeek, start_time: time, end_time: time) -> int:
+    """수업 1회(요일, 시작, 종료) → 비트마스크"""
+    first = _minutes(start_time) // SLOT_MINUTES
+    last = -(-_minutes(end_time) // SLOT_MINUTES)  # 올림 (끝 칸 미포함)
+    if last <= first:
+        return 0
+    offset = DAY_INDEX[day_of_week] * SLOTS_PER_DAY
+    return ((1 << (last - first)) - 1) << (offset + first)
+
+
+def meetings_mask(meetings: Iterable) -> int:
+    """`day_of_week`/`start_time`/`end_time` 속성을 가진 수업들 → OR 마스크"""
+    mask = 0
+    for meeting in meetings:
+        mask |= schedule_mask(meeting.day_of_week, meeting.start_time, meeting.end_time)
+    return mask
+
+
+def sort_meetings(meetings: Iterable) -> list:
+    """수업들을 요일(월~금)/시작 시각 순으로"""
+    return sorted(meetings, key=lambda meeting: (DAY_INDEX[meeting.day_of_week], meeting.start_time))
+
+
+def load_course_masks(db: Session, course_ids: Iterable[int] = None) -> dict:
+    """강좌 ID → 시간표 마스크 (시간표 없는 강좌는 포함 안 됨)"""
+    stmt = select(Schedule.course_id, Schedule.day_of_week, Schedule.start_time, Schedule.end_time)
+    if course_ids is not None:
+        stmt = stmt.where(Schedule.course_id.in_(list(course_ids)))
+    masks: dict[int, int] = {}
+    for row in db.execute(stmt):
+        masks[row.course_id] = masks.get(row.course_id, 0) | schedule_mask(row.day_of_week, row.start_time, row.end_time)
+    return masks
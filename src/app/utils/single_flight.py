@@ -0,0 +1,98 @@
+"""
+utils/single_flight.py - 같은 키의 동시 계산을 1번으로 합치기 (single-flight + 마이크로 TTL)
+
+수강신청 오픈 순간 수천 명이 같은 `GET /api/v1/courses/{id}`, `GET /api/v1/courses?department_id=X`를
+동시에 요청하면 요청마다 같은 DB 조회와 직렬화를 반복합니다.
+
+- 같은 키로 진행 중인 계산이 있으면 새로 계산하지 않고 그 결과(또는 예외)를 기다려 공유
+  (예외는 대기자마다 같은 타입/속성의 새 객체로 던져 traceback을 공유하지 않음)
+- `ttl_s > 0`이면 성공한 결과를 그 시간 동안 보관해 직후 요청도 재사용 (예외는 보관 안 함)
+- 보관 키 수는 `max_keys`로 제한 (LRU)
+
+진행 중인 계산에 합류한 요청은 그 계산이 시작된 시점의 데이터를 받습니다.
+(계산 도중 커밋된 변경은 다음 계산부터 반영, TTL을 켜면 최대 TTL만큼 늦게 반영)
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from app.config import settings
+
+LEADER = "leader"  # 직접 계산
+SHARED = "shared"  # 진행 중인 계산에 합류
+CACHED = "cached"  # TTL 안의 결과 재사용
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def _fresh(error: BaseException) -> BaseException:
+    """같은 타입/속성의 새 예외 객체 (`__traceback__`은 비어 있음)"""
+    fresh = type(error).__new__(type(error))
+    fresh.__dict__.update(error.__dict__)
+    fresh.args = error.args
+    return fresh
+
+
+class SingleFlight:
+    """키별 진행 중 계산 + 마이크로 TTL 결과"""
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._calls: dict = {}
+        self._results: OrderedDict = OrderedDict()  # 키 → (만료 시각, 결과)
+
+    def do(self, key: Hashable, fn: Callable[[], Any], ttl_s: float = 0.0) -> tuple:
+        """`fn()` 결과 → (결과, LEADER | SHARED | CACHED)"""
+        with self._lock:
+            stored = self._results.get(key)
+            if stored is not None:
+                if stored[0] > time.monotonic():
+                    return stored[1], CACHED
+                del self._results[key]
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise _fresh(call.error)
+            return call.result, SHARED
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                if call.error is None and ttl_s > 0:
+                    self._results[key] = (time.monotonic() + ttl_s, call.result)
+                    self._results.move_to_end(key)
+                    if len(self._results) > self.max_keys:
+                        self._results.popitem(last=False)
+            call.done.set()
+        return call.result, LEADER
+
+    def reset(self):
+        with self._lock:
+            self._results.clear()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+
+# 강좌 조회 라우트용 (routes/courses.py)
+course_reads = SingleFlight(settings.read_coalesce_max_keys)
@@ -0,0 +1,100 @@
+"""
+utils/sqlite_profile.py - SQLite 성능 프로파일 (PRAGMA 프리셋)
+
+`SQLITE_PROFILE` 하나로 내구성과 처리량을 맞바꿀 수 있게 PRAGMA 묶음을 정의하고,
+개별 값(`SQLITE_SYNCHRONOUS` 등)을 지정하면 프리셋보다 우선 적용합니다.
+
+- durable (기본): `synchronous=FULL` — 커밋마다 WAL fsync, 전원 장애에도 커밋 유실 없음
+- balanced: `synchronous=NORMAL` — WAL 모드에서 앱/프로세스 장애에는 안전,
+  전원 장애 시 마지막 체크포인트 이후 일부 커밋 유실 가능
+- throughput: `synchronous=OFF` + 큰 캐시/mmap + 드문 체크포인트 — OS 장애 시 DB 손상 가능,
+  부하 테스트/재생성 가능한 데이터 전용
+
+프리셋 비교: `python -m benchmarks.sqlite_profiles`
+"""
+import logging
+import time
+from typing import Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+PROFILES: dict[str, dict] = {
+    "durable": {
+        "synchronous": "FULL",
+        "cache_size": -2000,  # 2MB (SQLite 기본값)
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "wal_autocheckpoint": 1000,
+        "prewarm": False,
+    },
+    "balanced": {
+        "synchronous": "NORMAL",
+        "cache_size": -16000,  # 16MB
+        "mmap_size": 64 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "wal_autocheckpoint": 1000,
+        "prewarm": True,
+    },
+    "throughput": {
+        "synchronous": "OFF",
+        "cache_size": -64000,  # 64MB
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "wal_autocheckpoint": 10000,
+        "prewarm": True,
+    },
+}
+
+SYNCHRONOUS_VALUES = ("OFF", "NORMAL", "FULL", "EXTRA")
+TEMP_STORE_VALUES = ("DEFAULT", "FILE", "MEMORY")
+
+
+def resolve_profile(name: str, overrides: Optional[dict] = None) -> dict:
+    """프리셋 + 개별 설정(None이 아닌 값) 병합 및 검증"""
+    if name not in PROFILES:
+        raise ValueError(f"Unknown SQLite profile: {name} (choose from {', '.join(PROFILES)})")
+    profile = {**PROFILES[name], "name": name}
+    for key, value in (overrides or {}).items():
+        if value is not None:
+            profile[key] = value
+
+    profile["synchronous"] = str(profile["synchronous"]).upper()
+    profile["temp_store"] = str(profile["temp_store"]).upper()
+    if profile["synchronous"] not in SYNCHRONOUS_VALUES:
+        raise ValueError(f"Invalid synchronous: {profile['synchronous']}")
+    if profile["temp_store"] not in TEMP_STORE_VALUES:
+        raise ValueError(f"Invalid temp_store: {profile['temp_store']}")
+    for key in ("cache_size", "mmap_size", "wal_autocheckpoint"):
+        profile[key] = int(profile[key])
+    return profile
+
+
+def pragma_statements(profile: dict) -> list[str]:
+    """커넥션마다 실행할 PRAGMA 목록"""
+    return [
+        f"PRAGMA synchronous={profile['synchronous']}",
+        f"PRAGMA cache_size={profile['cache_size']}",
+        f"PRAGMA mmap_size={profile['mmap_size']}",
+        f"PRAGMA temp_store={profile['temp_store']}",
+        f"PRAGMA wal_autocheckpoint={profile['wal_autocheckpoint']}",
+    ]
+
+
+def prewarm(engine: Engine) -> dict:
+    """모든 테이블/인덱스를 한 번 훑어 페이지 캐시(OS + mmap)를 채움"""
+    start = time.perf_counter()
+    tables = inspect(engine).get_table_names()
+    rows = 0
+    with engine.connect() as conn:
+        for table in tables:
+            # 테이블 B-tree 전체 스캔
+            rows += conn.execute(text(f'SELECT COUNT(*) FROM "{table}" WHERE rowid IS NOT NULL')).scalar()
+            # 인덱스 B-tree 스캔 (커버링 COUNT는 가장 작은 인덱스를 사용)
+            for index in inspect(engine).get_indexes(table):
+                conn.execute(text(f'SELECT COUNT(*) FROM "{table}" INDEXED BY "{index["name"]}"')).scalar()
+    elapsed = time.perf_counter() - start
+    logger.info("🔥 페이지 캐시 예열 완료: 테이블 %d개, %d행 (%.3f초)", len(tables), rows, elapsed)
+    return {"tables": len(tables), "rows": rows, "elapsed_s": round(elapsed, 3)}
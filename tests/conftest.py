@@ -7,14 +7,33 @@ from sqlalchemy.orm import sessionmaker, Session
 from fastapi.testclient import TestClient
 
 from app.main import app
-from app.database import Base, get_db
+from app.database import Base, get_db, get_read_db, get_schedule_db, setup_sqlite_engine
 from app.models import Department, Professor, Course, Student, Schedule, DayOfWeek
 from app.config import settings
+from app.services.conflict_service import conflict_index
+from app.services.data_stats_service import data_stats
+from app.services.department_stats_service import department_stats
+from app.services.journal_service import enrollment_state
+from app.utils.rate_limit import enrollment_admission
+from app.utils.single_flight import course_reads
 from datetime import time
 
 # 테스트용 파일 DB (동시성 테스트 안정성)
 TEST_SQLALCHEMY_DATABASE_URL = "sqlite:///"
 
+# 프로세스 전역 인메모리 상태 (테스트마다 새로)
+SINGLETONS = (conflict_index, department_stats, data_stats, enrollment_state, course_reads, enrollment_admission)
+
+
+@pytest.fixture(autouse=True)
+def reset_singletons():
+    """인덱스/집계/캐시/요청 한도 초기화"""
+    for singleton in SINGLETONS:
+        singleton.reset()
+    yield
+    for singleton in SINGLETONS:
+        singleton.reset()
+
 
 @pytest.fixture(scope="function")
 def test_db(tmp_path):
@@ -24,6 +43,7 @@ def test_db(tmp_path):
         f"{TEST_SQLALCHEMY_DATABASE_URL}{db_file}",
         connect_args={"check_same_thread": False},
     )
+    setup_sqlite_engine(engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     
     Base.metadata.create_all(bind=engine)
@@ -47,13 +67,42 @@ def test_session_factory(test_db: Session):
 
 
 @pytest.fixture(scope="function")
-def client(test_db: Session):
+def test_read_session_factory(test_db: Session):
+    """테스트용 읽기 전용 세션 팩토리 (같은 DB 파일, PRAGMA query_only)"""
+    engine = create_engine(
+        test_db.get_bind().url,
+        connect_args={"check_same_thread": False},
+    )
+    setup_sqlite_engine(engine, read_only=True)
+    
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def client(test_db: Session, test_read_session_factory):
     """테스트 클라이언트"""
     
     def override_get_db():
         yield test_db
     
+    def override_get_read_db():
+        db = test_read_session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+    
+    def override_get_schedule_db():
+        if settings.schedule_read_your_writes:
+            yield from override_get_db()
+        else:
+            yield from override_get_read_db()
+    
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_read_db
+    app.dependency_overrides[get_schedule_db] = override_get_schedule_db
     
     yield TestClient(app)
     
@@ -149,3 +198,24 @@ def sample_data(test_db: Session):
         "students": [student1, student2, student3],
         "schedules": [schedule1, schedule2]
     }
+
+
+@pytest.fixture(scope="function")
+def add_course(test_db: Session, sample_data):
+    """샘플 학과/교수로 강좌 + 시간표 추가 (flush만, 커밋은 테스트에서)
+
+    `add_course("CS201", (DayOfWeek.MON, time(9, 0), time(10, 30)), ...)`
+    """
+
+    def build(code: str, *meetings, name: str = None, credits: int = 3, capacity: int = 30) -> Course:
+        course = Course(
+            name=name or code, code=code, credits=credits, capacity=capacity,
+            professor_id=sample_data["professor"].id, department_id=sample_data["department"].id,
+        )
+        test_db.add(course)
+        test_db.flush()
+        for day, start, end in meetings:
+            test_db.add(Schedule(course_id=course.id, day_of_week=day, start_time=start, end_time=end))
+        return course
+
+    return build
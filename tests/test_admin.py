@@ -0,0 +1,118 @@
+"""
+tests/test_admin.py - 운영/진단 API 테스트
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.enrollment_service import EnrollmentService
+from app.utils.lock_stats import LockStats, lock_stats
+
+
+def test_lock_stats_endpoint(client, sample_data, test_session_factory):
+    """락 계측 활성화 후 키 종류별 통계/상위 강좌 키 노출"""
+    course_id = sample_data["courses"][1].id
+    student_ids = [s.id for s in sample_data["students"]]
+
+    response = client.post("/api/v1/admin/locks", params={"enabled": True, "reset": True})
+    assert response.json()["enabled"] is True
+
+    def enroll(student_id):
+        db = test_session_factory()
+        try:
+            EnrollmentService.enroll_course(db, student_id, course_id)
+            db.commit()
+        finally:
+            db.close()
+
+    try:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(enroll, student_ids))
+
+        data = client.get("/api/v1/admin/locks").json()
+        metrics = client.get("/metrics").text
+    finally:
+        client.post("/api/v1/admin/locks", params={"enabled": False, "reset": True})
+
+    assert data["kinds"]["course"]["acquisitions"] == 3
+    assert data["kinds"]["student"]["acquisitions"] == 3
+    assert data["kinds"]["course"]["waiters"] == 0
+    assert data["hottest_courses"][0]["key"] == f"course:{course_id}"
+    assert 'app_lock_wait_seconds_count{kind="course"} 3' in metrics
+    assert "# TYPE app_lock_hot_course_wait_seconds gauge" in metrics
+    assert lock_stats.enabled is False
+
+
+def test_lock_stats_reset_keeps_live_waiters():
+    """대기 중에 reset해도 누적값만 0이 되고 대기자 수는 음수가 되지 않음"""
+    stats = LockStats(enabled=True)
+    stats.begin_wait("course:1", "course")
+    stats.reset()
+    stats.end_wait("course:1", "course", 0.01, True)
+    stats.record_hold("course", 0.002)
+
+    course = stats.snapshot()["kinds"]["course"]
+    assert course["waiters"] == 0 and course["acquisitions"] == 1
+    assert stats.hottest_courses()[0]["waiters"] == 0
+    stats.reset()
+
+
+def test_slow_request_profile(client, sample_data, monkeypatch):
+    """느린 요청의 콜스택이 collapsed stack으로 보관/다운로드"""
+    import time as time_module
+    from app.services.enrollment_service import EnrollmentService
+    from app.utils.profiler import profiler
+
+    original = EnrollmentService._get_current_credits
+
+    def slow_credits(db, student_id):
+        time_module.sleep(0.1)
+        return original(db, student_id)
+
+    monkeypatch.setattr(EnrollmentService, "_get_current_credits", staticmethod(slow_credits))
+    client.post("/api/v1/admin/profiles", params={"enabled": True, "slow_threshold_ms": 50, "clear": True})
+    try:
+        response = client.post(
+            f"/api/v1/students/{sample_data['students'][0].id}/enrollments",
+            json={"course_id": sample_data["courses"][0].id},
+        )
+        assert response.status_code == 201
+        listing = client.get("/api/v1/admin/profiles").json()
+    finally:
+        client.post("/api/v1/admin/profiles", params={"enabled": False, "slow_threshold_ms": 500})
+
+    profile = next(p for p in listing["profiles"] if p["method"] == "POST")
+    assert profile["route"] == "/api/v1/students/{student_id}/enrollments"
+    assert profile["reason"] == "slow"
+    assert profile["samples"] > 0
+
+    download = client.get(f"/api/v1/admin/profiles/{profile['id']}")
+    assert download.status_code == 200
+    assert "attachment" in download.headers["content-disposition"]
+    assert "slow_credits" in download.text
+
+    client.post("/api/v1/admin/profiles", params={"clear": True})
+    assert client.get(f"/api/v1/admin/profiles/{profile['id']}").status_code == 404
+
+
+def test_memory_snapshots_and_diff(client):
+    """tracemalloc 스냅샷 비교 + 객체 수"""
+    assert client.post("/api/v1/admin/memory/snapshots", params={"name": "early"}).status_code == 409
+
+    client.post("/api/v1/admin/memory/tracing", params={"enabled": True})
+    try:
+        client.post("/api/v1/admin/memory/snapshots", params={"name": "before"})
+        leak = [bytearray(1024) for _ in range(200)]
+        client.post("/api/v1/admin/memory/snapshots", params={"name": "after"})
+
+        diff = client.get("/api/v1/admin/memory/diff", params={"base": "before", "target": "after", "top": 5}).json()
+        status = client.get("/api/v1/admin/memory").json()
+        missing = client.get("/api/v1/admin/memory/diff", params={"base": "nope"})
+    finally:
+        client.post("/api/v1/admin/memory/tracing", params={"enabled": False})
+
+    assert diff["stats"][0]["size_diff_bytes"] >= 200 * 1024
+    assert "test_admin.py" in diff["stats"][0]["location"]
+    assert status["tracing"] is True
+    assert status["snapshots"] == ["before", "after"]
+    assert {"lock_registry_entries", "live_orm_sessions", "identity_map_objects"} <= set(status["objects"])
+    assert missing.status_code == 404
+    assert len(leak) == 200
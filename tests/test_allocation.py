@@ -0,0 +1,80 @@
+"""
+사전 신청 일괄 배정 테스트
+"""
+from datetime import datetime, time, timedelta
+
+from app.config import settings
+from app.models import Course, CoursePreference, DayOfWeek, Enrollment, Schedule
+from app.services.allocation_service import AllocationService
+from app.services.journal_service import enrollment_state
+from app.utils.schedule_bits import load_course_masks, schedule_mask
+
+
+def _submit(db, student, courses):
+    AllocationService.submit_preferences(db, student.id, [c.id for c in courses])
+    db.commit()
+
+
+def test_schedule_masks_detect_overlap_only():
+    mon_9 = schedule_mask(DayOfWeek.MON, time(9, 0), time(10, 30))
+
+    assert mon_9 & schedule_mask(DayOfWeek.MON, time(10, 0), time(11, 0))
+    assert not mon_9 & schedule_mask(DayOfWeek.MON, time(10, 30), time(12, 0))  # 맞닿음
+    assert not mon_9 & schedule_mask(DayOfWeek.TUE, time(9, 0), time(10, 30))
+
+
+def test_allocation_respects_capacity_conflicts_and_is_reproducible(test_db, sample_data):
+    students = sample_data["students"]
+    course1, course2 = sample_data["courses"]  # course1: 정원 2, MON 09:00-10:30
+    overlap = Course(
+        name="운영체제", code="CS103", credits=3, capacity=30,
+        professor_id=course1.professor_id, department_id=course1.department_id,
+    )
+    test_db.add(overlap)
+    test_db.flush()
+    test_db.add(Schedule(course_id=overlap.id, day_of_week=DayOfWeek.MON, start_time=time(10, 0), end_time=time(11, 0)))
+    test_db.commit()
+    assert load_course_masks(test_db)[overlap.id] & load_course_masks(test_db)[course1.id]
+
+    for student in students:
+        _submit(test_db, student, [course1, overlap, course2])
+
+    summary = AllocationService.allocate(test_db, seed=7)
+
+    assert summary["rounds"] == 3 and summary["preferences"] == 9
+    assert summary["rejected"] == {"TIME_CONFLICT": 2, "CAPACITY_EXCEEDED": 1}
+    test_db.expire_all()
+    assert test_db.get(Course, course1.id).enrolled == 2
+    assert test_db.get(Course, course2.id).enrolled == 3
+    assert test_db.get(Course, overlap.id).enrolled == 1  # 1지망에서 탈락한 학생만
+    assert test_db.query(Enrollment).count() == summary["allocated"] == 6
+    assert test_db.query(CoursePreference).filter(CoursePreference.status == "PENDING").count() == 0
+    assert enrollment_state.enrolled(course2.id) == 3
+
+    # 같은 시드, 같은 입력 → 같은 결과
+    first = {(p.student_id, p.course_id): p.status for p in test_db.query(CoursePreference)}
+    test_db.query(Enrollment).delete()
+    test_db.query(Course).update({"enrolled": 0})
+    test_db.query(CoursePreference).update({"status": "PENDING", "reason": None})
+    test_db.commit()
+    AllocationService.allocate(test_db, seed=7)
+    assert {(p.student_id, p.course_id): p.status for p in test_db.query(CoursePreference)} == first
+
+
+def test_preference_routes(client, sample_data, monkeypatch):
+    student = sample_data["students"][0]
+    course1, course2 = sample_data["courses"]
+    url = f"/api/v1/students/{student.id}/preferences"
+
+    assert client.put(url, json={"course_ids": [course2.id, course1.id]}).status_code == 200
+    assert [p["course_id"] for p in client.get(url).json()] == [course2.id, course1.id]
+    assert client.put(url, json={"course_ids": [course1.id, course1.id]}).status_code == 422
+
+    monkeypatch.setattr(settings, "preference_window_end", datetime.utcnow() - timedelta(minutes=1))
+    closed = client.put(url, json={"course_ids": [course1.id]})
+    assert closed.status_code == 409
+    assert closed.json()["code"] == "PREFERENCE_WINDOW_CLOSED"
+
+    summary = client.post("/api/v1/admin/allocations", params={"seed": 1}).json()
+    assert summary["allocated"] == 2
+    assert {p["status"] for p in client.get(url).json()} == {"ALLOCATED"}
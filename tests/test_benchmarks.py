@@ -0,0 +1,52 @@
+"""
+tests/test_benchmarks.py - 벤치마크 도구 스모크 테스트
+"""
+import asyncio
+
+import httpx
+
+from app.main import app
+from benchmarks.registration_rush import Scenario, percentile, run_rush, ROUTE_ENROLL
+
+
+def test_percentile_nearest_rank():
+    """nearest-rank 백분위수"""
+    ordered = [float(i) for i in range(1, 101)]
+    assert percentile(ordered, 50) == 50.0
+    assert percentile(ordered, 99) == 99.0
+    assert percentile([], 95) == 0.0
+
+
+def test_registration_rush_smoke(client, sample_data):
+    """작은 시나리오로 리포트 구조 확인"""
+    scenario = Scenario(
+        students=3, courses=2, hot_courses=1, think_time_ms=0,
+        duration=5.0, max_requests=20, concurrency=1,
+    )
+
+    async def _run():
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+            return await run_rush(http, scenario)
+
+    result = asyncio.run(_run())
+
+    assert result["total_requests"] == 20
+    assert ROUTE_ENROLL in result["routes"]
+    assert {"p50_ms", "p95_ms", "p99_ms"} <= set(result["routes"][ROUTE_ENROLL])
+    assert "sqlite_busy" in result
+
+
+def test_microbench_regression_check():
+    """기준값 대비 시간/SQL 수 회귀 판정"""
+    from benchmarks.microbench import check_regressions
+
+    baseline = {"f[courses=500,load=0]": {"median_us": 110.0, "min_us": 100.0, "statements": 3}}
+    ok = {"f[courses=500,load=0]": {"median_us": 130.0, "min_us": 120.0, "statements": 3}}
+    slow = {"f[courses=500,load=0]": {"median_us": 210.0, "min_us": 200.0, "statements": 3}}
+    chatty = {"f[courses=500,load=0]": {"median_us": 110.0, "min_us": 100.0, "statements": 4}}
+
+    assert check_regressions(ok, baseline, threshold=0.25) == []
+    assert len(check_regressions(slow, baseline, threshold=0.25)) == 1
+    assert check_regressions(slow, baseline, threshold=0.25, min_delta_us=500) == []
+    assert len(check_regressions(chatty, baseline, threshold=0.25)) == 1
@@ -0,0 +1,76 @@
+"""
+수강신청 대량 등록 테스트
+"""
+import json
+
+from app.models import Course, Enrollment, EnrollmentEvent
+from app.services.bulk_import_service import BulkImportService
+from app.services.journal_service import enrollment_state
+
+
+def _run(db, text, fmt="csv", batch_rows=None):
+    lines = list(BulkImportService.run(db, text.splitlines(keepends=True), fmt, batch_rows))
+    return lines[:-1], lines[-1]["summary"]
+
+
+def test_import_validates_rows_set_wise(test_db, sample_data):
+    s1, s2, s3 = (s.id for s in sample_data["students"])
+    c1, c2 = (c.id for c in sample_data["courses"])  # c1: 정원 2명, MON / c2: TUE
+    rows = "\n".join([
+        "student_id,course_id",
+        f"{s1},{c1}",
+        f"{s1},{c1}",      # 배치 안 중복
+        f"{s2},{c1}",
+        f"{s3},{c1}",      # 정원 초과 (입력 순서대로 선착순)
+        f"{s3},{c2}",
+        "999,1",
+        f"{s1},abc",
+    ]) + "\n"
+
+    errors, summary = _run(test_db, rows, batch_rows=3)
+
+    assert [(e["row"], e["code"]) for e in errors] == [
+        (3, "ALREADY_ENROLLED"),
+        (5, "CAPACITY_EXCEEDED"),
+        (7, "STUDENT_NOT_FOUND"),
+        (8, "INVALID_ROW"),
+    ]
+    assert summary["rows"] == 7 and summary["imported"] == 3 and summary["batches"] == 2
+    test_db.expire_all()
+    assert test_db.get(Course, c1).enrolled == 2
+    assert test_db.get(Course, c2).enrolled == 1
+    assert test_db.query(EnrollmentEvent).count() == 3
+    assert enrollment_state.enrolled(c1) == 2
+
+
+def test_import_checks_existing_credits_and_conflicts(test_db, sample_data, monkeypatch):
+    from app.config import settings
+
+    student = sample_data["students"][0]
+    c1, c2 = sample_data["courses"]
+    test_db.query(Course).filter(Course.id == c2.id).update({"credits": 4})
+    test_db.commit()
+    monkeypatch.setattr(settings, "max_credits_per_semester", 6)
+    rows = [{"student_id": student.id, "course_id": c1.id}, {"student_id": student.id, "course_id": c2.id}]
+
+    first_errors, _ = _run(test_db, json.dumps(rows[0]) + "\n", fmt="ndjson")
+    errors, summary = _run(test_db, "\n".join(json.dumps(r) for r in rows), fmt="ndjson")
+
+    assert first_errors == []
+    assert [e["code"] for e in errors] == ["ALREADY_ENROLLED", "CREDIT_EXCEEDED"]
+    assert summary["imported"] == 0
+    assert test_db.query(Enrollment).count() == 1
+
+
+def test_import_endpoint_streams_report(client, test_db, sample_data):
+    student = sample_data["students"][0]
+    course = sample_data["courses"][1]
+    body = f"student_id,course_id\n{student.id},{course.id}\n{student.id},424242\n"
+
+    response = client.post("/api/v1/imports/enrollments", content=body.encode())
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert lines[0]["code"] == "COURSE_NOT_FOUND"
+    assert lines[-1]["summary"]["imported"] == 1
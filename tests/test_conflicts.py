@@ -0,0 +1,111 @@
+"""
+강좌 간 시간 충돌 인덱스 테스트
+"""
+from datetime import time
+
+from app.models import Course, DayOfWeek, Schedule
+from app.services.conflict_service import ConflictIndex, conflict_index
+
+
+def test_index_groups_patterns_and_refreshes_on_schedule_commit(test_db, sample_data, add_course):
+    course1, course2 = sample_data["courses"]  # MON 09:00-10:30, TUE 09:00-10:30
+    same_time = add_course("CS201", (DayOfWeek.MON, time(9, 0), time(10, 30)))
+    overlap = add_course("CS202", (DayOfWeek.MON, time(10, 0), time(11, 0)))
+    adjacent = add_course("CS203", (DayOfWeek.MON, time(10, 30), time(12, 0)))
+    test_db.commit()  # 커밋 후 훅이 백그라운드 재적재 요청
+    assert conflict_index.wait(5)
+
+    assert conflict_index.loaded and conflict_index.summary()["patterns"] == 4
+    assert conflict_index.conflicts(course1.id, same_time.id) and conflict_index.conflicts(course1.id, overlap.id)
+    assert not conflict_index.conflicts(course1.id, adjacent.id)  # 맞닿음
+    assert not conflict_index.conflicts(course1.id, course2.id)
+    assert conflict_index.conflicting_all(course1.id) == [same_time.id, overlap.id]
+
+    schedule = test_db.query(Schedule).filter(Schedule.course_id == overlap.id).one()
+    schedule.day_of_week = DayOfWeek.FRI
+    test_db.commit()
+    assert conflict_index.wait(5)
+
+    assert conflict_index.conflicting_all(course1.id) == [same_time.id]
+
+    test_db.query(Schedule).filter(Schedule.course_id == same_time.id).update({"start_time": time(13, 0), "end_time": time(14, 0)})
+    test_db.rollback()  # 롤백된 변경은 반영 안 됨
+    assert not conflict_index.stale
+    assert conflict_index.conflicting_all(course1.id) == [same_time.id]
+
+
+def test_check_endpoint_reports_pairs_and_timetable_conflicts(client, sample_data, test_db, add_course):
+    course1, course2 = sample_data["courses"]
+    student = sample_data["students"][0]
+    overlap = add_course("CS202", (DayOfWeek.MON, time(10, 0), time(11, 0)))
+    tue = add_course("CS204", (DayOfWeek.TUE, time(10, 0), time(11, 0)))
+    unscheduled = Course(
+        name="CS299", code="CS299", credits=3, capacity=30,
+        professor_id=course1.professor_id, department_id=course1.department_id,
+    )
+    test_db.add(unscheduled)
+    test_db.commit()
+    assert client.post(f"/api/v1/students/{student.id}/enrollments", json={"course_id": course2.id}).status_code == 201
+
+    response = client.post("/api/v1/courses/conflicts", json={
+        "course_ids": [course1.id, overlap.id, tue.id, unscheduled.id],
+        "student_id": student.id,
+    })
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "pairs": [[course1.id, overlap.id]],
+        "timetable": [{"course_id": tue.id, "conflicts_with": [course2.id]}],
+        "conflict_free": [unscheduled.id],
+        "unscheduled": [unscheduled.id],
+    }
+
+    response = client.post("/api/v1/courses/conflicts", json={"course_ids": [course1.id, 999]})
+    assert response.status_code == 404
+    assert response.json()["code"] == "COURSE_NOT_FOUND"
+
+
+def test_enrollment_uses_index_for_time_conflicts(client, sample_data, test_db, add_course):
+    course1 = sample_data["courses"][0]
+    student = sample_data["students"][0]
+    overlap = add_course("CS202", (DayOfWeek.MON, time(10, 0), time(11, 0)))
+    test_db.commit()
+    assert client.post(f"/api/v1/students/{student.id}/enrollments", json={"course_id": course1.id}).status_code == 201
+
+    response = client.post(f"/api/v1/students/{student.id}/enrollments", json={"course_id": overlap.id})
+
+    assert response.status_code == 409
+    assert response.json()["code"] == "TIME_CONFLICT"
+    assert [c["id"] for c in response.json()["conflicting_courses"]] == [course1.id]
+
+
+def test_non_aligned_times_are_confirmed_exactly(client, sample_data, test_db, add_course):
+    course1 = sample_data["courses"][0]
+    student = sample_data["students"][0]
+    early = add_course("CS205", (DayOfWeek.WED, time(9, 0), time(9, 32)))
+    late = add_course("CS206", (DayOfWeek.WED, time(9, 33), time(10, 0)))
+    test_db.commit()
+    conflict_index.wait(5)
+    assert conflict_index.conflicts(early.id, late.id)  # 5분 칸(09:30-09:35)은 겹침 → 후보
+
+    assert client.post(f"/api/v1/students/{student.id}/enrollments", json={"course_id": early.id}).status_code == 201
+    assert client.post(f"/api/v1/students/{student.id}/enrollments", json={"course_id": late.id}).status_code == 201
+
+    response = client.post("/api/v1/courses/conflicts", json={"course_ids": [early.id, late.id]})
+    assert response.json()["pairs"] == []
+
+
+def test_stale_index_checks_every_enrolled_course_exactly(client, sample_data, test_db, monkeypatch, add_course):
+    course1 = sample_data["courses"][0]
+    student = sample_data["students"][0]
+    assert client.post(f"/api/v1/students/{student.id}/enrollments", json={"course_id": course1.id}).status_code == 201
+    monkeypatch.setattr(conflict_index, "refresh", lambda bind: None)  # 재적재가 아직 안 끝난 상태
+    monkeypatch.setattr(ConflictIndex, "stale", property(lambda self: True))
+    overlap = add_course("CS202", (DayOfWeek.MON, time(10, 0), time(11, 0)))
+    test_db.commit()
+    assert conflict_index.mask(overlap.id) == 0  # 옛 스냅샷에는 없음
+
+    response = client.post(f"/api/v1/students/{student.id}/enrollments", json={"course_id": overlap.id})
+
+    assert response.status_code == 409
+    assert [c["id"] for c in response.json()["conflicting_courses"]] == [course1.id]
@@ -0,0 +1,55 @@
+"""
+데이터 통계 카운터 테스트
+"""
+from sqlalchemy import event
+
+from app.models import Student
+from app.services.data_stats_service import DataStatsService, data_stats
+
+
+def test_counters_follow_enroll_and_cancel_without_queries(client, test_db, test_read_session_factory, sample_data):
+    course1, _ = sample_data["courses"]
+    student = sample_data["students"][0]
+
+    seeded = client.get("/api/v1/test/data-stats").json()
+    assert seeded == {"students": 3, "courses": 2, "professors": 1, "departments": 1, "enrollments": 0}
+
+    enrollment_id = client.post(
+        f"/api/v1/students/{student.id}/enrollments", json={"course_id": course1.id}
+    ).json()["id"]
+
+    statements = []
+    read_engine = test_read_session_factory.kw["bind"]
+    listener = lambda *args: statements.append(args[2])
+    event.listen(read_engine, "before_cursor_execute", listener)
+    try:
+        assert client.get("/api/v1/test/data-stats").json()["enrollments"] == 1
+    finally:
+        event.remove(read_engine, "before_cursor_execute", listener)
+    assert statements == []
+
+    client.delete(f"/api/v1/students/{student.id}/enrollments/{enrollment_id}")
+    assert client.get("/api/v1/test/data-stats").json()["enrollments"] == 0
+
+
+def test_rolled_back_enrollment_is_not_counted(client, sample_data):
+    course1, _ = sample_data["courses"]  # 정원 2
+    client.get("/api/v1/test/data-stats")
+    for student in sample_data["students"]:
+        client.post(f"/api/v1/students/{student.id}/enrollments", json={"course_id": course1.id})
+
+    assert client.get("/api/v1/test/data-stats").json()["enrollments"] == 2
+
+
+def test_reconcile_corrects_persistent_drift(test_db, sample_data):
+    DataStatsService.seed(test_db)
+    department_id = sample_data["department"].id
+    test_db.add(Student(name="최학생", student_id="2024004", email="s4@example.com", department_id=department_id))
+    test_db.commit()  # 카운터 훅 없이 추가
+
+    result = DataStatsService.reconcile(test_db, recheck_delay_s=0)
+
+    assert result["suspected"] == {"students": 1}
+    assert result["corrected"] == {"students": 1}
+    assert data_stats.snapshot()["students"] == 4
+    assert DataStatsService.reconcile(test_db, recheck_delay_s=0)["corrected"] == {}
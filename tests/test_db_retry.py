@@ -0,0 +1,80 @@
+"""
+SQLite 쓰기 트랜잭션 (BEGIN IMMEDIATE + SQLITE_BUSY 재시도) 테스트
+"""
+import sqlite3
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.config import settings
+from app.services.enrollment_service import EnrollmentService
+from app.utils.db_retry import run_write_transaction, DB_BUSY_RETRIES, DB_BUSY_EXHAUSTED
+from app.utils.query_counter import count_queries
+
+
+def _busy_error():
+    return OperationalError("UPDATE courses", {}, sqlite3.OperationalError("database is locked"))
+
+
+@pytest.fixture
+def fast_retry(monkeypatch):
+    monkeypatch.setattr(settings, "db_busy_retry_attempts", 3)
+    monkeypatch.setattr(settings, "db_busy_retry_base_ms", 0.0)
+
+
+def test_enrollment_begins_immediate(test_session_factory, sample_data):
+    """수강신청 트랜잭션은 BEGIN IMMEDIATE로 시작"""
+    student_id = sample_data["students"][0].id
+    course_id = sample_data["courses"][1].id
+    db = test_session_factory()
+    try:
+        with count_queries(db.get_bind()) as stats:
+            EnrollmentService.enroll_course(db, student_id, course_id)
+            db.commit()
+    finally:
+        db.close()
+
+    assert list(stats.shapes)[0] == "BEGIN IMMEDIATE"
+
+
+def test_retries_only_on_busy(test_db, fast_retry):
+    """SQLITE_BUSY는 재시도, 그 외 예외는 즉시 전달"""
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise _busy_error()
+        return "ok"
+
+    before = DB_BUSY_RETRIES.value("test")
+    assert run_write_transaction(test_db, "test", flaky) == "ok"
+    assert DB_BUSY_RETRIES.value("test") == before + 2
+
+    def broken():
+        calls.append(1)
+        raise OperationalError("SELECT", {}, sqlite3.OperationalError("no such table: x"))
+
+    calls.clear()
+    with pytest.raises(OperationalError):
+        run_write_transaction(test_db, "test", broken)
+    assert len(calls) == 1
+
+
+def test_busy_exhausted_returns_503(client, sample_data, fast_retry, monkeypatch):
+    """재시도 소진 시 503 + Retry-After"""
+    def always_busy(db, student_id, course_id):
+        raise _busy_error()
+
+    monkeypatch.setattr(EnrollmentService, "enroll_course", staticmethod(always_busy))
+    before = DB_BUSY_EXHAUSTED.value("enroll")
+
+    response = client.post(
+        f"/api/v1/students/{sample_data['students'][0].id}/enrollments",
+        json={"course_id": sample_data["courses"][0].id},
+    )
+
+    assert response.status_code == 503
+    assert response.json()["code"] == "DATABASE_BUSY"
+    assert response.headers["retry-after"] == str(settings.db_busy_retry_after_s)
+    assert DB_BUSY_EXHAUSTED.value("enroll") == before + 1
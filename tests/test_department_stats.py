@@ -0,0 +1,98 @@
+"""
+학과별 정원/신청 인원 집계 테스트
+"""
+from sqlalchemy import update
+
+from app.models import Course
+from app.services.department_stats_service import DepartmentStatsService, department_stats
+
+
+def _enroll(client, student, course):
+    return client.post(f"/api/v1/students/{student.id}/enrollments", json={"course_id": course.id})
+
+
+def test_department_figures_follow_enroll_and_cancel(client, sample_data):
+    course1, course2 = sample_data["courses"]  # 정원 2, 30
+    student1, student2, _ = sample_data["students"]
+    department_id = sample_data["department"].id
+
+    before = client.get(f"/api/v1/departments/{department_id}").json()
+    assert (before["courses"], before["capacity"], before["enrolled"], before["full_courses"]) == (2, 32, 0, 0)
+
+    _enroll(client, student1, course1)
+    enrollment_id = _enroll(client, student2, course1).json()["id"]
+    _enroll(client, student1, course2)
+
+    after = client.get("/api/v1/departments").json()[0]
+    assert (after["enrolled"], after["full_courses"], after["fill_rate"]) == (3, 1, round(3 / 32, 4))
+
+    client.delete(f"/api/v1/students/{student2.id}/enrollments/{enrollment_id}")
+    cancelled = client.get(f"/api/v1/departments/{department_id}").json()
+    assert (cancelled["enrolled"], cancelled["full_courses"]) == (2, 0)
+
+
+def test_capacity_change_updates_aggregate(client, sample_data):
+    course1, _ = sample_data["courses"]
+    student1, student2, _ = sample_data["students"]
+    department_id = sample_data["department"].id
+    _enroll(client, student1, course1)
+    _enroll(client, student2, course1)
+    assert client.get(f"/api/v1/departments/{department_id}").json()["full_courses"] == 1
+
+    response = client.put(f"/api/v1/admin/courses/{course1.id}/capacity", params={"capacity": 5})
+    assert response.status_code == 200
+
+    figures = client.get(f"/api/v1/departments/{department_id}").json()
+    assert (figures["capacity"], figures["full_courses"]) == (35, 0)
+
+    rejected = client.put(f"/api/v1/admin/courses/{course1.id}/capacity", params={"capacity": 1})
+    assert rejected.status_code == 409 and rejected.json()["code"] == "CAPACITY_BELOW_ENROLLED"
+
+
+def test_verify_replaces_courses_drifted_on_two_passes(test_db, test_session_factory, sample_data):
+    course1, course2 = sample_data["courses"]
+    department_id = sample_data["department"].id
+    department_stats.load(test_db)
+    test_db.execute(update(Course).where(Course.id == course1.id).values(enrolled=2))  # 훅 없이 변경
+    test_db.commit()
+    assert department_stats.department(department_id)["enrolled"] == 0
+
+    read_db = test_session_factory()
+    first = DepartmentStatsService.verify(read_db)
+    assert (first["suspected"], first["drifted"]) == (1, 0)  # 다음 검증까지 보류
+    assert department_stats.department(department_id)["enrolled"] == 0
+
+    report = DepartmentStatsService.verify(read_db)
+
+    assert report["scanned"] == 2 and report["drifted"] == 1
+    assert report["samples"] == [{
+        "course_id": course1.id,
+        "aggregate": [department_id, 2, 0],
+        "actual": [department_id, 2, 2],
+    }]
+    figures = department_stats.department(department_id)
+    assert (figures["enrolled"], figures["full_courses"]) == (2, 1)
+    assert DepartmentStatsService.verify(read_db)["suspected"] == 0
+    read_db.close()
+
+
+def test_verify_skips_courses_whose_hook_lands_between_passes(test_db, test_session_factory, sample_data):
+    course1, _ = sample_data["courses"]
+    department_id = sample_data["department"].id
+    department_stats.load(test_db)
+    test_db.execute(update(Course).where(Course.id == course1.id).values(enrolled=1))
+    test_db.commit()  # 커밋됐지만 훅은 아직 반영 전
+
+    read_db = test_session_factory()
+    assert DepartmentStatsService.verify(read_db)["suspected"] == 1
+    department_stats.adjust(course1.id, 1)  # 늦게 도착한 커밋 후 훅
+    report = DepartmentStatsService.verify(read_db)
+    read_db.close()
+
+    assert (report["suspected"], report["drifted"]) == (0, 0)
+    assert department_stats.department(department_id)["enrolled"] == 1  # 두 번 세지 않음
+
+
+def test_unknown_department(client, sample_data):
+    response = client.get("/api/v1/departments/999")
+    assert response.status_code == 404 and response.json()["code"] == "DEPARTMENT_NOT_FOUND"
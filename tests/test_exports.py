@@ -0,0 +1,76 @@
+"""
+대량 내보내기 테스트
+"""
+import csv
+import io
+import json
+
+from app.services.enrollment_service import EnrollmentService
+from app.services.export_service import ExportService
+
+
+def _enroll_all(db, sample_data):
+    """학생 3명 → 강좌 2(정원 30), 학생 1 → 강좌 1, 학생 1의 강좌 2 신청은 취소"""
+    students = sample_data["students"]
+    course1, course2 = sample_data["courses"]
+    enrollments = [EnrollmentService.enroll_course(db, s.id, course2.id) for s in students]
+    db.commit()
+    EnrollmentService.enroll_course(db, students[1].id, course1.id)
+    EnrollmentService.cancel_enrollment(db, students[0].id, enrollments[0].id)
+    db.commit()
+
+
+def test_export_enrollments_csv_with_status_filter(client, test_db, sample_data):
+    _enroll_all(test_db, sample_data)
+
+    response = client.get("/api/v1/exports/enrollments", params={"status": "ENROLLED"})
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="enrollments.csv"' in response.headers["content-disposition"]
+    assert len(rows) == 3
+    assert {row["status"] for row in rows} == {"ENROLLED"}
+    assert [int(row["enrollment_id"]) for row in rows] == sorted(int(row["enrollment_id"]) for row in rows)
+
+
+def test_export_roster_and_schedule_ndjson(client, test_db, sample_data):
+    _enroll_all(test_db, sample_data)
+    course2 = sample_data["courses"][1]
+    student = sample_data["students"][1]
+
+    roster = client.get("/api/v1/exports/rosters", params={"course_id": course2.id, "format": "ndjson"})
+    roster_rows = [json.loads(line) for line in roster.text.splitlines()]
+    schedule = client.get("/api/v1/exports/schedules", params={"format": "ndjson"})
+    schedule_rows = [json.loads(line) for line in schedule.text.splitlines() if json.loads(line)["student_id"] == student.id]
+
+    assert roster.headers["content-type"] == "application/x-ndjson"
+    assert [row["student_number"] for row in roster_rows] == ["2024002", "2024003"]  # 취소 제외
+    assert {row["course_code"] for row in schedule_rows} == {"CS101", "CS102"}
+    assert schedule_rows[0]["day_of_week"] in ("MON", "TUE") and len(schedule_rows[0]["start_time"]) == 5
+
+
+def test_export_rejects_unknown_format(client):
+    assert client.get("/api/v1/exports/enrollments", params={"format": "xml"}).status_code == 422
+
+
+def test_stream_reads_consistent_snapshot_in_chunks(test_db, test_session_factory, sample_data):
+    students = sample_data["students"]
+    course2 = sample_data["courses"][1]
+    EnrollmentService.enroll_course(test_db, students[0].id, course2.id)
+    EnrollmentService.enroll_course(test_db, students[1].id, course2.id)
+    test_db.commit()
+
+    chunks = ExportService.stream(test_db.get_bind(), "enrollments", "ndjson", chunk_rows=1)
+    first = [next(chunks), next(chunks)]  # 헤더 없음 → 첫 청크 1행
+
+    # 내보내기 도중 커밋된 신청은 포함되지 않음
+    writer = test_session_factory()
+    EnrollmentService.enroll_course(writer, students[2].id, course2.id)
+    writer.commit()
+    writer.close()
+
+    rest = list(chunks)
+    lines = [line for chunk in first + rest for line in chunk.splitlines()]
+    assert len(lines) == 2
+    assert all(chunk.count("\n") <= 1 for chunk in first + rest)
@@ -1,6 +1,14 @@
 """
 tests/test_health.py - 헬스 체크 테스트
 """
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.utils import pool_stats
+from app.utils.pool_stats import TimedQueuePool, register_pool, pool_status
+
+
 def test_health_check(client):
     """헬스 체크 엔드포인트 테스트"""
     response = client.get("/health")
@@ -9,4 +17,38 @@ def test_health_check(client):
     data = response.json()
     
     assert data["status"] == "healthy"
-    assert "database" in data
\ No newline at end of file
+    assert "database" in data
+
+
+def test_pool_health(client):
+    """커넥션 풀 상태 엔드포인트"""
+    response = client.get("/health/pool")
+
+    assert response.status_code == 200
+    primary = response.json()["pools"]["primary"]
+    assert {"size", "checked_out", "overflow", "checkouts", "timeouts", "wait_max_s"} <= set(primary)
+
+
+def test_pool_wait_and_timeout_stats(tmp_path):
+    """커넥션 대기/타임아웃 기록"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    register_pool("test", engine.pool)
+
+    held = engine.connect()
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    status = pool_status()["test"]
+    held.close()
+    engine.dispose()
+    pool_stats._pools.pop("test")
+
+    assert status["checked_out"] == 1
+    assert status["checkouts"] == 1
+    assert status["timeouts"] == 1
+    assert status["wait_max_s"] >= 0.05
@@ -0,0 +1,96 @@
+"""
+수강신청 저널/스냅샷 복구 테스트
+"""
+import pytest
+
+from app.models import EnrollmentEvent
+from app.services.data_service import DataService
+from app.services.enrollment_service import EnrollmentService
+from app.services.journal_service import JournalService, EnrollmentState, enrollment_state
+from app.utils.exceptions import CapacityExceededException
+
+
+def _enroll(db, student, course):
+    enrollment = EnrollmentService.enroll_course(db, student.id, course.id)
+    db.commit()
+    return enrollment
+
+
+def test_events_recorded_and_applied_after_commit(test_db, sample_data):
+    student = sample_data["students"][0]
+    course = sample_data["courses"][1]
+
+    enrollment = _enroll(test_db, student, course)
+    assert enrollment_state.enrolled(course.id) == 1
+    assert enrollment_state.student_load(student.id) == (3, 1)
+
+    EnrollmentService.cancel_enrollment(test_db, student.id, enrollment.id)
+    test_db.commit()
+
+    events = test_db.query(EnrollmentEvent).order_by(EnrollmentEvent.id).all()
+    assert [(e.event_type, e.enrollment_id, e.credits) for e in events] == [
+        ("ENROLL", enrollment.id, 3),
+        ("CANCEL", enrollment.id, 3),
+    ]
+    assert enrollment_state.enrolled(course.id) == 0
+    assert enrollment_state.student_load(student.id) == (0, 0)
+
+
+def test_rolled_back_transaction_not_applied(test_db, sample_data):
+    student = sample_data["students"][0]
+    course = sample_data["courses"][0]
+
+    EnrollmentService.enroll_course(test_db, student.id, course.id)
+    test_db.rollback()
+
+    assert test_db.query(EnrollmentEvent).count() == 0
+    assert enrollment_state.enrolled(course.id) == 0
+
+
+def test_rebuild_replays_only_tail_after_snapshot(test_db, sample_data):
+    students = sample_data["students"]
+    course1, course2 = sample_data["courses"]
+
+    _enroll(test_db, students[0], course1)
+    _enroll(test_db, students[1], course1)
+    snapshot = JournalService.take_snapshot(test_db)
+    assert snapshot["events_folded"] == 2
+    assert JournalService.take_snapshot(test_db) is None  # 새 이벤트 없음
+
+    _enroll(test_db, students[0], course2)
+    with pytest.raises(CapacityExceededException):
+        EnrollmentService.enroll_course(test_db, students[2].id, course1.id)
+    test_db.rollback()
+
+    recovered = EnrollmentState()
+    result = JournalService.rebuild(test_db, recovered)
+
+    assert result["snapshot_event_id"] == snapshot["last_event_id"]
+    assert result["replayed_events"] == 1
+    assert recovered.seats == enrollment_state.seats == {course1.id: 2, course2.id: 1}
+    assert recovered.student_load(students[0].id) == (6, 2)
+
+
+def test_journal_admin_endpoints(client, test_db, sample_data):
+    _enroll(test_db, sample_data["students"][0], sample_data["courses"][0])
+
+    created = client.post("/api/v1/admin/journal/snapshots").json()
+    status = client.get("/api/v1/admin/journal").json()
+
+    assert created["created"] is True
+    assert status["latest_snapshot"]["last_event_id"] == created["snapshot"]["last_event_id"]
+    assert status["state"]["tail_events"] == 0
+
+
+def test_restart_without_reseed_recovers_from_kept_journal(test_db, sample_data):
+    """`init_reseed=false`로 재시작하면 데이터/저널을 지우지 않고 스냅샷 + tail로 복구"""
+    _enroll(test_db, sample_data["students"][0], sample_data["courses"][1])
+    JournalService.take_snapshot(test_db)
+    _enroll(test_db, sample_data["students"][1], sample_data["courses"][1])
+
+    assert DataService.is_empty(test_db) is False  # 시작 시 clear_all 건너뜀
+    recovered = EnrollmentState()
+    result = JournalService.rebuild(test_db, recovered)
+
+    assert result["replayed_events"] == 1
+    assert recovered.enrolled(sample_data["courses"][1].id) == 2
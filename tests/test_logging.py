@@ -0,0 +1,86 @@
+"""
+로깅 파이프라인 테스트
+"""
+import io
+import json
+import logging
+import queue
+
+from app.utils import log_pipeline
+from app.utils.log_pipeline import JsonFormatter, RepeatSampler, NonBlockingQueueHandler, LOG_DROPPED
+
+
+def _record(msg, *args, **extra):
+    record = logging.LogRecord("app.test", logging.WARNING, __file__, 1, msg, args, None)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+def test_json_formatter_includes_extra_fields():
+    """JSON lines + extra 필드, sample_key는 출력하지 않음"""
+    line = JsonFormatter().format(
+        _record("⚠️ 정원 초과: %s (%s/%s)", "알고리즘", 30, 30, course_id=7, sample_key=("capacity_exceeded", 7))
+    )
+    payload = json.loads(line)
+
+    assert payload["message"] == "⚠️ 정원 초과: 알고리즘 (30/30)"
+    assert payload["level"] == "WARNING"
+    assert payload["course_id"] == 7
+    assert "sample_key" not in payload
+
+
+def test_repeat_sampler_suppresses_and_reports():
+    """윈도우당 burst건만 통과, 다음 윈도우 첫 레코드에 생략 건수 표시"""
+    sampler = RepeatSampler(burst=2, window=60)
+    key = ("capacity_exceeded", 1)
+
+    passed = [sampler.filter(_record("full", sample_key=key)) for _ in range(5)]
+    assert passed == [True, True, False, False, False]
+    assert sampler.filter(_record("other", sample_key=("capacity_exceeded", 2)))
+    assert sampler.filter(_record("no key"))
+
+    sampler.window = 0
+    record = _record("full", sample_key=key)
+    assert sampler.filter(record)
+    assert record.suppressed == 3
+
+
+def test_queue_handler_defers_formatting_and_never_blocks():
+    """요청 스레드에서는 포맷팅하지 않고, 큐가 가득 차면 버림"""
+    class Lazy:
+        formatted = False
+
+        def __str__(self):
+            Lazy.formatted = True
+            return "lazy"
+
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    before = LOG_DROPPED.value()
+
+    handler.handle(_record("value=%s", Lazy()))
+    handler.handle(_record("value=%s", Lazy()))
+
+    assert Lazy.formatted is False
+    assert handler.queue.get_nowait().getMessage() == "value=lazy"
+    assert LOG_DROPPED.value() == before + 1
+
+
+def test_configure_logging_replaces_existing_root_handlers():
+    """기존 루트 핸들러(basicConfig 등)는 떼어 두어 중복/동기 출력 없음, 종료 시 복원"""
+    root = logging.getLogger()
+    log_pipeline.shutdown_logging()
+    stray = logging.StreamHandler(io.StringIO())
+    root.addHandler(stray)
+    try:
+        log_pipeline.configure_logging()
+        assert stray not in root.handlers
+        assert log_pipeline._queue_handler in root.handlers
+
+        logging.getLogger("app.test").warning("once")
+        assert stray.stream.getvalue() == ""
+    finally:
+        log_pipeline.shutdown_logging()
+        assert stray in root.handlers
+        root.removeHandler(stray)
+        log_pipeline.configure_logging()
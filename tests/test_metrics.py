@@ -0,0 +1,41 @@
+"""
+tests/test_metrics.py - /metrics 엔드포인트 테스트
+"""
+from app.utils.metrics import Histogram, ENROLLMENTS, BUSINESS_EXCEPTIONS
+
+
+def test_histogram_render():
+    """누적 버킷/합계/개수 렌더링"""
+    hist = Histogram("demo_seconds", "demo", ("route",), buckets=(0.1, 1.0))
+    hist.observe(0.05, "/a")
+    hist.observe(0.5, "/a")
+    hist.observe(5.0, "/a")
+
+    lines = hist.collect()
+
+    assert 'demo_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{route="/a",le="1"} 2' in lines
+    assert 'demo_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'demo_seconds_count{route="/a"} 3' in lines
+
+
+def test_metrics_endpoint(client, sample_data):
+    """라우트 템플릿별 지연 시간 + 비즈니스 예외/신청 카운터"""
+    student = sample_data["students"][0]
+    course = sample_data["courses"][0]
+    enrolled_before = ENROLLMENTS.value()
+    duplicates_before = BUSINESS_EXCEPTIONS.value("AlreadyEnrolledException")
+
+    client.post(f"/api/v1/students/{student.id}/enrollments", json={"course_id": course.id})
+    client.post(f"/api/v1/students/{student.id}/enrollments", json={"course_id": course.id})
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'route="/api/v1/students/{student_id}/enrollments",status="201"' in body
+    assert 'route="/api/v1/students/{student_id}/enrollments",status="409"' in body
+    assert "http_requests_in_flight" in body
+    assert ENROLLMENTS.value() == enrolled_before + 1
+    assert BUSINESS_EXCEPTIONS.value("AlreadyEnrolledException") == duplicates_before + 1
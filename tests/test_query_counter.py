@@ -0,0 +1,55 @@
+"""
+tests/test_query_counter.py - 요청별 SQL 집계 / N+1 감지 테스트
+"""
+import logging
+
+from app.config import settings
+from app.utils.query_counter import QueryStats, assert_max_queries, statement_shape
+
+
+def test_statement_shape_collapses_in_lists():
+    """IN 목록 길이와 무관한 SQL 형태"""
+    assert statement_shape("SELECT * FROM t WHERE id IN (?, ?,  ?)") == "SELECT * FROM t WHERE id IN (?)"
+
+
+def test_repeated_statement_warning(caplog):
+    """같은 SQL이 기준 횟수를 넘으면 한 번만 경고"""
+    stats = QueryStats("GET /demo", repeat_threshold=2)
+    with caplog.at_level(logging.WARNING, logger="app.utils.query_counter"):
+        for _ in range(5):
+            stats.record("SELECT * FROM schedules WHERE course_id = ?", 0.0)
+
+    assert stats.count == 5
+    assert len([r for r in caplog.records if "N+1" in r.getMessage()]) == 1
+
+
+def test_schedule_query_budget(client, sample_data, test_db):
+    """시간표 조회는 신청 강좌 수와 무관하게 고정 쿼리 수"""
+    student_id = sample_data["students"][0].id
+    course_ids = [course.id for course in sample_data["courses"]]
+    for course_id in course_ids:
+        client.post(f"/api/v1/students/{student_id}/enrollments", json={"course_id": course_id})
+
+    with assert_max_queries(test_db.get_bind(), 2):
+        response = client.get(f"/api/v1/students/{student_id}/schedule")
+
+    assert len(response.json()["courses"]) == 2
+
+
+def test_course_list_query_budget(client, sample_data, test_read_session_factory):
+    """강좌 목록은 시간표를 일괄 로딩"""
+    with assert_max_queries(test_read_session_factory.kw["bind"], 2) as stats:
+        response = client.get("/api/v1/courses")
+
+    assert stats.count >= 1
+    assert all(course["schedule"] for course in response.json())
+
+
+def test_debug_headers(client, sample_data, monkeypatch):
+    """디버그 모드에서 SQL 수/DB 시간 응답 헤더"""
+    monkeypatch.setattr(settings, "debug", True)
+
+    response = client.get("/api/v1/courses")
+
+    assert int(response.headers["x-db-query-count"]) >= 1
+    assert float(response.headers["x-db-time-ms"]) >= 0
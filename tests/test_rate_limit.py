@@ -0,0 +1,85 @@
+"""
+수강신청 입장 제어 (토큰 버킷, 마감 강좌 단락, 부하 차단) 테스트
+"""
+import pytest
+
+from app.utils.exceptions import ServerOverloadedException
+from app.utils.rate_limit import ADMISSION_REJECTED, TokenBucketLimiter, enrollment_admission
+
+
+def _enroll(client, student, course):
+    return client.post(f"/api/v1/students/{student.id}/enrollments", json={"course_id": course.id})
+
+
+def test_token_bucket_refills_and_bounds_keys():
+    limiter = TokenBucketLimiter(rate_per_s=2.0, burst=2, max_keys=2)
+
+    assert limiter.acquire("a", now=0.0) == 0.0
+    assert limiter.acquire("a", now=0.0) == 0.0
+    assert limiter.acquire("a", now=0.0) == pytest.approx(0.5)  # 토큰 1개 충전까지
+    assert limiter.acquire("a", now=0.5) == 0.0
+
+    limiter.acquire("b", now=1.0)
+    limiter.acquire("c", now=1.0)  # 가장 오래 쓰지 않은 "a" 제거
+    assert len(limiter) == 2 and limiter.evictions == 1
+
+
+def test_student_limit_returns_429_with_retry_after(client, sample_data, monkeypatch):
+    monkeypatch.setattr(enrollment_admission, "students", TokenBucketLimiter(0.5, 2, 100))
+    course1, course2 = sample_data["courses"]
+    student = sample_data["students"][0]
+
+    assert _enroll(client, student, course1).status_code == 201
+    assert _enroll(client, student, course1).status_code == 409  # 이미 신청 (토큰은 사용)
+    response = _enroll(client, student, course2)
+
+    assert response.status_code == 429
+    assert response.json()["code"] == "RATE_LIMITED" and response.json()["limit"] == "student"
+    assert response.headers["Retry-After"] == "2"
+    assert _enroll(client, sample_data["students"][1], course2).status_code == 201  # 다른 학생은 영향 없음
+    assert enrollment_admission.ips is None  # 같은 주소(NAT/프록시)를 나눠 쓰는 IP별 제한은 기본 끔
+
+
+def test_full_course_short_circuits_until_seat_frees(client, sample_data):
+    course1, _ = sample_data["courses"]  # 정원 2
+    student1, student2, student3 = sample_data["students"]
+    enrollment_id = _enroll(client, student1, course1).json()["id"]
+    _enroll(client, student2, course1)
+    assert _enroll(client, student3, course1).json()["code"] == "CAPACITY_EXCEEDED"  # DB에서 거절
+
+    before = ADMISSION_REJECTED.value("full_course")
+    cached = _enroll(client, student3, course1)
+    assert cached.status_code == 400 and cached.json()["code"] == "CAPACITY_EXCEEDED"
+    assert ADMISSION_REJECTED.value("full_course") == before + 1
+
+    client.delete(f"/api/v1/students/{student1.id}/enrollments/{enrollment_id}")
+    assert _enroll(client, student3, course1).status_code == 201
+    assert enrollment_admission.in_flight == 0  # 끝난 요청은 모두 반환
+
+
+def test_sheds_load_when_too_many_requests_in_flight(client, sample_data, monkeypatch):
+    monkeypatch.setattr(enrollment_admission, "max_in_flight", 1)
+    monkeypatch.setattr(enrollment_admission, "in_flight", 1)
+    course1, _ = sample_data["courses"]
+
+    response = _enroll(client, sample_data["students"][0], course1)
+
+    assert response.status_code == 429
+    assert response.json()["code"] == "SERVER_OVERLOADED" and response.headers["Retry-After"] == "1"
+    assert enrollment_admission.in_flight == 1  # 거절된 요청은 세지 않음
+
+
+def test_slot_is_reserved_atomically_and_released_once(client, sample_data, monkeypatch):
+    monkeypatch.setattr(enrollment_admission, "max_in_flight", 1)
+    slot = enrollment_admission.admit(1, None)
+    with pytest.raises(ServerOverloadedException):
+        enrollment_admission.admit(2, None)  # 확인과 예약이 같은 락 안
+
+    slot.release()
+    slot.release()  # 두 번째는 무시
+    assert enrollment_admission.in_flight == 0
+
+    student = sample_data["students"][0]
+    invalid = client.post(f"/api/v1/students/{student.id}/enrollments", json={"course_id": "x"})
+    assert invalid.status_code == 422
+    assert enrollment_admission.in_flight == 0  # 라우트가 실행되지 않아도 반환
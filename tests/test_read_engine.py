@@ -0,0 +1,73 @@
+"""
+읽기 전용 엔진 / 조회 라우트 분리 테스트
+"""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app import database
+from app.config import settings
+from app.utils.query_counter import count_queries
+
+
+def test_read_session_rejects_writes(test_read_session_factory, sample_data):
+    """읽기 전용 세션은 쓰기 불가"""
+    db = test_read_session_factory()
+    try:
+        assert db.execute(text("SELECT COUNT(*) FROM courses")).scalar() == 2
+        with pytest.raises(OperationalError, match="readonly"):
+            db.execute(text("UPDATE courses SET enrolled = enrolled + 1"))
+    finally:
+        db.close()
+
+
+def test_get_routes_use_read_engine(client, sample_data, test_db, test_read_session_factory):
+    """조회 라우트는 읽기 전용 엔진에서만 SQL 실행"""
+    course_id = sample_data["courses"][0].id
+    student_id = sample_data["students"][0].id
+
+    with count_queries(test_db.get_bind()) as primary, count_queries(test_read_session_factory.kw["bind"]) as replica:
+        for url in (
+            "/api/v1/courses",
+            f"/api/v1/courses/{course_id}",
+            "/api/v1/students",
+            f"/api/v1/students/{student_id}/enrollments",
+        ):
+            assert client.get(url).status_code == 200
+
+    assert primary.count == 0
+    assert replica.count >= 4
+
+
+@pytest.mark.parametrize("read_your_writes", [True, False])
+def test_schedule_read_your_writes_flag(monkeypatch, read_your_writes):
+    """시간표 조회 세션 선택 (세션은 한쪽 팩토리에서만 1개)"""
+    monkeypatch.setattr(settings, "schedule_read_your_writes", read_your_writes)
+    opened = []
+
+    class FakeSession:
+        def __init__(self, kind):
+            self.kind = kind
+            opened.append(kind)
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(database, "SessionLocal", lambda: FakeSession("primary"))
+    monkeypatch.setattr(database, "ReadSessionLocal", lambda: FakeSession("replica"))
+    dependency = database.get_schedule_db()
+
+    assert next(dependency).kind == ("primary" if read_your_writes else "replica")
+    assert opened == ["primary" if read_your_writes else "replica"]
+    dependency.close()
+
+
+def test_schedule_sees_committed_enrollment(client, sample_data, monkeypatch):
+    """읽기 전용 엔진으로 조회해도 커밋된 신청은 보임 (같은 WAL 파일)"""
+    monkeypatch.setattr(settings, "schedule_read_your_writes", False)
+    student_id = sample_data["students"][0].id
+
+    client.post(f"/api/v1/students/{student_id}/enrollments", json={"course_id": sample_data["courses"][0].id})
+    response = client.get(f"/api/v1/students/{student_id}/schedule")
+
+    assert [course["code"] for course in response.json()["courses"]] == ["CS101"]
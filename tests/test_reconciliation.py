@@ -0,0 +1,59 @@
+"""
+Course.enrolled 정합성 점검 테스트
+"""
+from sqlalchemy import text, update
+
+from app.models import Course
+from app.services.enrollment_service import EnrollmentService
+from app.services.reconciliation_service import ReconciliationService
+
+
+def _set_enrolled(db, course_id, enrolled):
+    db.execute(update(Course).where(Course.id == course_id).values(enrolled=enrolled))
+    db.commit()
+
+
+def test_count_uses_course_status_index(test_db, sample_data):
+    plan = test_db.execute(text(
+        "EXPLAIN QUERY PLAN SELECT count(*) FROM enrollments WHERE course_id = 1 AND status = 'ENROLLED'"
+    )).all()
+
+    assert "COVERING INDEX ix_enrollments_course_status" in " ".join(row[-1] for row in plan)
+
+
+def test_pass_reports_drift_and_repairs(test_db, test_session_factory, sample_data):
+    course1, course2 = sample_data["courses"]
+    EnrollmentService.enroll_course(test_db, sample_data["students"][0].id, course1.id)
+    test_db.commit()
+    _set_enrolled(test_db, course1.id, 2)  # 실제 1명
+    read_db = test_session_factory()
+
+    report = ReconciliationService.run_pass(read_db, test_db, batch_size=1)
+
+    assert report["completed"] and report["batches"] == 2 and report["scanned"] == 2
+    assert report["samples"] == [{"course_id": course1.id, "enrolled": 2, "actual": 1}]
+    assert report["repaired"] == 0
+    test_db.expire_all()
+    assert test_db.get(Course, course1.id).enrolled == 2  # 보고만 함
+
+    repaired = ReconciliationService.run_pass(read_db, test_db, batch_size=10, repair=True)
+
+    assert repaired["drifted"] == 1 and repaired["repaired"] == 1
+    test_db.expire_all()
+    assert test_db.get(Course, course1.id).enrolled == 1
+    assert ReconciliationService.run_pass(read_db, test_db, batch_size=10)["drifted"] == 0
+    read_db.close()
+
+
+def test_reconciliation_admin_endpoints(client, test_db, sample_data):
+    course = sample_data["courses"][1]
+    _set_enrolled(test_db, course.id, 3)
+
+    run = client.post("/api/v1/admin/reconciliation/runs", params={"repair": True}).json()
+    status = client.get("/api/v1/admin/reconciliation").json()
+
+    assert run["started"] is True
+    assert run["result"]["repaired"] == 1
+    assert status["last_pass"]["samples"] == [{"course_id": course.id, "enrolled": 3, "actual": 0}]
+    test_db.expire_all()
+    assert test_db.get(Course, course.id).enrolled == 0
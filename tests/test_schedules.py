@@ -0,0 +1,99 @@
+"""
+여러 번 수업하는 강좌 시간표 / 요일별 구간 인덱스 테스트
+"""
+import random
+from datetime import time
+
+from sqlalchemy import create_engine, text
+
+from app.database import upgrade_schedules_table
+from app.models import DayOfWeek
+from app.services.bulk_import_service import BulkImportService
+from app.utils.interval_index import IntervalIndex
+
+
+def test_interval_index_matches_pairwise_overlap():
+    rng = random.Random(3)
+    intervals = []
+    index = IntervalIndex()
+    for key in range(200):
+        day = rng.choice(list(DayOfWeek))
+        start = rng.randrange(8 * 60, 20 * 60, 5)
+        end = start + rng.choice([50, 75, 90, 180])
+        intervals.append((key, day, start, end))
+        index.add(key, day, time(start // 60, start % 60), time(end // 60, end % 60))
+
+    for _ in range(200):
+        day = rng.choice(list(DayOfWeek))
+        start = rng.randrange(8 * 60, 20 * 60, 5)
+        end = start + 75
+        expected = {k for k, d, s, e in intervals if d == day and s < end and start < e}
+        found = index.overlapping(day, time(start // 60, start % 60), time(end // 60, end % 60))
+        assert set(found) == expected and len(found) == len(expected)
+
+    assert not IntervalIndex().overlapping(DayOfWeek.MON, time(9), time(10))
+
+
+def test_multi_meeting_course_conflicts_on_any_meeting(client, sample_data, test_db, add_course):
+    course1, course2 = sample_data["courses"]  # MON 09:00-10:30, TUE 09:00-10:30
+    student = sample_data["students"][0]
+    twice = add_course(
+        "CS301",
+        (DayOfWeek.WED, time(9, 0), time(10, 15)),
+        (DayOfWeek.MON, time(10, 0), time(11, 15)),
+    )
+    test_db.commit()
+
+    response = client.get("/api/v1/courses")
+    assert {c["id"]: c["schedule"] for c in response.json()}[twice.id] == "MON 10:00-11:15, WED 09:00-10:15"
+    response = client.get(f"/api/v1/courses/{twice.id}")
+    assert [s["day_of_week"] for s in response.json()["schedules"]] == ["WED", "MON"]
+
+    assert client.post(f"/api/v1/students/{student.id}/enrollments", json={"course_id": course1.id}).status_code == 201
+    response = client.post(f"/api/v1/students/{student.id}/enrollments", json={"course_id": twice.id})
+
+    assert response.status_code == 409
+    assert response.json()["conflicting_courses"] == [
+        {"id": course1.id, "name": course1.name, "schedule": "MON 09:00:00-10:30:00"}
+    ]
+
+    schedule = client.get(f"/api/v1/students/{student.id}/schedule").json()
+    assert [c["schedule"] for c in schedule["courses"]] == ["MON 09:00-10:30"]
+
+
+def test_bulk_import_checks_every_meeting(test_db, sample_data, add_course):
+    _, course2 = sample_data["courses"]
+    student = sample_data["students"][0]
+    twice = add_course(
+        "CS302",
+        (DayOfWeek.THU, time(9, 0), time(10, 15)),
+        (DayOfWeek.TUE, time(10, 15), time(11, 30)),  # course2(TUE 09:00-10:30)와 겹침
+    )
+    test_db.commit()
+
+    imported, errors = BulkImportService.apply_batch(test_db, [(1, student.id, course2.id), (2, student.id, twice.id)])
+
+    assert imported == 1
+    assert [(e["row"], e["code"]) for e in errors] == [(2, "TIME_CONFLICT")]
+
+
+def test_upgrade_drops_single_meeting_unique_constraint(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE schedules (id INTEGER PRIMARY KEY, course_id INTEGER NOT NULL UNIQUE, "
+            "day_of_week VARCHAR(3) NOT NULL, start_time TIME NOT NULL, end_time TIME NOT NULL, created_at DATETIME)"
+        ))
+        conn.execute(text("CREATE INDEX ix_schedules_id ON schedules (id)"))
+        conn.execute(text("INSERT INTO schedules VALUES (1, 7, 'MON', '09:00:00.000000', '10:30:00.000000', NULL)"))
+
+    upgrade_schedules_table(engine)
+    upgrade_schedules_table(engine)  # 이미 갱신된 테이블은 그대로
+
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO schedules (course_id, day_of_week, start_time, end_time) VALUES (7, 'WED', '09:00:00', '10:30:00')"))
+        rows = conn.execute(text("SELECT course_id, day_of_week FROM schedules ORDER BY id")).all()
+        indexes = {row.name for row in conn.exec_driver_sql("PRAGMA index_list(schedules)")}
+    assert rows == [(7, "MON"), (7, "WED")]
+    assert "ix_schedules_course_id" in indexes
+    engine.dispose()
@@ -0,0 +1,132 @@
+"""
+학과별 샤딩 모드 테스트
+"""
+import threading
+from datetime import time
+
+import pytest
+
+from app.database import ShardRouter, ENROLLMENT_ID_STRIDE
+from app.models import Course, Department, Professor, Schedule, DayOfWeek, StudentCreditLoad
+from app.services import sharded_enrollment_service
+from app.services.data_service import DataService
+from app.services.sharded_enrollment_service import ShardedEnrollmentService
+from app.utils.exceptions import CapacityExceededException, TimeConflictException
+
+
+@pytest.fixture
+def router(tmp_path, test_db, sample_data):
+    """학과 2개(강좌 2개 + 1개)를 샤드로 분산한 라우터"""
+    dept = Department(name="전자공학과")
+    test_db.add(dept)
+    test_db.commit()
+    prof = Professor(name="이교수", email="prof2@example.com", department_id=dept.id)
+    test_db.add(prof)
+    test_db.commit()
+    course = Course(
+        name="회로이론", code="EE101", credits=3, capacity=30,
+        professor_id=prof.id, department_id=dept.id,
+    )
+    test_db.add(course)
+    test_db.commit()
+    # 자료구조(MON 09:00-10:30)와 시간이 겹침
+    test_db.add(Schedule(course_id=course.id, day_of_week=DayOfWeek.MON, start_time=time(10, 0), end_time=time(11, 30)))
+    test_db.commit()
+    sample_data["courses"].append(course)
+    # 분산 후 코디네이터의 강좌 행은 삭제되므로 ID만 보관
+    sample_data["course_ids"] = [c.id for c in sample_data["courses"]]
+    sample_data["department_ids"] = [sample_data["department"].id, dept.id]
+
+    shard_router = ShardRouter(str(tmp_path / "shards"), enabled=True)
+    DataService.distribute_to_shards(test_db, shard_router)
+    yield shard_router
+    shard_router.close()
+
+
+def _credits(db, student_id):
+    db.expire_all()
+    return db.query(StudentCreditLoad.credits).filter(StudentCreditLoad.student_id == student_id).scalar()
+
+
+def test_distribute_moves_courses_to_shards(test_db, router, sample_data):
+    course_ids = sample_data["course_ids"]
+
+    assert test_db.query(Course).count() == 0
+    assert len(router.department_ids()) == 2
+    assert [c.id for c in ShardedEnrollmentService.list_courses(router=router)] == sorted(course_ids)
+    assert ShardedEnrollmentService.get_course(course_ids[2], router=router).schedules[0].day_of_week == DayOfWeek.MON
+
+
+def test_enroll_and_cancel_across_databases(test_db, router, sample_data):
+    student = sample_data["students"][0]
+    course_id = sample_data["course_ids"][2]
+
+    enrollment = ShardedEnrollmentService.enroll_course(test_db, student.id, course_id, router=router)
+
+    assert enrollment.id % ENROLLMENT_ID_STRIDE == sample_data["department_ids"][1]
+    assert enrollment.course.enrolled == 1
+    assert _credits(test_db, student.id) == 3
+
+    cancelled = ShardedEnrollmentService.cancel_enrollment(test_db, student.id, enrollment.id, router=router)
+
+    assert cancelled.status == "CANCELLED"
+    assert ShardedEnrollmentService.get_course(course_id, router=router).enrolled == 0
+    assert _credits(test_db, student.id) == 0
+
+
+def test_time_conflict_checked_across_shards(test_db, router, sample_data):
+    student = sample_data["students"][0]
+    ShardedEnrollmentService.enroll_course(test_db, student.id, sample_data["course_ids"][0], router=router)
+
+    with pytest.raises(TimeConflictException):
+        ShardedEnrollmentService.enroll_course(test_db, student.id, sample_data["course_ids"][2], router=router)
+    assert _credits(test_db, student.id) == 3
+
+
+def test_concurrent_capacity_releases_reserved_credits(test_db, test_session_factory, router, sample_data):
+    """정원 2명 강좌에 3명 동시 신청 → 2명 성공, 실패한 학생의 학점 예약은 반환"""
+    course_id = sample_data["course_ids"][0]
+    results = {}
+
+    def enroll(student_id):
+        db = test_session_factory()
+        try:
+            ShardedEnrollmentService.enroll_course(db, student_id, course_id, router=router)
+            results[student_id] = "ok"
+        except CapacityExceededException:
+            results[student_id] = "full"
+        finally:
+            db.close()
+
+    threads = [threading.Thread(target=enroll, args=(s.id,)) for s in sample_data["students"]]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results.values()) == ["full", "ok", "ok"]
+    assert ShardedEnrollmentService.get_course(course_id, router=router).enrolled == 2
+    for student_id, outcome in results.items():
+        assert _credits(test_db, student_id) == (3 if outcome == "ok" else 0)
+
+
+def test_routes_in_sharded_mode(client, router, sample_data, monkeypatch):
+    from app.routes import courses, enrollments
+
+    for module in (courses, enrollments, sharded_enrollment_service):
+        monkeypatch.setattr(module, "shard_router", router)
+    student = sample_data["students"][1]
+    course_id = sample_data["course_ids"][1]
+
+    response = client.post(f"/api/v1/students/{student.id}/enrollments", json={"course_id": course_id})
+    assert response.status_code == 201
+    assert response.json()["course"]["enrolled"] == 1
+
+    schedule = client.get(f"/api/v1/students/{student.id}/schedule").json()
+    assert [c["id"] for c in schedule["courses"]] == [course_id]
+    assert client.get(f"/api/v1/courses/{course_id}").json()["enrolled"] == 1
+
+    unsupported = client.post("/api/v1/courses/conflicts", json={"course_ids": [course_id]})
+    assert unsupported.status_code == 501
+    assert unsupported.json()["code"] == "NOT_SUPPORTED_IN_SHARDED_MODE"
+    assert unsupported.json()["feature"] == "conflict_check"
@@ -0,0 +1,110 @@
+"""
+조회 요청 합치기 (single-flight + 마이크로 TTL) 테스트
+"""
+import threading
+import time
+
+import pytest
+from sqlalchemy import event
+
+from app.config import settings
+from app.utils.exceptions import CourseNotFoundException
+from app.utils.single_flight import CACHED, LEADER, SHARED, SingleFlight
+
+
+def test_concurrent_calls_share_one_computation():
+    flights = SingleFlight(max_keys=10)
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"id": 1}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flights.do("course:1", compute)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(flights.do("course:1", compute))) for _ in range(4)]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.05)  # 합류 대기
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert sorted(kind for _, kind in results) == [LEADER] + [SHARED] * 4
+    assert all(result is results[0][0] for result, _ in results)
+    assert flights.in_flight == 0
+
+
+def test_errors_are_shared_but_not_kept():
+    flights = SingleFlight(max_keys=10)
+
+    def fail():
+        raise LookupError("missing")
+
+    with pytest.raises(LookupError):
+        flights.do("course:9", fail, ttl_s=60)
+    assert flights.do("course:9", lambda: "found", ttl_s=60) == ("found", LEADER)
+    assert flights.do("course:9", lambda: "again", ttl_s=60) == ("found", CACHED)
+
+
+def test_waiters_get_their_own_copy_of_the_error():
+    flights = SingleFlight(max_keys=10)
+    started, release = threading.Event(), threading.Event()
+    original = CourseNotFoundException(9)
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise original
+
+    errors = []
+
+    def call():
+        try:
+            flights.do("course:9", fail)
+        except CourseNotFoundException as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=call) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.05)  # 합류 대기
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert len(errors) == 4 and len({id(e) for e in errors}) == 4
+    assert all(e.detail == original.detail and e.status_code == 404 for e in errors)
+    assert sum(e is original for e in errors) == 1  # 대기자는 새 객체
+
+
+def test_micro_ttl_collapses_course_reads(client, sample_data, test_read_session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "read_coalesce_ttl_ms", 1000.0)
+    course1, _ = sample_data["courses"]
+    first = client.get(f"/api/v1/courses/{course1.id}")
+    assert first.status_code == 200
+    assert first.json()["schedules"][0]["day_of_week"] == "MON"
+
+    statements = []
+    read_engine = test_read_session_factory.kw["bind"]
+    listener = lambda *args: statements.append(args[2])
+    event.listen(read_engine, "before_cursor_execute", listener)
+    try:
+        again = client.get(f"/api/v1/courses/{course1.id}")
+        listed = [client.get("/api/v1/courses", params={"department_id": course1.department_id}) for _ in range(2)]
+    finally:
+        event.remove(read_engine, "before_cursor_execute", listener)
+
+    assert again.json() == first.json()
+    assert listed[0].json() == listed[1].json() and len(listed[0].json()) == 2
+    assert len(statements) == 2  # 목록 조회 1번 (강좌 + 시간표 selectinload), 상세는 재사용
+    assert client.get("/api/v1/courses/999").json()["code"] == "COURSE_NOT_FOUND"
@@ -0,0 +1,45 @@
+"""
+SQLite 성능 프로파일 테스트
+"""
+import pytest
+from sqlalchemy import text
+
+from app.database import Base
+from app.utils.sqlite_profile import resolve_profile, pragma_statements, prewarm
+
+
+def test_resolve_profile_overrides():
+    """프리셋 + 개별 설정 우선 적용"""
+    profile = resolve_profile("throughput", {"synchronous": "normal", "mmap_size": None})
+
+    assert profile["name"] == "throughput"
+    assert profile["synchronous"] == "NORMAL"
+    assert profile["mmap_size"] == 256 * 1024 * 1024
+    assert "PRAGMA synchronous=NORMAL" in pragma_statements(profile)
+
+
+@pytest.mark.parametrize("name, overrides", [
+    ("fastest", {}),
+    ("balanced", {"synchronous": "SOMETIMES"}),
+    ("balanced", {"temp_store": "DISK"}),
+])
+def test_resolve_profile_rejects_invalid(name, overrides):
+    with pytest.raises(ValueError):
+        resolve_profile(name, overrides)
+
+
+def test_pragmas_applied_on_connect(test_db):
+    """엔진 커넥션마다 프로파일 PRAGMA 적용 (기본: durable)"""
+    values = {
+        pragma: test_db.execute(text(f"PRAGMA {pragma}")).scalar()
+        for pragma in ("synchronous", "cache_size", "temp_store")
+    }
+
+    assert values == {"synchronous": 2, "cache_size": -2000, "temp_store": 0}
+
+
+def test_prewarm_scans_all_tables(test_db, sample_data):
+    result = prewarm(test_db.get_bind())
+
+    assert result["tables"] == len(Base.metadata.tables)
+    assert result["rows"] == 9  # 학과 1 + 교수 1 + 강좌 2 + 시간표 2 + 학생 3
@@ -0,0 +1,79 @@
+"""
+시간표 조합 탐색 테스트
+"""
+from datetime import time
+
+from app.models import DayOfWeek
+from app.schemas import TimetableGroup
+from app.services.timetable_service import TimetableService
+
+
+def test_name_group_picks_sections_without_conflicts(test_db, sample_data, add_course):
+    course1, course2 = sample_data["courses"]  # 자료구조 MON 09:00, 알고리즘 TUE 09:00
+    conflicting = add_course("CS102-2", (DayOfWeek.MON, time(9, 30), time(10, 30)), name="알고리즘 2")
+    section3 = add_course("CS102-3", (DayOfWeek.WED, time(9, 0), time(10, 0)), name="알고리즘 3")
+    add_course("CS502", (DayOfWeek.THU, time(9, 0), time(10, 0)), name="알고리즘특론")  # 이름 그룹에 안 들어감
+    test_db.commit()
+
+    result = TimetableService.build(
+        test_db, [TimetableGroup(course_ids=[course1.id]), TimetableGroup(name="알고리즘")], max_results=10,
+    )
+
+    combos = sorted(sorted(c["course_ids"]) for c in result["combinations"])
+    assert combos == [sorted([course1.id, course2.id]), sorted([course1.id, section3.id])]
+    assert all(conflicting.id not in c for c in combos)
+    assert result["complete"] and not result["timed_out"] and result["empty_groups"] == []
+
+
+def test_full_courses_and_existing_enrollments_are_excluded(client, sample_data):
+    course1, course2 = sample_data["courses"]
+    student = sample_data["students"][0]
+    for s in sample_data["students"][1:]:
+        assert client.post(f"/api/v1/students/{s.id}/enrollments", json={"course_id": course1.id}).status_code == 201
+    assert client.post(f"/api/v1/students/{student.id}/enrollments", json={"course_id": course2.id}).status_code == 201
+
+    response = client.post("/api/v1/courses/timetables", json={
+        "student_id": student.id,
+        "groups": [{"course_ids": [course1.id]}, {"name": "알고리즘", "optional": True}],
+    })
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["empty_groups"] == [0]  # 정원 마감
+    assert body["combinations"] == []
+
+    response = client.post("/api/v1/courses/timetables", json={"groups": [{"optional": True}]})
+    assert response.status_code == 422
+
+
+def test_endpoint_returns_course_items_with_total_credits(client, sample_data):
+    course1, course2 = sample_data["courses"]
+
+    response = client.post("/api/v1/courses/timetables", json={
+        "groups": [{"course_ids": [course1.id]}, {"course_ids": [course2.id]}],
+    })
+
+    assert response.status_code == 200
+    (combo,) = response.json()["combinations"]
+    assert combo["total_credits"] == 6
+    assert {c["id"] for c in combo["courses"]} == {course1.id, course2.id}
+    assert all(c["schedule"] for c in combo["courses"])
+
+
+def test_time_budget_stops_search_with_partial_results(test_db, sample_data, add_course):
+    groups = []
+    for g in range(10):
+        sections = [
+            add_course(
+                f"SEM{g}-{n}", (DayOfWeek.FRI, time(g + 8, n * 15), time(g + 9, n * 15)), name=f"세미나{g} {n}", credits=1,
+            )
+            for n in range(3)
+        ]
+        groups.append(TimetableGroup(course_ids=[c.id for c in sections], optional=True))
+    test_db.commit()
+
+    result = TimetableService.build(test_db, groups, max_results=10_000, time_budget_ms=0)
+
+    assert result["timed_out"] and not result["complete"]
+    assert result["explored"] >= 256
+    assert 0 < len(result["combinations"]) < 4 ** 10